@@ -0,0 +1,6 @@
+"""Benchmarks for Smart Clock Dashboard.
+
+Run individual benchmarks from the repository root, e.g.:
+
+    python -m benchmarks.hand_cache_bench
+"""
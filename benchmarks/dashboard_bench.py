@@ -0,0 +1,197 @@
+"""Headless benchmark of the full dashboard render path.
+
+Drives ClockMainWindow, ClockWidget and ClockController on the offscreen
+Qt platform with a fake clock, so a day of one-second ticks runs in
+seconds with no display, GPU or network. Each renderer configuration runs
+in its own subprocess so peak RSS is measured in isolation.
+
+Usage:
+    python -m benchmarks.dashboard_bench [--hours H] [--output results.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QT_VERSION_STR
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import Config
+
+# Renderer configurations compared by the suite
+SCENARIOS = {
+    "labels": {"clock_renderer": "labels"},
+    "labels_cached": {"clock_renderer": "labels", "hand_cache_mode": "eager"},
+    "painter": {"clock_renderer": "painter"},
+}
+
+# Simulated start time; midnight exercises the day rollover
+START_TIME = datetime.datetime(2026, 1, 1)
+
+# Ticks sampled under tracemalloc, which is too slow for the full run
+ALLOC_SAMPLE_TICKS = 600
+
+
+class FakeClock:
+    """Clock returning simulated time that advances only when told to."""
+
+    def __init__(self, start: datetime.datetime):
+        """
+        Initialize the fake clock.
+
+        Args:
+            start: Initial simulated time
+        """
+        self.now = start
+
+    def __call__(self) -> datetime.datetime:
+        """Get the current simulated time."""
+        return self.now
+
+    def advance(self, seconds: float = 1.0) -> None:
+        """
+        Advance simulated time.
+
+        Args:
+            seconds: Number of seconds to advance
+        """
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+def run_scenario(name: str, ticks: int) -> dict:
+    """
+    Run one renderer configuration for the given number of ticks.
+
+    Args:
+        name: Scenario name from SCENARIOS
+        ticks: Number of simulated one-second ticks
+
+    Returns:
+        Measurements for the scenario
+    """
+    # Imported here so module import stays cheap for the parent process
+    from smrtclk.views.main_window import ClockMainWindow
+
+    app = QApplication.instance() or QApplication([])
+    clock = FakeClock(START_TIME)
+
+    start = time.perf_counter()
+    window = ClockMainWindow(Config(**SCENARIOS[name]), clock=clock)
+    window.show()
+    app.processEvents()
+    startup_ms = (time.perf_counter() - start) * 1e3
+
+    # Drive ticks directly instead of waiting on the wall-clock timer
+    controller = window.clock_controller
+    controller.stop()
+
+    def tick() -> None:
+        clock.advance()
+        controller._onTimerTick()
+        app.processEvents()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(ticks):
+        tick()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(ALLOC_SAMPLE_TICKS):
+        tick()
+    after = tracemalloc.take_snapshot()
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    net_blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+
+    window.close()
+
+    return {
+        "ticks": ticks,
+        "startup_ms": startup_ms,
+        "wall_s": wall,
+        "ticks_per_sec": ticks / wall,
+        "cpu_us_per_tick": cpu / ticks * 1e6,
+        # ru_maxrss is reported in KiB on Linux
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "alloc_peak_kib": alloc_peak / 1024,
+        "alloc_net_blocks_per_tick": net_blocks / ALLOC_SAMPLE_TICKS,
+        "simulated_end": clock.now.isoformat(),
+    }
+
+
+def run_suite(ticks: int) -> dict:
+    """
+    Run every scenario in a separate subprocess.
+
+    Args:
+        ticks: Number of simulated one-second ticks per scenario
+
+    Returns:
+        Results document for all scenarios
+    """
+    results = {}
+    for name in SCENARIOS:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.dashboard_bench",
+                "--scenario",
+                name,
+                "--ticks",
+                str(ticks),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[name] = json.loads(output)
+
+    return {
+        "benchmark": "dashboard",
+        "timestamp": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark suite and write JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--ticks", type=int, help="override --hours")
+    parser.add_argument("--scenario", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="JSON output file (default: stdout)")
+    args = parser.parse_args()
+
+    ticks = args.ticks or int(args.hours * 3600)
+
+    if args.scenario:
+        # Child process: print a single scenario's results
+        print(json.dumps(run_scenario(args.scenario, ticks)))
+        return
+
+    document = json.dumps(run_suite(ticks), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""Local fake NWS API serving recorded forecasts.
+
+Stands in for the ``points/`` and ``gridpoints/.../forecast/hourly``
+endpoints of api.weather.gov, so the whole WeatherAPINWS fetch pipeline
+(HTTP, retries, conditional requests, decoding and parsing) can be
+benchmarked and regression-tested without the network. Point
+``weather_api_nws.BASE_API_URL`` at ``FakeNWSServer.base_url`` to use it.
+
+Forecasts are the recorded payloads in ``tests/fixtures``, with their times
+moved so the first period starts at the current hour. Coordinates inside a
+recorded grid cell resolve to it; others get a 404, as outside the NWS
+coverage area. Responses carry Cache-Control, Expires, ETag and
+Last-Modified headers like the real API and are gzip-compressed for
+clients that accept it.
+
+Latency, injected errors, conditional request handling and per-client rate
+limiting are configurable, and the server counts what it answered.
+"""
+
+import copy
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from smrtclk.weather.grid_index import GridIndex
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Recorded hourly forecasts by grid location
+RECORDINGS = {
+    "OKX/33,35": "nws_hourly_okx.json",
+    "TOP/31,80": "nws_hourly_top.json",
+}
+
+# A coordinate inside each recorded grid cell
+CELL_POINTS = {
+    "OKX/33,35": (40.7128, -74.006),
+    "TOP/31,80": (39.0473, -95.6752),
+}
+
+# Statuses of injected errors
+ERROR_STATUSES = (500, 502, 503)
+
+POINTS_PATH = re.compile(r"^/points/(-?[\d.]+),(-?[\d.]+)$")
+FORECAST_PATH = re.compile(r"^/gridpoints/(\w+)/(\d+),(\d+)/forecast(/hourly)?$")
+
+
+def _shift_time(value: str, delta: timedelta) -> str:
+    """Move an ISO 8601 time, keeping its UTC offset."""
+    return (datetime.fromisoformat(value) + delta).isoformat()
+
+
+def rebase_forecast(payload: dict, now: float) -> dict:
+    """
+    Move a recorded forecast so its first period starts at the current hour.
+
+    Args:
+        payload: Recorded NWS hourly forecast
+        now: Current time in seconds since the epoch
+
+    Returns:
+        Copy of the forecast with its period, update and validity times
+        moved by a whole number of hours
+    """
+    payload = copy.deepcopy(payload)
+    properties = payload["properties"]
+    periods = properties["periods"]
+    hour = datetime.fromtimestamp(now, timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+    start = datetime.fromisoformat(periods[0]["startTime"])
+    delta = timedelta(hours=round((hour - start).total_seconds() / 3600))
+
+    for period in periods:
+        period["startTime"] = _shift_time(period["startTime"], delta)
+        period["endTime"] = _shift_time(period["endTime"], delta)
+    for field in ("updateTime", "generatedAt"):
+        if field in properties:
+            properties[field] = _shift_time(properties[field], delta)
+    if "validTimes" in properties:
+        valid_from, duration = properties["validTimes"].split("/")
+        properties["validTimes"] = f"{_shift_time(valid_from, delta)}/{duration}"
+    return payload
+
+
+class _Forecast:
+    """Encoded forecast response of a grid cell."""
+
+    def __init__(self, payload: dict, generation: int):
+        """
+        Encode a forecast response.
+
+        Args:
+            payload: Forecast to serve
+            generation: Number of the forecast issue, part of the ETag
+        """
+        self.body = json.dumps(payload).encode()
+        self.gzip_body = gzip.compress(self.body)
+        digest = hashlib.sha1(self.body).hexdigest()[:16]
+        self.etag = f'"{generation}-{digest}"'
+        updated = datetime.fromisoformat(payload["properties"]["updateTime"])
+        self.last_modified = formatdate(updated.timestamp(), usegmt=True)
+
+
+class _TokenBucket:
+    """Rate limiter of one client."""
+
+    def __init__(self, rate: float, burst: int, now: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            now: Current monotonic time
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """
+        Take a token.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            0 if a token was taken, else seconds until one is available
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class FakeNWSServer(ThreadingHTTPServer):
+    """Local NWS API serving recorded forecasts."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        conditional: bool = True,
+        max_age: int | None = 3600,
+        rate_limit: float | None = None,
+        burst: int = 10,
+        seed: int | None = None,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+    ):
+        """
+        Initialize the fake API.
+
+        Args:
+            latency: Seconds every response is delayed by
+            jitter: Maximum random extra delay in seconds
+            error_rate: Fraction of requests answered with a 500, 502 or 503
+            conditional: Whether to answer matching conditional forecast
+                requests with 304 Not Modified
+            max_age: Cache-Control max-age of forecasts in seconds, or None
+                to send no caching headers
+            rate_limit: Requests per second allowed per client address, or
+                None for no limit; excess requests get a 429 with Retry-After
+            burst: Requests a client may make at once under the rate limit
+            seed: Seed of the latency jitter and error injection
+            address: Address to listen on (default: a free local port)
+        """
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.conditional = conditional
+        self.max_age = max_age
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._stats: Counter[str] = Counter()
+        self._statuses: Counter[int] = Counter()
+
+        self.grid_index = GridIndex()
+        self._recordings = {}
+        for location, name in RECORDINGS.items():
+            recording = json.loads((FIXTURES / name).read_text())
+            self._recordings[location] = recording
+            self.grid_index.add_cell(location, recording["geometry"])
+        self._forecasts: dict[str, _Forecast] = {}
+        self._generation = 0
+        self.regenerate()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Get the URL to use as BASE_API_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def regenerate(self) -> None:
+        """Issue new forecasts starting at the current hour, with new ETags."""
+        now = time.time()
+        self._generation += 1
+        forecasts = {
+            location: _Forecast(rebase_forecast(recording, now), self._generation)
+            for location, recording in self._recordings.items()
+        }
+        with self.lock:
+            self._forecasts = forecasts
+
+    def forecast(self, location: str) -> bytes | None:
+        """
+        Get the forecast served for a grid location.
+
+        Args:
+            location: Grid location (e.g., "OKX/33,35")
+
+        Returns:
+            Uncompressed response body, or None if the cell is not recorded
+        """
+        with self.lock:
+            forecast = self._forecasts.get(location)
+        return forecast.body if forecast is not None else None
+
+    def stats(self) -> dict:
+        """
+        Get the counts of requests answered.
+
+        Returns:
+            Requests by endpoint, 304 responses, rate-limited and injected
+            error responses, bytes of bodies sent, and responses by status
+        """
+        with self.lock:
+            return {
+                "requests": self._stats["requests"],
+                "points": self._stats["points"],
+                "forecasts": self._stats["forecasts"],
+                "not_modified": self._stats["not_modified"],
+                "rate_limited": self._stats["rate_limited"],
+                "errors": self._stats["errors"],
+                "bytes_sent": self._stats["bytes_sent"],
+                "statuses": dict(self._statuses),
+            }
+
+    def reset_stats(self) -> None:
+        """Clear the counts of requests answered."""
+        with self.lock:
+            self._stats.clear()
+            self._statuses.clear()
+
+    def _admit(self, client: str) -> tuple[int | None, float]:
+        """
+        Decide whether a request fails before being served.
+
+        Args:
+            client: Address of the client
+
+        Returns:
+            Status to fail with, or None to serve the request, and the
+            delay before answering in seconds (for a 429, the seconds to
+            send as Retry-After)
+        """
+        with self.lock:
+            self._stats["requests"] += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                bucket = self._buckets.get(client)
+                if bucket is None:
+                    bucket = _TokenBucket(self.rate_limit, self.burst, now)
+                    self._buckets[client] = bucket
+                wait = bucket.take(now)
+                if wait:
+                    self._stats["rate_limited"] += 1
+                    return 429, math.ceil(wait)
+            if self._rng.random() < self.error_rate:
+                self._stats["errors"] += 1
+                return self._rng.choice(ERROR_STATUSES), delay
+        return None, delay
+
+    def _count(self, name: str, status: int, size: int) -> None:
+        """Count a response."""
+        with self.lock:
+            if name:
+                self._stats[name] += 1
+            self._statuses[status] += 1
+            self._stats["bytes_sent"] += size
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send the body without waiting for the client to acknowledge the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        failure, delay = server._admit(self.client_address[0])
+        if failure == 429:
+            # Rejected at once, told when to come back
+            self._send_problem(429, "Too Many Requests", {"Retry-After": str(delay)})
+            return
+        if delay:
+            time.sleep(delay)
+        if failure is not None:
+            self._send_problem(failure, "Unexpected Problem")
+            return
+
+        if match := POINTS_PATH.match(self.path):
+            self._send_points(float(match[1]), float(match[2]))
+        elif match := FORECAST_PATH.match(self.path):
+            self._send_forecast(f"{match[1]}/{match[2]},{match[3]}")
+        else:
+            self._send_problem(404, "Not Found")
+
+    def _send_points(self, latitude: float, longitude: float):
+        location = self.server.grid_index.lookup(latitude, longitude)
+        if location is None:
+            self._send_problem(404, "Data Unavailable For Requested Point")
+            return
+        grid_id, grid_xy = location.split("/")
+        grid_x, grid_y = grid_xy.split(",")
+        forecast = f"{self.server.base_url}gridpoints/{location}/forecast"
+        payload = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+            "properties": {
+                "gridId": grid_id,
+                "gridX": int(grid_x),
+                "gridY": int(grid_y),
+                "forecast": forecast,
+                "forecastHourly": f"{forecast}/hourly",
+            },
+        }
+        self._send_body(200, json.dumps(payload).encode(), name="points")
+
+    def _send_forecast(self, location: str):
+        server = self.server
+        with server.lock:
+            forecast = server._forecasts.get(location)
+        if forecast is None:
+            self._send_problem(404, "Not Found")
+            return
+
+        headers = {"ETag": forecast.etag, "Last-Modified": forecast.last_modified}
+        if server.max_age is not None:
+            headers["Cache-Control"] = f"public, max-age={server.max_age}"
+            headers["Expires"] = formatdate(time.time() + server.max_age, usegmt=True)
+        if server.conditional and self._not_modified(forecast):
+            self._send_body(304, b"", headers, name="not_modified")
+            return
+
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            self._send_body(200, forecast.gzip_body, headers, name="forecasts")
+        else:
+            self._send_body(200, forecast.body, headers, name="forecasts")
+
+    def _not_modified(self, forecast: _Forecast) -> bool:
+        etags = self.headers.get("If-None-Match")
+        if etags is not None:
+            return forecast.etag in [etag.strip() for etag in etags.split(",")]
+        return self.headers.get("If-Modified-Since") == forecast.last_modified
+
+    def _send_problem(self, status: int, title: str, headers: dict | None = None):
+        problem = {"type": "about:blank", "title": title, "status": status}
+        body = json.dumps(problem).encode()
+        self._send_body(status, body, headers, "application/problem+json")
+
+    def _send_body(
+        self,
+        status: int,
+        body: bytes,
+        headers: dict | None = None,
+        content_type: str = "application/geo+json",
+        name: str = "",
+    ):
+        self.send_response(status)
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server._count(name, status, len(body))
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,112 @@
+"""Compare per-tick clock hand rendering cost with and without sprite caching.
+
+Usage:
+    python -m benchmarks.hand_cache_bench [--ticks N]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from config.constants import HOUR_HAND_IMAGE, MINUTE_HAND_IMAGE, SECOND_HAND_IMAGE
+from config.settings import Config
+from smrtclk.views.clock_widget import ClockWidget
+from smrtclk.views.hand_cache import HandSpriteCache, render_hand
+
+
+def tick_angles(ticks: int):
+    """Yield (hand_type, angle) pairs for consecutive one-second ticks."""
+    for t in range(ticks):
+        second = t % 60
+        minute = (t // 60) % 60
+        hour = (t // 3600) % 12
+        yield "sec", second * 6.0
+        if second == 0:
+            yield "min", minute * 6.0
+            yield "hour", (hour + minute / 60.0) * 30.0
+
+
+def bench_render(config: Config, ticks: int) -> dict[str, float]:
+    """
+    Time the hand transform alone for the uncached and cached paths.
+
+    Args:
+        config: Application configuration
+        ticks: Number of simulated one-second ticks
+
+    Returns:
+        Mean microseconds per tick for each path
+    """
+    size = ClockWidget(None, config)._clockrect.size()
+    pixmaps = {
+        "hour": QPixmap(str(config.images_path / HOUR_HAND_IMAGE)),
+        "min": QPixmap(str(config.images_path / MINUTE_HAND_IMAGE)),
+        "sec": QPixmap(str(config.images_path / SECOND_HAND_IMAGE)),
+    }
+    results = {}
+
+    start = time.perf_counter()
+    for hand_type, angle in tick_angles(ticks):
+        render_hand(pixmaps[hand_type], size, angle)
+    results["transform_us"] = (time.perf_counter() - start) / ticks * 1e6
+
+    cache = HandSpriteCache(config.hand_cache_budget)
+    start = time.perf_counter()
+    for hand_type, pixmap in pixmaps.items():
+        cache.prerender(hand_type, pixmap, size)
+    results["prerender_ms"] = (time.perf_counter() - start) * 1e3
+    results["cache_mib"] = cache.size_bytes / (1024 * 1024)
+
+    start = time.perf_counter()
+    for hand_type, angle in tick_angles(ticks):
+        cache.get(hand_type, angle, pixmaps[hand_type], size)
+    results["cached_us"] = (time.perf_counter() - start) / ticks * 1e6
+
+    return results
+
+
+def bench_widget(config: Config, ticks: int) -> float:
+    """
+    Time ClockWidget.updateHand end to end for the configured cache mode.
+
+    Args:
+        config: Application configuration
+        ticks: Number of simulated one-second ticks
+
+    Returns:
+        Mean microseconds per tick
+    """
+    widget = ClockWidget(None, config)
+    start = time.perf_counter()
+    for hand_type, angle in tick_angles(ticks):
+        widget.updateHand(hand_type, angle)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=3600)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    render = bench_render(Config(), args.ticks)
+    print(f"ticks:                 {args.ticks}")
+    print(f"transform per tick:    {render['transform_us']:.1f} us")
+    print(f"cache hit per tick:    {render['cached_us']:.1f} us")
+    print(f"prerender all hands:   {render['prerender_ms']:.1f} ms")
+    print(f"cache size:            {render['cache_mib']:.1f} MiB")
+
+    for mode in ("off", "lazy", "eager"):
+        per_tick = bench_widget(Config(hand_cache_mode=mode), args.ticks)
+        print(f"updateHand ({mode + '):':7}   {per_tick:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure JSON decode time and memory per NWS forecast payload.
+
+Compares each available full-document decoder with selective extraction of
+the forecast periods, for the recorded test fixtures and synthetic longer
+forecasts.
+
+Usage:
+    python -m benchmarks.json_decode_bench [--repeat N]
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.nws_parse_bench import (
+    FIXTURES,
+    RECORDED,
+    SYNTHETIC_HOURS,
+    synthetic_payload,
+    timed,
+)
+from smrtclk.weather.json_decoder import DECODERS, loads, select_periods
+
+
+def decode_modes() -> dict:
+    """
+    Get the decoding modes to compare.
+
+    Returns:
+        Functions decoding a payload, by name
+    """
+    modes = {name: lambda raw, name=name: loads(raw, name) for name in DECODERS}
+    modes["select_periods"] = select_periods
+    return modes
+
+
+def measure_memory(func) -> tuple[int, int]:
+    """
+    Measure the memory used by a function.
+
+    Args:
+        func: Function to measure
+
+    Returns:
+        Peak bytes allocated during the call, and bytes still allocated by
+        its result
+    """
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, current
+
+
+def bench_payload(raw: bytes, repeat: int) -> dict:
+    """
+    Benchmark every decoding mode on one payload.
+
+    Args:
+        raw: Forecast JSON
+        repeat: Timing repetitions
+
+    Returns:
+        Measurements per mode
+    """
+    results = {}
+    for name, decode in decode_modes().items():
+        peak, retained = measure_memory(lambda decode=decode: decode(raw))
+        results[name] = {
+            "decode_us": timed(lambda decode=decode: decode(raw), repeat),
+            "peak_kib": peak / 1024,
+            "retained_kib": retained / 1024,
+        }
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {name: (FIXTURES / name).read_bytes() for name in RECORDED}
+    for hours in SYNTHETIC_HOURS:
+        payloads[f"synthetic {hours}h"] = synthetic_payload(
+            payloads[RECORDED[0]], hours
+        )
+
+    print(
+        f"{'payload':22} {'KiB':>6} {'mode':15} {'decode us':>10} "
+        f"{'peak KiB':>9} {'kept KiB':>9}"
+    )
+    for name, raw in payloads.items():
+        for mode, r in bench_payload(raw, args.repeat).items():
+            print(
+                f"{name:22} {len(raw) / 1024:6.0f} {mode:15} "
+                f"{r['decode_us']:10.0f} {r['peak_kib']:9.0f} "
+                f"{r['retained_kib']:9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Measure the WeatherAPINWS fetch pipeline against a local fake NWS API.
+
+Runs a fleet of clients, each fetching through its own WeatherAPINWS, at
+the fake API of benchmarks.fake_nws, which serves recorded forecasts with
+artificial latency. Every call goes through the real HTTP, retry,
+conditional request, decoding and parsing code.
+
+Scenarios:
+    cold: every call refreshes, resolving the grid location and fetching
+        the whole forecast.
+    revalidate: every call finds the cache expired and revalidates the
+        forecast, which is answered 304 Not Modified.
+    changed: as revalidate, but the forecast has always changed.
+    errors: as revalidate, with 10% of requests failing and retried.
+    rate_limited: as revalidate, with the API limiting each client
+        address to 50 requests per second.
+
+Usage:
+    python -m benchmarks.nws_fetch_bench [--clients N] [--calls C]
+        [--latency MS] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import Counter
+
+from benchmarks.fake_nws import CELL_POINTS, FakeNWSServer
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.poll_scheduler import PollScheduler
+from smrtclk.weather.retry import RetryPolicy
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+
+# Fake API settings and whether calls refresh, by scenario
+SCENARIOS = {
+    "cold": ({}, True),
+    "revalidate": ({}, False),
+    "changed": ({"conditional": False}, False),
+    "errors": ({"error_rate": 0.1}, False),
+    "rate_limited": ({"rate_limit": 50, "burst": 10}, False),
+}
+
+# Retries short enough to keep the benchmark quick
+RETRY_POLICY = {"base_delay": 0.05, "max_delay": 0.5, "deadline": 10}
+
+
+# Result statuses of calls that got no current forecast
+FAILED_STATUSES = ("error", "offline")
+
+
+def create_client(index: int, expire: bool) -> WeatherAPINWS:
+    """
+    Create a client of the fake API.
+
+    Args:
+        index: Number of the client, choosing its recorded grid cell
+        expire: Whether the cached forecast expires at once, instead of
+            when the response headers say
+
+    Returns:
+        Weather API for a point inside a recorded cell
+    """
+    points = list(CELL_POINTS.values())
+    latitude, longitude = points[index % len(points)]
+    if expire:
+        scheduler = PollScheduler(jitter=0, min_interval=0, max_interval=0)
+    else:
+        scheduler = None
+    return WeatherAPINWS(
+        latitude,
+        longitude,
+        poll_scheduler=scheduler,
+        retry_policy=RetryPolicy(**RETRY_POLICY),
+    )
+
+
+def run_clients(
+    clients: list[WeatherAPINWS], calls: int, refresh: bool
+) -> tuple[list[float], Counter, float]:
+    """
+    Fetch from every client concurrently.
+
+    Args:
+        clients: Weather APIs, one per simulated clock
+        calls: Number of calls per client
+        refresh: Whether each call forces a refresh, then reads the
+            refreshed cache
+
+    Returns:
+        Latency of every call in seconds, the statuses of the results, and
+        the wall time in seconds
+    """
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(clients) + 1)
+
+    def fetch(client: WeatherAPINWS) -> None:
+        local = []
+        local_statuses: Counter[str] = Counter()
+        barrier.wait()
+        for _ in range(calls):
+            start = time.perf_counter()
+            if refresh:
+                client.refresh()
+            result = client.get_current_weather()
+            local.append(time.perf_counter() - start)
+            local_statuses[result.get("status")] += 1
+        with lock:
+            latencies.extend(local)
+            statuses.update(local_statuses)
+
+    threads = [threading.Thread(target=fetch, args=(c,)) for c in clients]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return latencies, statuses, time.perf_counter() - start
+
+
+def run_scenario(
+    scenario: str, clients: int, calls: int, latency: float, seed: int = 0
+) -> dict:
+    """
+    Run one scenario against a fresh fake API.
+
+    Args:
+        scenario: Scenario name from SCENARIOS
+        clients: Number of concurrent clients
+        calls: Number of calls per client
+        latency: Seconds the fake API delays every response by
+        seed: Seed of the fake API's jitter and error injection
+
+    Returns:
+        Latency percentiles in milliseconds, throughput, result statuses
+        and the requests the fake API answered
+    """
+    settings, refresh = SCENARIOS[scenario]
+    with FakeNWSServer(
+        latency=latency, jitter=latency / 2, seed=seed, **settings
+    ) as server:
+        base_url = weather_api_nws.BASE_API_URL
+        weather_api_nws.BASE_API_URL = server.base_url
+        apis = [create_client(i, expire=not refresh) for i in range(clients)]
+        try:
+            # Resolve grid locations and fill the caches
+            for api in apis:
+                api.get_current_weather()
+            server.reset_stats()
+            latencies, statuses, wall = run_clients(apis, calls, refresh)
+        finally:
+            for api in apis:
+                api.close()
+            weather_api_nws.BASE_API_URL = base_url
+        served = server.stats()
+
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1e3
+
+    return {
+        "calls": len(ordered),
+        "calls_per_s": len(ordered) / wall,
+        "mean_ms": statistics.fmean(ordered) * 1e3,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "statuses": dict(statuses),
+        "requests_per_call": served["requests"] / len(ordered),
+        "served": served,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    # Retried and failed requests are counted, not logged
+    logging.basicConfig(level=logging.CRITICAL)
+    results = {}
+    print(f"clients: {args.clients}  calls: {args.calls}  latency: {args.latency:g} ms")
+    print(
+        f"{'scenario':13} {'calls/s':>8} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'p99 ms':>7} {'req/call':>9} {'failed':>7}"
+    )
+    for scenario in SCENARIOS:
+        result = run_scenario(scenario, args.clients, args.calls, args.latency / 1e3)
+        results[scenario] = result
+        failed = sum(result["statuses"].get(s, 0) for s in FAILED_STATUSES)
+        print(
+            f"{scenario:13} {result['calls_per_s']:8.1f} {result['p50_ms']:7.1f} "
+            f"{result['p95_ms']:7.1f} {result['p99_ms']:7.1f} "
+            f"{result['requests_per_call']:9.2f} {failed:7d}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Measure NWS hourly forecast parse time and memory per payload.
+
+Compares the columnar ForecastSeries path with walking the decoded period
+dicts for the recorded test fixtures and synthetic longer forecasts.
+
+Usage:
+    python -m benchmarks.nws_parse_bench [--repeat N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from smrtclk.weather.nws_forecast import ForecastSeries
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+RECORDED = ["nws_hourly_okx.json", "nws_hourly_top.json"]
+# Synthetic forecast lengths in hours
+SYNTHETIC_HOURS = [24 * 31, 24 * 365]
+
+
+def synthetic_payload(template: bytes, hours: int) -> bytes:
+    """
+    Build a longer forecast by repeating a recorded payload's periods.
+
+    Args:
+        template: Recorded forecast JSON
+        hours: Number of hourly periods
+
+    Returns:
+        Forecast JSON with the given number of periods
+    """
+    data = json.loads(template)
+    periods = data["properties"]["periods"]
+    start = datetime.fromisoformat(periods[0]["startTime"])
+    data["properties"]["periods"] = [
+        {
+            **periods[i % len(periods)],
+            "number": i + 1,
+            "startTime": (start + timedelta(hours=i)).isoformat(),
+            "endTime": (start + timedelta(hours=i + 1)).isoformat(),
+        }
+        for i in range(hours)
+    ]
+    return json.dumps(data).encode()
+
+
+def walk_summary(data: dict, now: float) -> dict:
+    """
+    Daily summary computed by walking the period dicts.
+
+    Args:
+        data: Decoded forecast
+        now: Current time in seconds since the epoch
+
+    Returns:
+        Current, minimum and maximum temperature and precipitation
+    """
+    periods = data["properties"]["periods"]
+    zone = datetime.fromisoformat(periods[0]["startTime"]).tzinfo
+    today = datetime.fromtimestamp(now, zone).date()
+    window = []
+    for period in periods:
+        start = datetime.fromisoformat(period["startTime"])
+        if start.timestamp() + 3600 > now and start.astimezone(zone).date() == today:
+            window.append(period)
+    window = window or periods[-1:]
+    temperatures = [p["temperature"] for p in window]
+    probabilities = [
+        p["probabilityOfPrecipitation"]["value"]
+        for p in window
+        if p["probabilityOfPrecipitation"]["value"] is not None
+    ]
+    return {
+        "temperature": temperatures[0],
+        "temperature_min": min(temperatures),
+        "temperature_max": max(temperatures),
+        "precipitation_max": max(probabilities, default=0),
+    }
+
+
+def timed(func, repeat: int) -> float:
+    """
+    Time a function.
+
+    Args:
+        func: Function to call
+        repeat: Number of calls
+
+    Returns:
+        Mean microseconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def retained_bytes(func) -> tuple[int, object]:
+    """
+    Measure the memory retained by a function's result.
+
+    Args:
+        func: Function building the object to measure
+
+    Returns:
+        Bytes still allocated after the call, and the result
+    """
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def bench_payload(raw: bytes, repeat: int) -> dict:
+    """
+    Benchmark one forecast payload.
+
+    Args:
+        raw: Forecast JSON
+        repeat: Timing repetitions
+
+    Returns:
+        Measurements for the payload
+    """
+    data = json.loads(raw)
+    series = ForecastSeries.from_payload(data)
+    now = series.start[len(series) // 2] + 60
+
+    decoded_bytes, _ = retained_bytes(lambda: json.loads(raw))
+    column_bytes, _ = retained_bytes(lambda: ForecastSeries.from_payload(data))
+
+    return {
+        "periods": len(series),
+        "payload_kib": len(raw) / 1024,
+        "decode_us": timed(lambda: json.loads(raw), repeat),
+        "columns_us": timed(lambda: ForecastSeries.from_payload(data), repeat),
+        "summary_us": timed(lambda: series.summary(now), repeat * 10),
+        "walk_summary_us": timed(lambda: walk_summary(data, now), repeat),
+        "decoded_kib": decoded_bytes / 1024,
+        "columns_kib": column_bytes / 1024,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {name: (FIXTURES / name).read_bytes() for name in RECORDED}
+    for hours in SYNTHETIC_HOURS:
+        payloads[f"synthetic {hours}h"] = synthetic_payload(
+            payloads[RECORDED[0]], hours
+        )
+
+    print(
+        f"{'payload':22} {'periods':>7} {'decode us':>10} {'columns us':>10} "
+        f"{'summary us':>10} {'walk us':>10} {'dicts KiB':>9} {'cols KiB':>8}"
+    )
+    for name, raw in payloads.items():
+        r = bench_payload(raw, args.repeat)
+        print(
+            f"{name:22} {r['periods']:7d} {r['decode_us']:10.0f} "
+            f"{r['columns_us']:10.0f} {r['summary_us']:10.1f} "
+            f"{r['walk_summary_us']:10.0f} {r['decoded_kib']:9.0f} "
+            f"{r['columns_kib']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Compare fixed-interval weather polling with planned fetches.
+
+Simulates a fleet of clocks over a virtual day against a local HTTP server
+standing in for the NWS forecast endpoint. The forecast is regenerated
+once an hour at an irregular minute, and responses carry a Cache-Control
+max-age and the forecast's updateTime, as the NWS API does.
+
+Each policy reports the upstream calls per clock per day and how long new
+forecasts took to reach the clocks after being published:
+    fixed_N: every clock polls every N seconds.
+    planned: every clock plans its next fetch with PollScheduler from the
+        response headers and update time.
+
+Usage:
+    python -m benchmarks.poll_schedule_bench [--clients N] [--hours H]
+        [--max-age S] [--output results.json]
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import random
+import statistics
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from smrtclk.weather.poll_scheduler import PollScheduler, expiry_time
+from smrtclk.weather.weather_api_nws import forecast_update_time
+
+# Polling intervals of the fixed policies, by name; None plans each fetch
+POLICIES = {"fixed_300": 300, "fixed_900": 900, "planned": None}
+
+# Start of the simulated day
+START_TIME = datetime(2026, 1, 15, tzinfo=timezone.utc).timestamp()
+
+# Minutes past the hour the forecast is regenerated at
+UPDATE_MINUTES = (40, 55)
+
+# Forecast path served by the simulated API
+FORECAST_PATH = "/gridpoints/OKX/33,35/forecast/hourly"
+
+# Interval used by planned fetches without hints (seconds)
+FALLBACK_INTERVAL = 900
+
+
+class SimulatedNWSServer(ThreadingHTTPServer):
+    """Local forecast endpoint answering at the simulated time."""
+
+    daemon_threads = True
+
+    def __init__(self, update_times: list[float], max_age: int):
+        """
+        Initialize the simulated server.
+
+        Args:
+            update_times: Sorted times the forecast is regenerated at
+            max_age: Cache-Control max-age of every response in seconds
+        """
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.update_times = update_times
+        self.max_age = max_age
+        # Simulated time, set by the caller before each request
+        self.now = START_TIME
+        self.requests = 0
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Get the forecast URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{FORECAST_PATH}"
+
+    def update_time(self) -> float:
+        """Get when the forecast served now was generated."""
+        index = bisect.bisect_right(self.update_times, self.now)
+        return self.update_times[max(0, index - 1)]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send the body without waiting for the client to acknowledge the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        updated = datetime.fromtimestamp(server.update_time(), timezone.utc)
+        body = json.dumps(
+            {"properties": {"updateTime": updated.isoformat(), "periods": []}}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Cache-Control", f"public, max-age={server.max_age}")
+        self.send_header("Content-Type", "application/geo+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def update_schedule(hours: float, rng: random.Random) -> list[float]:
+    """
+    Draw the forecast update times of the simulated period.
+
+    Args:
+        hours: Length of the simulated period
+        rng: Random number generator
+
+    Returns:
+        Sorted update times, starting with one before the period
+    """
+    times = []
+    for hour in range(-1, int(hours) + 1):
+        minute = rng.uniform(*UPDATE_MINUTES)
+        times.append(START_TIME + hour * 3600 + minute * 60)
+    return times
+
+
+def delivery_delays(update_times: list[float], fetches: list[float]) -> list[float]:
+    """
+    Get how long each forecast update took to be fetched by a clock.
+
+    Args:
+        update_times: Sorted forecast update times
+        fetches: Sorted times the clock fetched at
+
+    Returns:
+        Seconds from each update to the clock's first fetch after it
+    """
+    delays = []
+    for updated in update_times:
+        index = bisect.bisect_left(fetches, updated)
+        if index < len(fetches):
+            delays.append(fetches[index] - updated)
+    return delays
+
+
+def simulate(
+    policy: str, clients: int, hours: float, max_age: int = 600, seed: int = 0
+) -> dict:
+    """
+    Simulate a fleet of clocks fetching under a policy.
+
+    Args:
+        policy: Policy name from POLICIES
+        clients: Number of simulated clocks
+        hours: Length of the simulated period
+        max_age: Cache-Control max-age of forecast responses in seconds
+        seed: Seed of the update times, start offsets and jitter
+
+    Returns:
+        Upstream calls per clock per day and forecast delivery delays
+    """
+    rng = random.Random(seed)
+    update_times = update_schedule(hours, rng)
+    end = START_TIME + hours * 3600
+    interval = POLICIES[policy]
+    scheduler = PollScheduler(rng=rng)
+
+    # Clocks start at random times within the first polling interval
+    queue = [
+        (START_TIME + rng.uniform(0, interval or FALLBACK_INTERVAL), client)
+        for client in range(clients)
+    ]
+    heapq.heapify(queue)
+    fetches: list[list[float]] = [[] for _ in range(clients)]
+
+    with (
+        SimulatedNWSServer(update_times, max_age) as server,
+        requests.Session() as session,
+    ):
+        while queue:
+            now, client = heapq.heappop(queue)
+            if now >= end:
+                continue
+            server.now = now
+            response = session.get(server.url, timeout=10)
+            response.raise_for_status()
+            fetches[client].append(now)
+
+            if interval is not None:
+                planned = now + interval
+            else:
+                planned = scheduler.plan(
+                    now,
+                    FALLBACK_INTERVAL,
+                    expiry_time(response.headers, now=now),
+                    forecast_update_time(response.json()),
+                )
+            heapq.heappush(queue, (planned, client))
+        calls = server.requests
+
+    published = [t for t in update_times if START_TIME <= t < end]
+    delays = [
+        delay
+        for client_fetches in fetches
+        for delay in delivery_delays(published, client_fetches)
+    ]
+    return {
+        "calls_per_day": calls / clients * 24 / hours,
+        "mean_delay_s": statistics.fmean(delays) if delays else 0.0,
+        "max_delay_s": max(delays, default=0.0),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--max-age", type=int, default=600)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"clients: {args.clients}  hours: {args.hours:g}  max-age: {args.max_age}s")
+    print(f"{'policy':12} {'calls/day':>10} {'mean delay s':>13} {'max delay s':>12}")
+    for policy in POLICIES:
+        result = simulate(policy, args.clients, args.hours, args.max_age)
+        results[policy] = result
+        print(
+            f"{policy:12} {result['calls_per_day']:10.1f} "
+            f"{result['mean_delay_s']:13.0f} {result['max_delay_s']:12.0f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
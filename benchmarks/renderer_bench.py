@@ -0,0 +1,70 @@
+"""Compare per-tick update and repaint cost of the clock renderers.
+
+Usage:
+    python -m benchmarks.renderer_bench [--ticks N]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import Config
+from smrtclk.views.clock_widget import ClockWidget
+
+from .hand_cache_bench import tick_angles
+
+
+def bench_renderer(app: QApplication, config: Config, ticks: int) -> float:
+    """
+    Time hand updates plus the repaint they trigger.
+
+    Args:
+        app: Running application instance
+        config: Application configuration selecting the renderer
+        ticks: Number of simulated one-second ticks
+
+    Returns:
+        Mean microseconds per tick
+    """
+    widget = ClockWidget(None, config)
+    widget.resize(config.width, config.height)
+    widget.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    for hand_type, angle in tick_angles(ticks):
+        widget.updateHand(hand_type, angle)
+        if hand_type == "sec":
+            # Flush pending layout and paint events once per tick
+            app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    widget.close()
+    return elapsed / ticks * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+
+    configs = {
+        "labels": Config(clock_renderer="labels"),
+        "labels+cache": Config(clock_renderer="labels", hand_cache_mode="eager"),
+        "painter": Config(clock_renderer="painter"),
+    }
+    print(f"ticks: {args.ticks}")
+    for name, config in configs.items():
+        per_tick = bench_renderer(app, config, args.ticks)
+        print(f"{name + ':':14} {per_tick:.1f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
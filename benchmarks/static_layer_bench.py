@@ -0,0 +1,89 @@
+"""Compare per-second repaint cost with and without the static layer.
+
+Drives the full window with a fake clock and times the repaint triggered by
+each one-second tick separately from the hand updates that cause it.
+
+Usage:
+    python -m benchmarks.static_layer_bench [--ticks N]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import Config
+
+from .dashboard_bench import START_TIME, FakeClock
+
+# Configurations compared, by name
+SCENARIOS = {
+    "labels": {"clock_renderer": "labels", "static_layer": False},
+    "labels+static": {"clock_renderer": "labels", "static_layer": True},
+    "painter": {"clock_renderer": "painter", "static_layer": False},
+    "painter+static": {"clock_renderer": "painter", "static_layer": True},
+}
+
+
+def bench_scenario(app: QApplication, name: str, ticks: int) -> dict:
+    """
+    Time hand updates and the repaints they trigger.
+
+    Args:
+        app: Running application instance
+        name: Scenario name from SCENARIOS
+        ticks: Number of simulated one-second ticks
+
+    Returns:
+        Mean microseconds per tick spent updating and repainting
+    """
+    # Imported here so module import stays cheap
+    from smrtclk.views.main_window import ClockMainWindow
+
+    clock = FakeClock(START_TIME)
+    window = ClockMainWindow(Config(**SCENARIOS[name]), clock=clock)
+    window.show()
+    app.processEvents()
+
+    # Drive ticks directly instead of waiting on the wall-clock timer
+    controller = window.clock_controller
+    controller.stop()
+
+    update = repaint = 0.0
+    for _ in range(ticks):
+        clock.advance()
+        start = time.perf_counter()
+        controller._onTimerTick()
+        updated = time.perf_counter()
+        # Flush the paint events scheduled by the tick
+        app.processEvents()
+        update += updated - start
+        repaint += time.perf_counter() - updated
+
+    window.close()
+    return {
+        "update_us": update / ticks * 1e6,
+        "repaint_us": repaint / ticks * 1e6,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+
+    print(f"ticks: {args.ticks}")
+    print(f"{'scenario':16} {'update us':>10} {'repaint us':>11}")
+    for name in SCENARIOS:
+        result = bench_scenario(app, name, args.ticks)
+        print(f"{name:16} {result['update_us']:10.1f} {result['repaint_us']:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Measure upstream calls, latency and throughput of the LAN weather proxy.
+
+Simulates a fleet of clocks at one site, each polling for weather, against
+a mock upstream with artificial latency. Compares every clock fetching
+upstream directly with all clocks reading through the proxy over TCP and
+over a Unix socket.
+
+Each scenario runs two phases:
+    burst: every clock polls at the same moment with the upstream cache
+        cold, as when the cache expires.
+    warm: every clock polls repeatedly while the upstream data is cached,
+        measuring the proxy's own latency and throughput.
+
+Usage:
+    python -m benchmarks.weather_proxy_bench [--clients N] [--requests R]
+        [--latency MS] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import threading
+import time
+
+from smrtclk.weather.weather_api import WeatherAPI
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+from smrtclk.weather.weather_api_proxy import WeatherAPIProxy
+from smrtclk.weather.weather_proxy import (
+    UnixWeatherProxyServer,
+    WeatherProxy,
+    WeatherProxyServer,
+)
+
+SCENARIOS = ["direct", "proxy_tcp", "proxy_unix"]
+
+# Coordinates shared by every simulated clock
+LATITUDE = 39.7392
+LONGITUDE = -104.9903
+
+# Upstream cache duration; long enough to cover a whole scenario
+UPSTREAM_TTL = 3600
+
+
+class SimulatedUpstream(WeatherAPIMock):
+    """Mock provider with network latency that counts upstream fetches."""
+
+    def __init__(
+        self, latitude: float, longitude: float, latency: float, counter: list
+    ):
+        """
+        Initialize the simulated upstream.
+
+        Args:
+            latitude: Latitude of the location
+            longitude: Longitude of the location
+            latency: Seconds each upstream fetch takes
+            counter: Single-element list incremented on every fetch
+        """
+        super().__init__(latitude, longitude, cache_duration=UPSTREAM_TTL)
+        self._latency = latency
+        self._counter = counter
+        self._counter_lock = threading.Lock()
+
+    def _fetch_weather_data(self) -> dict:
+        """Count the fetch and wait out the simulated latency."""
+        with self._counter_lock:
+            self._counter[0] += 1
+        time.sleep(self._latency)
+        return super()._fetch_weather_data()
+
+
+def run_clients(clients: list[WeatherAPI], calls: int) -> tuple[list[float], float]:
+    """
+    Poll from every client concurrently.
+
+    Args:
+        clients: Weather APIs, one per simulated clock
+        calls: Number of polls per client
+
+    Returns:
+        Latency of every poll in seconds, and the wall time in seconds
+    """
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(clients) + 1)
+
+    def poll(client: WeatherAPI) -> None:
+        local = []
+        barrier.wait()
+        for _ in range(calls):
+            start = time.perf_counter()
+            result = client.get_current_weather()
+            local.append(time.perf_counter() - start)
+            if result.get("status") == "error":
+                errors.append(result.get("error_message", ""))
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=poll, args=(c,)) for c in clients]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    if errors:
+        raise RuntimeError(f"{len(errors)} polls failed, e.g. {errors[0]}")
+    return latencies, wall
+
+
+def summarize(latencies: list[float], wall: float, upstream_calls: int) -> dict:
+    """
+    Summarize one phase.
+
+    Args:
+        latencies: Latency of every poll in seconds
+        wall: Wall time of the phase in seconds
+        upstream_calls: Upstream fetches during the phase
+
+    Returns:
+        Latency percentiles in milliseconds, throughput and upstream calls
+    """
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1e3
+
+    return {
+        "polls": len(ordered),
+        "upstream_calls": upstream_calls,
+        "mean_ms": statistics.fmean(ordered) * 1e3,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": ordered[-1] * 1e3,
+        "polls_per_sec": len(ordered) / wall,
+    }
+
+
+def run_scenario(name: str, clients: int, requests: int, latency: float) -> dict:
+    """
+    Run both phases of one scenario.
+
+    Args:
+        name: Scenario name from SCENARIOS
+        clients: Number of simulated clocks
+        requests: Polls per clock in the warm phase
+        latency: Seconds each upstream fetch takes
+
+    Returns:
+        Measurements for the burst and warm phases
+    """
+    counter = [0]
+
+    def upstream(lat: float, lon: float) -> WeatherAPI:
+        return SimulatedUpstream(lat, lon, latency, counter)
+
+    server = None
+    socket_dir = None
+    if name == "direct":
+        apis = [upstream(LATITUDE, LONGITUDE) for _ in range(clients)]
+    else:
+        proxy = WeatherProxy(upstream)
+        if name == "proxy_unix":
+            socket_dir = tempfile.TemporaryDirectory()
+            path = os.path.join(socket_dir.name, "weather.sock")
+            server = UnixWeatherProxyServer(proxy, path)
+        else:
+            server = WeatherProxyServer(proxy, ("127.0.0.1", 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        # Clocks skip their own cache so every poll reaches the proxy
+        apis = [
+            WeatherAPIProxy(LATITUDE, LONGITUDE, server.url, cache_duration=0)
+            for _ in range(clients)
+        ]
+
+    try:
+        latencies, wall = run_clients(apis, 1)
+        burst = summarize(latencies, wall, counter[0])
+
+        before = counter[0]
+        latencies, wall = run_clients(apis, requests)
+        warm = summarize(latencies, wall, counter[0] - before)
+    finally:
+        for api in apis:
+            api.close()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if socket_dir is not None:
+            socket_dir.cleanup()
+
+    return {"clients": clients, "burst": burst, "warm": warm}
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=200.0, help="upstream ms")
+    parser.add_argument("--output", help="also write JSON results to this file")
+    args = parser.parse_args()
+
+    results = {
+        name: run_scenario(name, args.clients, args.requests, args.latency / 1e3)
+        for name in SCENARIOS
+    }
+
+    print(f"clients: {args.clients}, upstream latency: {args.latency:.0f} ms")
+    print(
+        f"{'scenario':12} {'phase':6} {'upstream':>8} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'polls/s':>9}"
+    )
+    for name, result in results.items():
+        for phase in ("burst", "warm"):
+            r = result[phase]
+            print(
+                f"{name:12} {phase:6} {r['upstream_calls']:8d} {r['p50_ms']:8.2f} "
+                f"{r['p95_ms']:8.2f} {r['p99_ms']:8.2f} {r['polls_per_sec']:9.0f}"
+            )
+
+    if args.output:
+        document = {
+            "benchmark": "weather_proxy",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "upstream_latency_ms": args.latency,
+            "scenarios": results,
+        }
+        with open(args.output, "w") as f:
+            f.write(json.dumps(document, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
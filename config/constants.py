@@ -2,7 +2,11 @@
 
 # Timer intervals (milliseconds)
 CLOCK_UPDATE_INTERVAL = 1000  # 1 second
+CLOCK_IDLE_UPDATE_INTERVAL = 60 * 1000  # 1 minute
+CLOCK_TICK_SLACK = 5  # Wake 5 ms after each boundary
+# Weather fetch interval without cache hints, and after a failed fetch
 WEATHER_UPDATE_INTERVAL = 5 * 60 * 1000  # 5 minutes
+WEATHER_REQUEST_TIMEOUT = 10 * 1000  # 10 seconds per request
 
 # Color constants
 PRIMARY_COLOR = "#bef"
@@ -33,3 +37,13 @@ SLIDER_IMAGE = "slider.png"
 # Weather API settings
 DEFAULT_LATITUDE = "40.0931191"
 DEFAULT_LONGITUDE = "-83.017962"
+
+# Profiling settings
+TICK_PROFILE_CAPACITY = 3600  # 1 hour of ticks per stage
+
+# Modules imported after the first clock frame is painted, so their import
+# time (weather providers, requests, QtNetwork) does not delay it
+DEFERRED_IMPORTS = (
+    "smrtclk.views.weather_widget",
+    "smrtclk.controllers.weather_controller",
+)
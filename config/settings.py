@@ -19,6 +19,15 @@ class Config:
         width: int = 480,
         height: int = 272,
         images_path: Path | None = None,
+        clock_renderer: str = "labels",
+        precise_clock_timer: bool = True,
+        hand_cache_mode: str = "off",
+        hand_cache_budget: int = 32 * 1024 * 1024,
+        static_layer: bool = True,
+        profile_ticks: bool = False,
+        profile_report_every: int = 0,
+        profile_report_path: Path | None = None,
+        defer_imports: bool = True,
     ):
         """
         Initialize configuration.
@@ -30,6 +39,18 @@ class Config:
             width: Display width in pixels
             height: Display height in pixels
             images_path: Path to images directory
+            clock_renderer: Clock drawing strategy ('labels' or 'painter')
+            precise_clock_timer: Use a precise timer for second-aligned clock ticks
+            hand_cache_mode: Clock hand sprite caching ('off', 'lazy', or 'eager'),
+                used by the 'labels' renderer only
+            hand_cache_budget: Memory budget for cached hand sprites in bytes
+            static_layer: Composite the background and clock face into one
+                pixmap, so repaints under the hands copy from it
+            profile_ticks: Record per-stage clock tick timings
+            profile_report_every: Report tick timings every N ticks (0 disables)
+            profile_report_path: JSON file for tick timing reports; logged if None
+            defer_imports: Import weather and network modules after the first
+                clock frame is painted instead of before the window is built
         """
         self.latitude = latitude
         self.longitude = longitude
@@ -37,6 +58,15 @@ class Config:
         self.width = width
         self.height = height
         self.images_path = images_path or Path(__file__).parent.parent / "images"
+        self.clock_renderer = clock_renderer
+        self.precise_clock_timer = precise_clock_timer
+        self.hand_cache_mode = hand_cache_mode
+        self.hand_cache_budget = hand_cache_budget
+        self.static_layer = static_layer
+        self.profile_ticks = profile_ticks
+        self.profile_report_every = profile_report_every
+        self.profile_report_path = profile_report_path
+        self.defer_imports = defer_imports
 
         # Calculate scale factors
         self.xscale = float(width) / 1440.0
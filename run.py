@@ -7,14 +7,42 @@ located in the smrtclk package.
 
 Usage:
     python run.py [--config CONFIG_FILE] [--debug]
+    python run.py [--profile-startup [REPORT.json]] [--eager-imports]
 """
 
+import argparse
+import logging
 import sys
+from pathlib import Path
 
-from PyQt5.QtWidgets import QApplication
+from smrtclk.profiling.startup_profiler import StartupProfiler, profile_phase
 
-from config.settings import Config
-from smrtclk.views.main_window import ClockMainWindow
+
+def parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """
+    Parse the command line.
+
+    Args:
+        argv: Command line arguments, including the program name
+
+    Returns:
+        The parsed options, and the remaining arguments for Qt
+    """
+    parser = argparse.ArgumentParser(description="Smart Clock Dashboard")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="",
+        metavar="REPORT",
+        help="report import and construction times up to the first frame, "
+        "to a JSON file if given, otherwise to the log",
+    )
+    parser.add_argument(
+        "--eager-imports",
+        action="store_true",
+        help="import weather and network modules before the first frame",
+    )
+    return parser.parse_known_args(argv[1:])
 
 
 def main():
@@ -28,16 +56,55 @@ def main():
     - QApplication created first before any GUI objects
     - Proper use of sys.exit(app.exec()) for clean termination
     - Configuration loaded before window creation
+
+    Modules are imported inside the function, so startup profiling can
+    time them and only what the first frame needs is loaded before it.
     """
+    args, qt_args = parse_args(sys.argv)
+
+    profiler = None
+    if args.profile_startup is not None:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        profiler = StartupProfiler(
+            Path(args.profile_startup) if args.profile_startup else None
+        )
+        profiler.install()
+
     # Create the QApplication instance
-    app = QApplication(sys.argv)
+    with profile_phase(profiler, "import_qt"):
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtWidgets import QApplication
+    with profile_phase(profiler, "create_application"):
+        app = QApplication([sys.argv[0], *qt_args])
 
     # Load configuration (from environment or defaults)
-    config = Config.from_env()
+    with profile_phase(profiler, "load_config"):
+        from config.settings import Config
+
+        config = Config.from_env()
+        config.defer_imports = not args.eager_imports
 
     # Create and show the main window
-    window = ClockMainWindow(config)
-    window.show()
+    with profile_phase(profiler, "import_window"):
+        from smrtclk.views.main_window import ClockMainWindow
+    with profile_phase(profiler, "create_window"):
+        window = ClockMainWindow(config)
+    with profile_phase(profiler, "show_window"):
+        window.show()
+
+    if profiler is not None:
+
+        def finish_profile() -> None:
+            # Deferred imports run right after the first frame signal
+            profiler.mark("deferred_imports")
+            profiler.uninstall()
+            profiler.report()
+
+        def on_first_frame() -> None:
+            profiler.mark("first_frame")
+            QTimer.singleShot(0, finish_profile)
+
+        window.firstFramePainted.connect(on_first_frame)
 
     # Enter the event loop and exit properly
     sys.exit(app.exec())
@@ -1,6 +1,21 @@
 """Controllers package for Smart Clock Dashboard."""
 
-from .clock_controller import ClockController
-from .weather_controller import WeatherController
+from typing import TYPE_CHECKING
 
-__all__ = ["ClockController", "WeatherController"]
+from smrtclk.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .clock_controller import ClockController
+    from .weather_controller import WeatherController
+
+# Public names and the submodules defining them. Submodules are imported on
+# first access, so the clock does not pay for the weather controller's
+# QtNetwork and requests imports at startup.
+_EXPORTS = {
+    "ClockController": ".clock_controller",
+    "WeatherController": ".weather_controller",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
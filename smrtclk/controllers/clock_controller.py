@@ -1,10 +1,18 @@
 """Clock controller for managing clock updates."""
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSlot
+from typing import TYPE_CHECKING
 
-from config.constants import CLOCK_UPDATE_INTERVAL
+from PyQt5.QtCore import QObject, pyqtSlot
+
+from config.constants import CLOCK_IDLE_UPDATE_INTERVAL, CLOCK_UPDATE_INTERVAL
 from smrtclk.models.clock_model import ClockModel
-from smrtclk.views.clock_widget import ClockWidget
+from smrtclk.profiling import TickProfiler, profile_stage
+
+from .tick_scheduler import TickScheduler
+
+if TYPE_CHECKING:
+    # Imported for annotations only; the views package imports this module
+    from smrtclk.views.clock_widget import ClockWidget
 
 
 class ClockController(QObject):
@@ -13,20 +21,34 @@ class ClockController(QObject):
 
     Connects the ClockModel to the ClockWidget, managing the timer
     for regular updates and signal/slot connections.
+
+    Ticks are aligned to wall-clock seconds. When the second hand is
+    hidden or the display is idle, ticks back off to whole minutes.
     """
 
-    def __init__(self, model: ClockModel, view: ClockWidget):
+    def __init__(
+        self,
+        model: ClockModel,
+        view: "ClockWidget",
+        precise_timer: bool = True,
+        profiler: TickProfiler | None = None,
+    ):
         """
         Initialize the clock controller.
 
         Args:
             model: Clock model instance
             view: Clock widget instance
+            precise_timer: Use a precise timer for second-aligned ticks
+            profiler: Optional profiler recording tick timings
         """
         super().__init__()
         self.model = model
         self.view = view
-        self._timer = QTimer(self)
+        self._profiler = profiler
+        self._timer = TickScheduler(self, precise=precise_timer)
+        self._second_hand_visible = True
+        self._idle = False
 
         self._connectSignals()
         self._setupTimer()
@@ -43,7 +65,7 @@ class ClockController(QObject):
     def _setupTimer(self) -> None:
         """Configure and start the update timer."""
         self._timer.setInterval(CLOCK_UPDATE_INTERVAL)
-        self._timer.timeout.connect(self._onTimerTick)
+        self._timer.tick.connect(self._onTimerTick)
 
     def start(self) -> None:
         """Start the clock update timer."""
@@ -53,26 +75,78 @@ class ClockController(QObject):
         """Stop the clock update timer."""
         self._timer.stop()
 
+    def setSecondHandVisible(self, visible: bool) -> None:
+        """
+        Show or hide the second hand.
+
+        Args:
+            visible: Whether the second hand is shown
+        """
+        self._second_hand_visible = visible
+        self.view.setSecondHandVisible(visible)
+        self._updateInterval()
+
+    def setIdle(self, idle: bool) -> None:
+        """
+        Mark the display as idle or active.
+
+        Args:
+            idle: Whether the display is idle
+        """
+        self._idle = idle
+        self._updateInterval()
+
+    def jitterStats(self) -> dict[str, float]:
+        """
+        Get tick wakeup jitter statistics.
+
+        Returns:
+            Dictionary with 'last', 'mean' and 'max' jitter in ms and 'count'
+        """
+        return self._timer.jitterStats()
+
+    def _updateInterval(self) -> None:
+        """Pick second or minute aligned ticks based on display state."""
+        if self._second_hand_visible and not self._idle:
+            interval = CLOCK_UPDATE_INTERVAL
+        else:
+            interval = CLOCK_IDLE_UPDATE_INTERVAL
+
+        if interval == self._timer.interval:
+            return
+        self._timer.setInterval(interval)
+        # Bring the hands up to date immediately after switching
+        if self._timer.isActive():
+            self.model.update_time()
+
     @pyqtSlot()
     def _onTimerTick(self) -> None:
         """Handle timer tick event."""
+        if self._profiler is not None:
+            self._profiler.begin_tick()
+
         # Update model, which will emit signals to update the view
         self.model.update_time()
 
+        if self._profiler is not None:
+            self._profiler.end_tick()
+
     @pyqtSlot()
     def _updateSecondHand(self) -> None:
         """Update the second hand position."""
-        angle = self.model.calculate_hand_angle("sec")
+        with profile_stage(self._profiler, "angle_calc"):
+            angle = self.model.calculate_hand_angle("sec")
         self.view.updateHand("sec", angle)
 
     @pyqtSlot()
     def _updateMinuteHand(self) -> None:
         """Update the minute and hour hand positions."""
+        with profile_stage(self._profiler, "angle_calc"):
+            min_angle = self.model.calculate_hand_angle("min")
+            hour_angle = self.model.calculate_hand_angle("hour")
         # Update minute hand
-        min_angle = self.model.calculate_hand_angle("min")
         self.view.updateHand("min", min_angle)
         # Update hour hand
-        hour_angle = self.model.calculate_hand_angle("hour")
         self.view.updateHand("hour", hour_angle)
 
     @pyqtSlot()
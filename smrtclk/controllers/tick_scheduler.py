@@ -0,0 +1,146 @@
+"""Wall-clock aligned tick scheduler."""
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
+
+from config.constants import CLOCK_TICK_SLACK, CLOCK_UPDATE_INTERVAL
+
+# Number of recent ticks kept for jitter statistics
+JITTER_WINDOW = 60
+
+
+class TickScheduler(QObject):
+    """
+    Timer that fires just after each wall-clock interval boundary.
+
+    Instead of a free-running repeating timer, which drifts against the
+    system clock, a single-shot timer is re-armed after every tick to the
+    next boundary (e.g. the next whole second or minute). The difference
+    between each boundary and the actual wakeup is recorded as jitter.
+
+    Signals:
+        tick: Emitted once per interval boundary
+    """
+
+    # Signals
+    tick = pyqtSignal()
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        interval: int = CLOCK_UPDATE_INTERVAL,
+        precise: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the tick scheduler.
+
+        Args:
+            parent: Parent object
+            interval: Tick interval in milliseconds; ticks align to its multiples
+            precise: Use a precise timer rather than a coarse one
+            clock: Wall-clock source returning seconds since the epoch
+        """
+        super().__init__(parent)
+        self._interval = interval
+        self._clock = clock
+        self._target: float | None = None
+        self._jitter: deque[float] = deque(maxlen=JITTER_WINDOW)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(
+            Qt.PreciseTimer if precise else Qt.CoarseTimer  # ty: ignore[unresolved-attribute]
+        )
+        self._timer.timeout.connect(self._onTimeout)
+
+    @property
+    def interval(self) -> int:
+        """Get the tick interval in milliseconds."""
+        return self._interval
+
+    def setInterval(self, interval: int) -> None:
+        """
+        Change the tick interval, re-arming the timer if it is running.
+
+        Args:
+            interval: Tick interval in milliseconds
+        """
+        if interval == self._interval:
+            return
+        self._interval = interval
+        if self.isActive():
+            self._arm()
+
+    def isActive(self) -> bool:
+        """Check whether the scheduler is running."""
+        return self._timer.isActive()
+
+    def start(self) -> None:
+        """Start ticking at the next interval boundary."""
+        self._arm()
+
+    def stop(self) -> None:
+        """Stop ticking."""
+        self._timer.stop()
+        self._target = None
+
+    def jitterStats(self) -> dict[str, float]:
+        """
+        Get wakeup jitter statistics over recent ticks.
+
+        Jitter is the delay between the interval boundary and the time the
+        tick was actually delivered, in milliseconds.
+
+        Returns:
+            Dictionary with 'last', 'mean' and 'max' jitter and 'count'
+        """
+        if not self._jitter:
+            return {"count": 0, "last": 0.0, "mean": 0.0, "max": 0.0}
+        return {
+            "count": len(self._jitter),
+            "last": self._jitter[-1],
+            "mean": sum(self._jitter) / len(self._jitter),
+            "max": max(self._jitter),
+        }
+
+    def _arm(self) -> None:
+        """Arm the timer for the next interval boundary."""
+        interval = self._interval / 1000.0
+        now = self._clock()
+        self._target = (math.floor(now / interval) + 1) * interval
+
+        self._timer.start(self._delayUntilTarget(now))
+
+    def _delayUntilTarget(self, now: float) -> int:
+        """Get the timer delay in milliseconds to just past the target."""
+        # Tolerate float error so an exact millisecond isn't rounded up
+        delay = math.ceil((self._target - now) * 1000 - 1e-6)
+        # Wake slightly after the boundary so the new interval has begun
+        return max(delay, 0) + CLOCK_TICK_SLACK
+
+    @pyqtSlot()
+    def _onTimeout(self) -> None:
+        """Handle timer expiry, emitting a tick if the boundary has passed."""
+        if self._target is None:
+            return
+
+        now = self._clock()
+        if self._target - now > self._interval / 1000.0:
+            # The wall clock stepped back (e.g. NTP correction); re-align to
+            # it instead of waiting for it to catch up with the old target
+            self._arm()
+            self.tick.emit()
+            return
+        if now < self._target:
+            # Woke up early; wait for the rest of the interval
+            self._timer.start(self._delayUntilTarget(now))
+            return
+
+        self._jitter.append((now - self._target) * 1000.0)
+        self._arm()
+        self.tick.emit()
@@ -1,11 +1,71 @@
 """Weather controller for managing weather API updates."""
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSlot
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply
+import logging
+import math
+import time
+from collections.abc import Callable
 
-from config.constants import WEATHER_UPDATE_INTERVAL
-from smrtclk.models.weather_model import WeatherModel
+from PyQt5.QtCore import (
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+from config.constants import WEATHER_REQUEST_TIMEOUT, WEATHER_UPDATE_INTERVAL
+from smrtclk.models.weather_model import WeatherData, WeatherModel
 from smrtclk.views.weather_widget import WeatherWidget
+from smrtclk.weather.json_decoder import loads
+from smrtclk.weather.nws_forecast import ForecastSeries
+from smrtclk.weather.poll_scheduler import PollScheduler, expiry_time
+from smrtclk.weather.retry import RetryBudget, RetryPolicy, parse_retry_after
+from smrtclk.weather.weather_api_nws import (
+    USER_AGENT,
+    WeatherAPINWS,
+    forecast_update_time,
+    summarize_forecast,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _ParseSignals(QObject):
+    """Signals reporting the outcome of a background parse."""
+
+    parsed = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _ParseTask(QRunnable):
+    """Decode and parse a forecast response off the GUI thread."""
+
+    def __init__(self, generation: int, data: bytes, parser: Callable[[dict], object]):
+        """
+        Initialize the parse task.
+
+        Args:
+            generation: Fetch generation the response belongs to
+            data: Raw response body
+            parser: Function converting the decoded JSON to the result
+        """
+        super().__init__()
+        self.signals = _ParseSignals()
+        self._generation = generation
+        self._data = data
+        self._parser = parser
+
+    def run(self) -> None:
+        """Decode and parse the response, emitting the result."""
+        try:
+            result = self._parser(loads(self._data))
+        except Exception as e:
+            self.signals.failed.emit(self._generation, str(e))
+            return
+        self.signals.parsed.emit(self._generation, result)
 
 
 class WeatherController(QObject):
@@ -14,6 +74,21 @@ class WeatherController(QObject):
 
     Handles weather API requests, parses responses, updates the model,
     and coordinates view updates. Implements retry logic and error handling.
+
+    Requests run asynchronously on the Qt event loop: the NWS points lookup
+    (only until the grid location is known) is chained to the forecast
+    request, and the forecast is decoded and parsed in a worker thread, so
+    network I/O never blocks the GUI thread.
+
+    Fetches are not polled at a fixed interval: after each forecast, the
+    next fetch is planned from the response's Cache-Control or Expires
+    header and the forecast's update time. Failed requests are retried with
+    backoff, honoring Retry-After, within the retry policy's deadline; once
+    it is used up the fetch is tried again after WEATHER_UPDATE_INTERVAL.
+
+    Between fetches, the forecast periods are summarized again whenever a
+    new period or local day starts, so the current values and the daily
+    range shown stay current.
     """
 
     def __init__(self, model: WeatherModel, view: WeatherWidget, config):
@@ -31,21 +106,42 @@ class WeatherController(QObject):
         self.config = config
 
         self._timer = QTimer(self)
+        self._summary_timer = QTimer(self)
         self._network_manager = QNetworkAccessManager(self)
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+
+        # NWS API used for URLs, the grid location cache and parsing
+        self._api = WeatherAPINWS(float(config.latitude), float(config.longitude))
+        # In-flight replies and the handler for each one
+        self._pending: dict[QNetworkReply, Callable[[QNetworkReply], None]] = {}
+        # Bumped on stop() so late parse results are dropped
+        self._generation = 0
+        # Plans the next fetch, and the expiry of the forecast being parsed
+        self._poll_scheduler = PollScheduler()
+        self._forecast_expires: float | None = None
+        # Retries of the current fetch, None when no fetch is failing
+        self._retry_policy = RetryPolicy()
+        self._retry: RetryBudget | None = None
+        # Periods of the last forecast, summarized again as time passes
+        self._forecast_series: ForecastSeries | None = None
 
         self._connectSignals()
         self._setupTimer()
 
     def _connectSignals(self) -> None:
         """Connect model signals to view update methods."""
-        # TODO: Connect model.weatherUpdated to view update methods
-        # TODO: Connect network manager finished signal
-        pass
+        self.model.weatherUpdated.connect(self._updateWeatherDisplay)
+        self._network_manager.finished.connect(self._onReplyFinished)
 
     def _setupTimer(self) -> None:
-        """Configure and start the weather update timer."""
+        """Configure the weather update timer."""
+        # Restarted after each fetch with the planned delay
+        self._timer.setSingleShot(True)
         self._timer.setInterval(WEATHER_UPDATE_INTERVAL)
         self._timer.timeout.connect(self._onTimerTick)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.timeout.connect(self._onSummaryDue)
 
     def start(self) -> None:
         """Start the weather update timer and fetch initial data."""
@@ -53,14 +149,71 @@ class WeatherController(QObject):
         self.fetchWeather()
 
     def stop(self) -> None:
-        """Stop the weather update timer."""
+        """Stop the weather update timer and cancel in-flight requests."""
         self._timer.stop()
+        self._summary_timer.stop()
+        self._generation += 1
+        self._retry = None
+
+        pending = list(self._pending)
+        self._pending.clear()
+        for reply in pending:
+            reply.abort()
+
+        self._api.close()
+
+    def isFetching(self) -> bool:
+        """Check whether a fetch is in progress."""
+        return bool(self._pending)
+
+    def nextFetchIn(self) -> int:
+        """Get the milliseconds until the next planned fetch, or -1 if none."""
+        return self._timer.remainingTime()
+
+    def _scheduleFetch(self, delay: int = WEATHER_UPDATE_INTERVAL) -> None:
+        """
+        Plan the next fetch.
+
+        Args:
+            delay: Milliseconds until the fetch
+        """
+        logger.debug(f"Next weather fetch in {delay / 1000:.0f}s")
+        self._timer.start(max(0, delay))
 
     def fetchWeather(self) -> None:
         """Fetch weather data from API."""
-        # TODO: Create API request with lat/lon from config
-        # TODO: Send request using network manager
-        pass
+        if self._pending:
+            logger.debug("Weather fetch already in progress")
+            return
+        if self._retry is None:
+            self._retry = self._retry_policy.start()
+
+        location = self._api.location
+        if location is None:
+            self._get(self._api.points_url(), self._onPointsResponse)
+        else:
+            self._get(self._api.forecast_url(location), self._onWeatherResponse)
+
+    def _get(self, url: str, handler: Callable[[QNetworkReply], None]) -> None:
+        """
+        Send a GET request and register its reply handler.
+
+        Args:
+            url: URL to request
+            handler: Slot called with the reply once it succeeds
+        """
+        request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"User-Agent", USER_AGENT.encode())
+        request.setRawHeader(b"Accept", b"application/geo+json")
+        # Never wait for a reply past the fetch's retry deadline
+        timeout = WEATHER_REQUEST_TIMEOUT
+        if self._retry is not None:
+            timeout = min(timeout, max(1, int(self._retry.remaining() * 1000)))
+        request.setTransferTimeout(timeout)
+
+        logger.debug(f"Requesting {url}")
+        reply = self._network_manager.get(request)
+        self._pending[reply] = handler
 
     @pyqtSlot()
     def _onTimerTick(self) -> None:
@@ -68,6 +221,42 @@ class WeatherController(QObject):
         self.fetchWeather()
 
     @pyqtSlot(QNetworkReply)
+    def _onReplyFinished(self, reply: QNetworkReply) -> None:
+        """
+        Dispatch a finished reply to its handler.
+
+        Args:
+            reply: Network reply object
+        """
+        reply.deleteLater()
+        handler = self._pending.pop(reply, None)
+        if handler is None:
+            # Cancelled by stop()
+            return
+
+        if reply.error() != QNetworkReply.NoError:
+            self._handleNetworkError(reply)
+            return
+
+        handler(reply)
+
+    def _onPointsResponse(self, reply: QNetworkReply) -> None:
+        """
+        Handle the points lookup and chain the forecast request.
+
+        Args:
+            reply: Network reply object
+        """
+        try:
+            location = self._api.resolve_location(loads(bytes(reply.readAll())))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Invalid NWS points response: {e}")
+            self._retry = None
+            self._scheduleFetch()
+            return
+
+        self._get(self._api.forecast_url(location), self._onWeatherResponse)
+
     def _onWeatherResponse(self, reply: QNetworkReply) -> None:
         """
         Handle weather API response.
@@ -75,25 +264,141 @@ class WeatherController(QObject):
         Args:
             reply: Network reply object
         """
-        # TODO: Check for errors
-        # TODO: Parse JSON response
-        # TODO: Update model with parsed data
-        pass
+        headers = {
+            bytes(name).decode("latin-1"): bytes(value).decode("latin-1")
+            for name, value in reply.rawHeaderPairs()
+        }
+        self._forecast_expires = expiry_time(headers)
+        task = _ParseTask(self._generation, bytes(reply.readAll()), self._parseForecast)
+        task.signals.parsed.connect(self._onWeatherParsed)
+        task.signals.failed.connect(self._onWeatherParseFailed)
+        self._thread_pool.start(task)
+
+    def _parseForecast(
+        self, raw_data: dict
+    ) -> tuple[WeatherData, float | None, ForecastSeries]:
+        """
+        Parse a forecast and get its update time.
+
+        Args:
+            raw_data: Decoded forecast response
+
+        Returns:
+            Parsed weather data, the forecast's update time, if known, and
+            the forecast periods
+        """
+        series = ForecastSeries.from_payload(raw_data)
+        weather_data = self._summarize(series)
+        return weather_data, forecast_update_time(raw_data), series
+
+    def _summarize(self, series: ForecastSeries) -> WeatherData:
+        """
+        Summarize forecast periods for the current time.
+
+        Args:
+            series: Forecast periods
+
+        Returns:
+            Weather data for the current period and local day
+        """
+        return summarize_forecast(
+            series, self._api.latitude, self._api.longitude
+        ).with_status("ok")
+
+    def _scheduleSummary(self, now: float) -> None:
+        """
+        Plan summarizing the forecast again when its summary changes.
+
+        Args:
+            now: Current time in seconds since the epoch
+        """
+        delay = self._forecast_series.next_change(now) - now
+        self._summary_timer.start(max(0, math.ceil(delay * 1000)))
+
+    @pyqtSlot(int, object)
+    def _onWeatherParsed(
+        self,
+        generation: int,
+        result: tuple[WeatherData, float | None, ForecastSeries],
+    ) -> None:
+        """
+        Feed parsed weather data to the model and plan the next fetch.
+
+        Args:
+            generation: Fetch generation the data belongs to
+            result: Parsed weather data, the forecast's update time and
+                the forecast periods
+        """
+        if generation != self._generation:
+            return
+        weather_data, updated_at, self._forecast_series = result
+        self._retry = None
+        self.model.update_from_api_response(weather_data)
+
+        now = time.time()
+        self._scheduleSummary(now)
+        planned = self._poll_scheduler.plan(
+            now, WEATHER_UPDATE_INTERVAL / 1000, self._forecast_expires, updated_at
+        )
+        self._scheduleFetch(int((planned - now) * 1000))
 
     @pyqtSlot()
-    def _updateWeatherDisplay(self) -> None:
-        """Update weather widget with current model data."""
-        # TODO: Extract data from model
-        # TODO: Update view temperature, precipitation, sun times
-        pass
+    def _onSummaryDue(self) -> None:
+        """Update the model from the forecast periods at the current time."""
+        if self._forecast_series is None:
+            return
+        self.model.update_from_api_response(self._summarize(self._forecast_series))
+        self._scheduleSummary(time.time())
+
+    @pyqtSlot(int, str)
+    def _onWeatherParseFailed(self, generation: int, message: str) -> None:
+        """
+        Log a forecast that could not be parsed.
+
+        Args:
+            generation: Fetch generation the data belongs to
+            message: Error message
+        """
+        if generation != self._generation:
+            return
+        logger.error(f"Invalid NWS forecast response: {message}")
+        self._retry = None
+        self._scheduleFetch()
+
+    @pyqtSlot(WeatherData)
+    def _updateWeatherDisplay(self, data: WeatherData) -> None:
+        """
+        Update weather widget with current model data.
 
-    def _handleNetworkError(self, error: QNetworkReply.NetworkError) -> None:
+        Args:
+            data: Updated weather data
         """
-        Handle network errors with logging.
+        self.view.updateTemperature(
+            data.temperature, data.temperature_min, data.temperature_max
+        )
+        self.view.updatePrecipitation(data.precipitation, data.precipitation_max)
+        self.view.updateSunTimes(*self.model.sun_times())
+
+    def _handleNetworkError(self, reply: QNetworkReply) -> None:
+        """
+        Retry a failed request, or give up until the next planned fetch.
 
         Args:
-            error: Network error code
+            reply: Failed network reply
         """
-        # TODO: Log error
-        # TODO: Implement retry logic with exponential backoff
-        pass
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        retry_after = parse_retry_after(
+            bytes(reply.rawHeader(b"Retry-After")).decode("latin-1") or None
+        )
+        delay = None
+        if self._retry is not None:
+            delay = self._retry.next_delay(status, retry_after)
+
+        error = f"HTTP {status}" if status else f"network error {int(reply.error())}"
+        if delay is None:
+            logger.warning(f"Weather request failed with {error}")
+            self._retry = None
+            self._scheduleFetch()
+            return
+        logger.info(f"Weather request failed with {error}, retrying in {delay:.1f}s")
+        self._scheduleFetch(int(delay * 1000))
@@ -0,0 +1,40 @@
+"""Package exports imported on first access (PEP 562)."""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module __getattr__ and __dir__ of a package with lazy exports.
+
+    The submodule defining an export is imported when the export is first
+    accessed, and the value is then stored in the package namespace so
+    later accesses skip __getattr__.
+
+    Args:
+        package: Name of the package, i.e. its __name__
+        exports: Public names mapped to the relative names of the submodules
+            defining them
+
+    Returns:
+        The package's __getattr__ and __dir__ functions
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,9 +1,12 @@
 """Clock model for managing time and clock state."""
 
 import datetime
+from collections.abc import Callable
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from smrtclk.profiling import TickProfiler, profile_stage
+
 
 class ClockModel(QObject):
     """
@@ -23,10 +26,22 @@ class ClockModel(QObject):
     minuteChanged = pyqtSignal(datetime.datetime)
     dayChanged = pyqtSignal(datetime.datetime)
 
-    def __init__(self):
-        """Initialize the clock model."""
+    def __init__(
+        self,
+        profiler: TickProfiler | None = None,
+        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        """
+        Initialize the clock model.
+
+        Args:
+            profiler: Optional profiler recording model update timings
+            clock: Source of the current local time
+        """
         super().__init__()
-        self._current_time: datetime.datetime = datetime.datetime.now()
+        self._profiler = profiler
+        self._clock = clock
+        self._current_time: datetime.datetime = clock()
         self._last_minute: int = -1
         self._last_day: int = -1
 
@@ -52,17 +67,23 @@ class ClockModel(QObject):
         Emits timeChanged always, minuteChanged when minute changes,
         and dayChanged when day changes.
         """
-        self._current_time = datetime.datetime.now()
-        self.timeChanged.emit(self._current_time)
+        with profile_stage(self._profiler, "model_update"):
+            self._current_time = self._clock()
 
-        # Check if minute has changed
-        if self._current_time.minute != self._last_minute:
-            self._last_minute = self._current_time.minute
-            self.minuteChanged.emit(self._current_time)
+            # Check if minute has changed
+            minute_changed = self._current_time.minute != self._last_minute
+            if minute_changed:
+                self._last_minute = self._current_time.minute
+
+            # Check if day has changed
+            day_changed = self._current_time.day != self._last_day
+            if day_changed:
+                self._last_day = self._current_time.day
 
-        # Check if day has changed
-        if self._current_time.day != self._last_day:
-            self._last_day = self._current_time.day
+        self.timeChanged.emit(self._current_time)
+        if minute_changed:
+            self.minuteChanged.emit(self._current_time)
+        if day_changed:
             self.dayChanged.emit(self._current_time)
 
     def calculate_hand_angle(self, hand_type: str) -> float:
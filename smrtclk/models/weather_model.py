@@ -1,33 +1,22 @@
 """Weather model for managing weather data."""
 
 import datetime
-from dataclasses import dataclass
+from collections.abc import Mapping
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from smrtclk.weather.weather_api import WeatherData
 
-@dataclass
-class WeatherData:
-    """
-    Data class for weather information.
-
-    Attributes:
-        current_temp: Current temperature in Fahrenheit
-        min_temp: Minimum temperature for the day
-        max_temp: Maximum temperature for the day
-        current_precipitation: Current precipitation probability (0-100)
-        max_precipitation: Maximum precipitation probability for the day
-        sunrise: Sunrise time
-        sunset: Sunset time
-    """
-
-    current_temp: float
-    min_temp: float
-    max_temp: float
-    current_precipitation: int
-    max_precipitation: int
-    sunrise: datetime.datetime
-    sunset: datetime.datetime
+# Keys a weather API response must contain to update the model
+REQUIRED_KEYS = (
+    "temperature",
+    "temperature_min",
+    "temperature_max",
+    "precipitation",
+    "precipitation_max",
+    "sunrise",
+    "sunset",
+)
 
 
 class WeatherModel(QObject):
@@ -53,25 +42,59 @@ class WeatherModel(QObject):
         """Get current weather data."""
         return self._weather_data
 
-    def update_from_api_response(self, response_data: dict) -> None:
+    def update_from_api_response(self, response_data: Mapping) -> None:
         """
-        Parse and update weather data from API response.
+        Update weather data from an API response.
+
+        The immutable record returned by the weather API is stored as is;
+        other mappings are converted to one. Invalid or error responses are
+        ignored, keeping the previous data.
 
         Args:
-            response_data: Dictionary containing weather API response
+            response_data: WeatherData record or mapping with the same keys
         """
-        # TODO: Implement parsing of API response
-        pass
+        if not self.validate_data(response_data):
+            return
+
+        self._weather_data = WeatherData.from_mapping(response_data)
+        self.weatherUpdated.emit(self._weather_data)
 
-    def validate_data(self, data: dict) -> bool:  # noqa: ARG002
+    def sun_times(self) -> tuple[datetime.datetime, datetime.datetime] | None:
+        """
+        Get today's sunrise and sunset from the current weather data.
+
+        Returns:
+            Sunrise and sunset times, or None if there is no weather data
+        """
+        if self._weather_data is None:
+            return None
+        today = datetime.date.today()
+        return (
+            datetime.datetime.combine(
+                today, datetime.time.fromisoformat(self._weather_data.sunrise)
+            ),
+            datetime.datetime.combine(
+                today, datetime.time.fromisoformat(self._weather_data.sunset)
+            ),
+        )
+
+    def validate_data(self, data: Mapping) -> bool:
         """
         Validate weather data structure.
 
         Args:
-            data: Dictionary to validate
+            data: WeatherData record or mapping to validate
 
         Returns:
             True if data is valid, False otherwise
         """
-        # TODO: Implement validation logic
-        return False
+        if data.get("status") == "error":
+            return False
+        if any(data.get(key) is None for key in REQUIRED_KEYS):
+            return False
+        try:
+            datetime.time.fromisoformat(data["sunrise"])
+            datetime.time.fromisoformat(data["sunset"])
+        except (TypeError, ValueError):
+            return False
+        return True
@@ -0,0 +1,12 @@
+"""Profiling package for Smart Clock Dashboard."""
+
+from .startup_profiler import StartupProfiler, profile_phase
+from .tick_profiler import TICK_STAGES, TickProfiler, profile_stage
+
+__all__ = [
+    "TICK_STAGES",
+    "TickProfiler",
+    "profile_stage",
+    "StartupProfiler",
+    "profile_phase",
+]
@@ -0,0 +1,222 @@
+"""Import and construction timing from launch to the first frame."""
+
+import importlib.abc
+import json
+import logging
+import sys
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Number of slowest imports included in a report
+STARTUP_REPORT_IMPORTS = 25
+
+
+def profile_phase(
+    profiler: "StartupProfiler | None", name: str
+) -> AbstractContextManager:
+    """
+    Get a context manager timing a startup phase, or a no-op if disabled.
+
+    Args:
+        profiler: Profiler to record into, or None if profiling is disabled
+        name: Name of the phase
+
+    Returns:
+        Context manager timing the enclosed block
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """Loader wrapper timing the execution of a module."""
+
+    def __init__(self, loader: importlib.abc.Loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Hide the wrapper from the module and anything inspecting it later
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.importing(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder wrapping the loaders of newly imported modules."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path, target=None):
+        # Ask the finders after this one, as the import system would
+        finders = sys.meta_path[sys.meta_path.index(self) + 1 :]
+        for finder in finders:
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Opt-in profiler for application startup.
+
+    While installed, records how long each newly imported module takes to
+    execute, both on its own and including the imports it triggers. Named
+    phases time construction steps, and marks record the time since the
+    profiler was created (e.g. when the first frame was painted).
+    """
+
+    def __init__(self, report_path: Path | None = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            report_path: JSON file for the report; logged if None
+        """
+        self.report_path = report_path
+
+        self._start = time.perf_counter_ns()
+        self._finder = _TimingFinder(self)
+        # Per module: (time including nested imports, time excluding them)
+        self._imports: dict[str, tuple[int, int]] = {}
+        # Nested import time accumulated by each module being imported
+        self._stack: list[int] = []
+        self._phases: dict[str, int] = {}
+        self._marks: dict[str, int] = {}
+
+    @property
+    def installed(self) -> bool:
+        """Check whether imports are being timed."""
+        return self._finder in sys.meta_path
+
+    def install(self) -> None:
+        """Start timing imports."""
+        if not self.installed:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self.installed:
+            sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def importing(self, module: str):
+        """
+        Time the execution of a module.
+
+        Args:
+            module: Name of the module being executed
+        """
+        self._stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            total = time.perf_counter_ns() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self._imports[module] = (total, total - nested)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a startup phase.
+
+        Args:
+            name: Name of the phase
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._phases[name] = (
+                self._phases.get(name, 0) + time.perf_counter_ns() - start
+            )
+
+    def mark(self, name: str) -> None:
+        """
+        Record the time since startup of an event.
+
+        Args:
+            name: Name of the event
+        """
+        self._marks[name] = time.perf_counter_ns() - self._start
+
+    def summary(self, top: int = STARTUP_REPORT_IMPORTS) -> dict:
+        """
+        Summarize the recorded startup timings.
+
+        Args:
+            top: Number of slowest imports to include
+
+        Returns:
+            Marks and phases, the number of modules imported and their total
+            import time, and the slowest imports by time including nested
+            imports, with times in milliseconds
+        """
+        slowest = sorted(self._imports.items(), key=lambda item: -item[1][0])[:top]
+        return {
+            "marks": {name: ns / 1e6 for name, ns in self._marks.items()},
+            "phases": {name: ns / 1e6 for name, ns in self._phases.items()},
+            "modules": len(self._imports),
+            # Self times add up without counting nested imports twice
+            "import_total": sum(own for _, own in self._imports.values()) / 1e6,
+            "imports": [
+                {"module": module, "total": total / 1e6, "self": own / 1e6}
+                for module, (total, own) in slowest
+            ],
+        }
+
+    def dump(self, path: Path) -> None:
+        """
+        Write the summary to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        report = {"timestamp": time.time(), **self.summary()}
+        Path(path).write_text(json.dumps(report, indent=2))
+
+    def log_summary(self) -> None:
+        """Write the summary to the log."""
+        summary = self.summary()
+        for name, ms in summary["marks"].items():
+            logger.info(f"{name}: {ms:.1f}ms after start")
+        for name, ms in summary["phases"].items():
+            logger.info(f"phase {name}: {ms:.1f}ms")
+        logger.info(
+            f"imports: {summary['modules']} modules in {summary['import_total']:.1f}ms"
+        )
+        for entry in summary["imports"]:
+            logger.info(
+                f"  {entry['total']:8.1f}ms total {entry['self']:8.1f}ms self  "
+                f"{entry['module']}"
+            )
+
+    def report(self) -> None:
+        """Report the summary to the configured file, or the log."""
+        if self.report_path is not None:
+            self.dump(self.report_path)
+        else:
+            self.log_summary()
@@ -0,0 +1,216 @@
+"""Per-stage timing of clock ticks."""
+
+import json
+import logging
+import time
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+
+from config.constants import TICK_PROFILE_CAPACITY
+
+logger = logging.getLogger(__name__)
+
+# Stages recorded during a tick, in pipeline order
+TICK_STAGES = (
+    "model_update",  # ClockModel time and state update
+    "angle_calc",  # Hand angle calculation in the controller
+    "pixmap_transform",  # Scaling and rotating hand pixmaps
+    "geometry_set",  # Setting hand label pixmaps and geometry
+    "paint",  # Painting the clock face or hands
+    "tick",  # Whole tick from timer to last view update
+    "tick_to_paint",  # From start of tick until the next paint finishes
+)
+
+# Shared no-op context used when profiling is disabled
+_NULL_STAGE = nullcontext()
+
+
+def profile_stage(
+    profiler: "TickProfiler | None", stage: str
+) -> AbstractContextManager:
+    """
+    Get a context manager timing a stage, or a no-op if profiling is off.
+
+    Args:
+        profiler: Profiler to record into, or None if profiling is disabled
+        stage: Name of the stage
+
+    Returns:
+        Context manager timing the enclosed block
+    """
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.stage(stage)
+
+
+class _StageTimer:
+    """Context manager recording the duration of a block into a profiler."""
+
+    __slots__ = ("_profiler", "_stage", "_start")
+
+    def __init__(self, profiler: "TickProfiler", stage: str):
+        self._profiler = profiler
+        self._stage = stage
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.record(self._stage, time.perf_counter_ns() - self._start)
+
+
+class TickProfiler:
+    """
+    Opt-in profiler for the clock tick pipeline.
+
+    Keeps the most recent timings of each stage in fixed-size ring buffers
+    and summarizes them as percentiles. Summaries can be written to a JSON
+    file or the log, either on demand or every N ticks.
+    """
+
+    def __init__(
+        self,
+        capacity: int = TICK_PROFILE_CAPACITY,
+        report_every: int = 0,
+        report_path: Path | None = None,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity: Number of samples kept per stage
+            report_every: Report a summary every N ticks (0 disables)
+            report_path: JSON file for periodic reports; logged if None
+        """
+        self.capacity = capacity
+        self.report_every = report_every
+        self.report_path = report_path
+
+        self._samples: dict[str, deque[int]] = {
+            stage: deque(maxlen=capacity) for stage in TICK_STAGES
+        }
+        self._tick_count = 0
+        self._tick_start: int | None = None
+        self._paint_pending = False
+
+    @property
+    def tick_count(self) -> int:
+        """Get the number of ticks profiled so far."""
+        return self._tick_count
+
+    def stage(self, stage: str) -> _StageTimer:
+        """
+        Get a context manager that times a stage.
+
+        Args:
+            stage: Name of the stage
+
+        Returns:
+            Context manager recording the enclosed block's duration
+        """
+        return _StageTimer(self, stage)
+
+    def record(self, stage: str, duration_ns: int) -> None:
+        """
+        Record a stage duration.
+
+        Args:
+            stage: Name of the stage
+            duration_ns: Duration in nanoseconds
+        """
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self.capacity)
+        samples.append(duration_ns)
+
+    def begin_tick(self) -> None:
+        """Mark the start of a tick."""
+        self._tick_start = time.perf_counter_ns()
+        self._paint_pending = True
+
+    def end_tick(self) -> None:
+        """Mark the end of a tick's synchronous updates."""
+        if self._tick_start is None:
+            return
+        self.record("tick", time.perf_counter_ns() - self._tick_start)
+
+        self._tick_count += 1
+        if self.report_every and self._tick_count % self.report_every == 0:
+            self.report()
+
+    def paint_done(self) -> None:
+        """Mark the end of a paint, closing the latency of a pending tick."""
+        if not self._paint_pending or self._tick_start is None:
+            return
+        self._paint_pending = False
+        self.record("tick_to_paint", time.perf_counter_ns() - self._tick_start)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize the recorded samples of each stage.
+
+        Returns:
+            Mapping of stage name to count, mean, p50, p95, p99 and max,
+            with times in milliseconds. Stages without samples are omitted.
+        """
+        result = {}
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[stage] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered) / 1e6,
+                "p50": _percentile(ordered, 50) / 1e6,
+                "p95": _percentile(ordered, 95) / 1e6,
+                "p99": _percentile(ordered, 99) / 1e6,
+                "max": ordered[-1] / 1e6,
+            }
+        return result
+
+    def dump(self, path: Path) -> None:
+        """
+        Write the summary to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        report = {
+            "timestamp": time.time(),
+            "ticks": self._tick_count,
+            "capacity": self.capacity,
+            "stages": self.summary(),
+        }
+        Path(path).write_text(json.dumps(report, indent=2))
+
+    def log_summary(self) -> None:
+        """Write the summary to the log."""
+        for stage, stats in self.summary().items():
+            logger.info(
+                f"{stage}: n={stats['count']} mean={stats['mean']:.3f}ms "
+                f"p50={stats['p50']:.3f}ms p95={stats['p95']:.3f}ms "
+                f"p99={stats['p99']:.3f}ms max={stats['max']:.3f}ms"
+            )
+
+    def report(self) -> None:
+        """Report the summary to the configured file, or the log."""
+        if self.report_path is not None:
+            self.dump(self.report_path)
+        else:
+            self.log_summary()
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        for samples in self._samples.values():
+            samples.clear()
+        self._tick_count = 0
+        self._tick_start = None
+        self._paint_pending = False
+
+
+def _percentile(ordered: list[int], percent: float) -> int:
+    """Get the nearest-rank percentile of pre-sorted samples."""
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
@@ -1,7 +1,22 @@
 """Views package for Smart Clock Dashboard."""
 
-from .clock_widget import ClockWidget
-from .main_window import ClockMainWindow
-from .weather_widget import WeatherWidget
+from typing import TYPE_CHECKING
 
-__all__ = ["ClockMainWindow", "ClockWidget", "WeatherWidget"]
+from smrtclk.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .clock_widget import ClockWidget
+    from .main_window import ClockMainWindow
+    from .weather_widget import WeatherWidget
+
+# Public names and the submodules defining them. Submodules are imported on
+# first access, so the main window does not import the weather widget.
+_EXPORTS = {
+    "ClockMainWindow": ".main_window",
+    "ClockWidget": ".clock_widget",
+    "WeatherWidget": ".weather_widget",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,224 @@
+"""Background decoding and caching of image assets."""
+
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QSize, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+# Image files preloaded from the images directory
+ASSET_PATTERN = "*.png"
+
+
+def asset_key(name: str, size: QSize | None = None) -> str:
+    """
+    Get the QPixmapCache key of an asset.
+
+    Args:
+        name: Image file name, relative to the images directory
+        size: Size the image is scaled to, or None for its natural size
+
+    Returns:
+        Cache key
+    """
+    if size is None:
+        return f"smrtclk:{name}"
+    return f"smrtclk:{name}@{size.width()}x{size.height()}"
+
+
+def decode_image(path: Path, size: QSize | None = None) -> QImage:
+    """
+    Decode and scale an image, ready to convert to a pixmap.
+
+    QImage is safe to use outside the GUI thread, unlike QPixmap.
+
+    Args:
+        path: Image file path
+        size: Size to scale the image to, or None to keep its natural size
+
+    Returns:
+        Decoded image, null if the file could not be read
+    """
+    image = QImage(str(path))
+    if image.isNull():
+        return image
+    if size is not None and image.size() != size:
+        image = image.scaled(
+            size,
+            Qt.IgnoreAspectRatio,  # ty: ignore[unresolved-attribute]
+            Qt.SmoothTransformation,  # ty: ignore[unresolved-attribute]
+        )
+    # The format pixmaps are drawn from fastest on raster surfaces
+    return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+
+class _DecodeSignals(QObject):
+    """Signals reporting a decoded image from a worker thread."""
+
+    decoded = pyqtSignal(str)
+
+
+class AssetManager(QObject):
+    """
+    Image assets decoded in worker threads and shared through QPixmapCache.
+
+    preload() starts decoding every image in the images directory, scaled
+    once to the size it is displayed at, while the window is built. Widgets
+    then get ready pixmaps with pixmap(), waiting only for images still being
+    decoded, and never rescale them when painting.
+
+    Signals:
+        assetsReady: Emitted when every preloaded image is in the cache
+    """
+
+    assetsReady = pyqtSignal()
+
+    def __init__(self, images_path: Path, parent: QObject | None = None):
+        """
+        Initialize the asset manager.
+
+        Args:
+            images_path: Directory holding the image files
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.images_path = images_path
+
+        # Python worker threads rather than a QThreadPool, whose destructor
+        # would wait for running decodes while holding the interpreter lock
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="assets"
+        )
+        # Not parented, so workers can still emit after the manager is deleted
+        self._signals = _DecodeSignals()
+        self._signals.decoded.connect(self._onDecoded)
+        # Decodes not yet added to the cache, by cache key
+        self._pending: dict[str, Future] = {}
+        # Cache space taken by each asset in KiB
+        self._cached_kib: dict[str, int] = {}
+        self._base_cache_limit = QPixmapCache.cacheLimit()
+
+    def preload(self, sizes: dict[str, QSize] | None = None) -> None:
+        """
+        Start decoding every image in the images directory.
+
+        Args:
+            sizes: Display sizes of images that are scaled when shown, by
+                file name; other images keep their natural size
+        """
+        sizes = sizes or {}
+        names = {path.name for path in self.images_path.glob(ASSET_PATTERN)}
+        for name in sorted(names | set(sizes)):
+            size = sizes.get(name)
+            key = asset_key(name, size)
+            if key in self._pending or self._find(key) is not None:
+                continue
+            future = self._executor.submit(decode_image, self.images_path / name, size)
+            future.add_done_callback(
+                lambda _, key=key, signals=self._signals: signals.decoded.emit(key)
+            )
+            self._pending[key] = future
+
+    @property
+    def pending(self) -> int:
+        """Get the number of images still being preloaded."""
+        return len(self._pending)
+
+    def pixmap(self, name: str, size: QSize | None = None) -> QPixmap:
+        """
+        Get an image as a pixmap.
+
+        Preloaded images are returned from the cache, waiting for their
+        decoding to finish if needed. Others are decoded on the spot.
+
+        Args:
+            name: Image file name, relative to the images directory
+            size: Size to scale the image to, or None for its natural size
+
+        Returns:
+            The pixmap, null if the image could not be read
+        """
+        key = asset_key(name, size)
+        pixmap = self._find(key)
+        if pixmap is not None:
+            return pixmap
+        if key in self._pending:
+            return self._insert(key)
+        return self._store(key, decode_image(self.images_path / name, size))
+
+    def wait(self) -> None:
+        """Wait until every preloaded image has been decoded and cached."""
+        wait(list(self._pending.values()))
+        # Decoded signals may still be queued; cache the images now instead
+        for key in list(self._pending):
+            self._insert(key)
+
+    def _find(self, key: str) -> QPixmap | None:
+        """
+        Look up a pixmap in the cache.
+
+        Args:
+            key: Cache key of the asset
+
+        Returns:
+            The cached pixmap, or None if it is not cached
+        """
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    @pyqtSlot(str)
+    def _onDecoded(self, key: str) -> None:
+        """
+        Add a decoded image to the cache.
+
+        Args:
+            key: Cache key of the asset
+        """
+        if key in self._pending:
+            self._insert(key)
+
+    def _insert(self, key: str) -> QPixmap:
+        """
+        Add a preloaded image to the cache, waiting for it to be decoded.
+
+        Args:
+            key: Cache key of the asset
+
+        Returns:
+            The cached pixmap
+        """
+        image = self._pending.pop(key).result()
+        pixmap = self._store(key, image)
+        if not self._pending:
+            self.assetsReady.emit()
+        return pixmap
+
+    def _store(self, key: str, image: QImage) -> QPixmap:
+        """
+        Convert an image to a pixmap and add it to the cache.
+
+        Args:
+            key: Cache key of the asset
+            image: Decoded image
+
+        Returns:
+            The pixmap, null if the image is
+        """
+        if image.isNull():
+            logger.warning(f"Failed to load image asset {key}")
+            return QPixmap()
+
+        pixmap = QPixmap.fromImage(image)
+        # Grow the cache so assets leave room for other cached pixmaps
+        self._cached_kib[key] = pixmap.width() * pixmap.height() * 4 // 1024 + 1
+        needed = self._base_cache_limit + sum(self._cached_kib.values())
+        if needed > QPixmapCache.cacheLimit():
+            QPixmapCache.setCacheLimit(needed)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
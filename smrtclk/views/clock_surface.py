@@ -0,0 +1,199 @@
+"""Custom-painted clock face and hands."""
+
+from PyQt5.QtCore import QPointF, QRect, Qt
+from PyQt5.QtGui import QPainter, QPaintEvent, QPixmap, QRegion, QTransform
+from PyQt5.QtWidgets import QWidget
+
+from smrtclk.profiling import TickProfiler, profile_stage
+
+# Order in which hands are painted (bottom to top)
+HAND_ORDER = ("hour", "min", "sec")
+
+
+class ClockSurface(QWidget):
+    """
+    Widget that paints the clock face and all hands in a single pass.
+
+    Hands are drawn with QPainter transforms instead of pre-rotated pixmaps
+    in separate labels, so moving a hand never changes widget geometry.
+    Only the region swept by a moving hand is scheduled for repaint.
+    """
+
+    def __init__(
+        self,
+        parent: QWidget,
+        face_pixmap: QPixmap | None,
+        profiler: TickProfiler | None = None,
+    ):
+        """
+        Initialize the clock surface.
+
+        Args:
+            parent: Parent widget
+            face_pixmap: Clock face image, scaled to the widget size; None to
+                paint only the hands over what is underneath
+            profiler: Optional profiler recording paint timings
+        """
+        super().__init__(parent)
+        self._profiler = profiler
+        self.setAttribute(Qt.WA_TranslucentBackground)  # ty: ignore[unresolved-attribute]
+
+        self._face_pixmap = face_pixmap
+        self._scaled_face: QPixmap | None = None
+
+        self._hand_pixmaps: dict[str, QPixmap] = {}
+        self._hand_bounds: dict[str, QRect] = {}
+        self._hand_angles: dict[str, float] = {}
+        self._hidden_hands: set[str] = set()
+
+    def setHandPixmap(self, hand_type: str, pixmap: QPixmap) -> None:
+        """
+        Set the image used to draw a hand.
+
+        The image is expected to span the full clock diameter vertically
+        with the hand pointing to 12 o'clock.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            pixmap: Hand image
+        """
+        self._hand_pixmaps[hand_type] = pixmap
+        # Track only the opaque part of the image for dirty region calculation
+        if pixmap.hasAlpha():
+            self._hand_bounds[hand_type] = QRegion(pixmap.mask()).boundingRect()
+        else:
+            self._hand_bounds[hand_type] = pixmap.rect()
+
+    def setHandAngle(self, hand_type: str, angle: float) -> None:
+        """
+        Move a hand and repaint the region it swept.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            angle: Angle in degrees
+        """
+        if hand_type not in self._hand_pixmaps:
+            return
+
+        old_angle = self._hand_angles.get(hand_type)
+        if old_angle == angle:
+            return
+        self._hand_angles[hand_type] = angle
+        if hand_type in self._hidden_hands:
+            return
+
+        dirty = QRegion(self.handRect(hand_type, angle))
+        if old_angle is not None:
+            dirty = dirty.united(QRegion(self.handRect(hand_type, old_angle)))
+        self.update(dirty)
+
+    def setHandVisible(self, hand_type: str, visible: bool) -> None:
+        """
+        Show or hide a hand.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            visible: Whether the hand is drawn
+        """
+        if visible == (hand_type not in self._hidden_hands):
+            return
+
+        if visible:
+            self._hidden_hands.discard(hand_type)
+        else:
+            self._hidden_hands.add(hand_type)
+
+        angle = self._hand_angles.get(hand_type)
+        if angle is not None:
+            self.update(self.handRect(hand_type, angle))
+
+    def handAngle(self, hand_type: str) -> float | None:
+        """
+        Get the current angle of a hand.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+
+        Returns:
+            Angle in degrees, or None if the hand has not been positioned
+        """
+        return self._hand_angles.get(hand_type)
+
+    def handRect(self, hand_type: str, angle: float) -> QRect:
+        """
+        Get the bounding rectangle covered by a hand at the given angle.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            angle: Angle in degrees
+
+        Returns:
+            Bounding rectangle in widget coordinates
+        """
+        transform = self._handTransform(hand_type, angle)
+        # Pad for antialiased edges
+        return transform.mapRect(self._hand_bounds[hand_type]).adjusted(-2, -2, 2, 2)
+
+    def _handTransform(self, hand_type: str, angle: float) -> QTransform:
+        """Build the transform from hand image to widget coordinates."""
+        pixmap = self._hand_pixmaps[hand_type]
+        center = QPointF(self.rect().center()) + QPointF(0.5, 0.5)
+
+        transform = QTransform()
+        transform.translate(center.x(), center.y())
+        transform.rotate(angle)
+        transform.scale(
+            float(self.width()) / pixmap.height(),
+            float(self.height()) / pixmap.height(),
+        )
+        transform.translate(-pixmap.width() / 2.0, -pixmap.height() / 2.0)
+        return transform
+
+    def resizeEvent(self, event) -> None:
+        """
+        Drop the scaled clock face so it is rebuilt at the new size.
+
+        Args:
+            event: Resize event
+        """
+        self._scaled_face = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paint the clock face and any hands within the dirty region.
+
+        Args:
+            event: Paint event
+        """
+        with profile_stage(self._profiler, "paint"):
+            self._paint(event)
+        if self._profiler is not None:
+            self._profiler.paint_done()
+
+    def _paint(self, event: QPaintEvent) -> None:
+        """Paint the face and hands within the event's dirty rectangle."""
+        if self._scaled_face is None and self._face_pixmap is not None:
+            self._scaled_face = self._face_pixmap.scaled(
+                self.size(),
+                Qt.IgnoreAspectRatio,  # ty: ignore[unresolved-attribute]
+                Qt.SmoothTransformation,  # ty: ignore[unresolved-attribute]
+            )
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        if self._scaled_face is not None:
+            painter.drawPixmap(event.rect(), self._scaled_face, event.rect())
+
+        dirty = event.rect()
+        for hand_type in HAND_ORDER:
+            angle = self._hand_angles.get(hand_type)
+            if angle is None or hand_type in self._hidden_hands:
+                continue
+            if not self.handRect(hand_type, angle).intersects(dirty):
+                continue
+
+            painter.setTransform(self._handTransform(hand_type, angle))
+            painter.drawPixmap(0, 0, self._hand_pixmaps[hand_type])
+
+        painter.end()
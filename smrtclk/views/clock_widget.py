@@ -1,8 +1,7 @@
 """Clock widget for displaying analog clock."""
 
-from PyQt5.QtCore import QRect, Qt
-from PyQt5.QtGui import QPixmap, QTransform
-from PyQt5.QtWidgets import QFrame, QLabel, QWidget
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtWidgets import QLabel, QWidget
 
 from config.constants import (
     CLOCK_CENTER_Y_RATIO,
@@ -13,45 +12,106 @@ from config.constants import (
     MINUTE_HAND_IMAGE,
     SECOND_HAND_IMAGE,
 )
+from smrtclk.profiling import TickProfiler, profile_stage
 
+from .asset_manager import AssetManager
+from .clock_surface import ClockSurface
+from .hand_cache import HandSpriteCache, render_hand
 from .styles import Styles
 
 
+class _HandLabel(QLabel):
+    """Label showing a clock hand that reports paint timings to a profiler."""
+
+    def __init__(self, parent: QWidget, profiler: TickProfiler | None):
+        """
+        Initialize the hand label.
+
+        Args:
+            parent: Parent widget
+            profiler: Optional profiler recording paint timings
+        """
+        super().__init__(parent)
+        self._profiler = profiler
+
+    def paintEvent(self, event) -> None:
+        """
+        Paint the hand, timing it if profiling is enabled.
+
+        Args:
+            event: Paint event
+        """
+        with profile_stage(self._profiler, "paint"):
+            super().paintEvent(event)
+        if self._profiler is not None:
+            self._profiler.paint_done()
+
+
 class ClockWidget(QWidget):
     """
     Widget for displaying an analog clock with date.
 
     Manages the clock face, hour/minute/second hands, and date display.
     Uses proper parent-child relationships for automatic memory management.
+
+    Two renderers are available, selected by ``config.clock_renderer``:
+    'labels' draws each hand as a rotated pixmap in its own QLabel, while
+    'painter' draws the face and hands on a single ClockSurface.
     """
 
-    def __init__(self, parent: QWidget, config):
+    def __init__(
+        self,
+        parent: QWidget,
+        config,
+        profiler: TickProfiler | None = None,
+        assets: AssetManager | None = None,
+        draw_face: bool = True,
+    ):
         """
         Initialize the clock widget.
 
         Args:
             parent: Parent widget
             config: Application configuration
+            profiler: Optional profiler recording transform and paint timings
+            assets: Image assets, loaded on demand from the configured images
+                path if None
+            draw_face: Draw the clock face; False when it is already painted
+                underneath, as part of a StaticLayer
         """
         super().__init__(parent)
         self.config = config
+        self._profiler = profiler
+        self._assets = assets or AssetManager(config.images_path, self)
+        self._draw_face = draw_face
+
+        self._renderer: str = config.clock_renderer
+        if self._renderer not in ("labels", "painter"):
+            raise ValueError(f"Invalid clock renderer '{self._renderer}'")
 
         self._clock_hands: dict = {}
-        self._clockface: QFrame = None
+        self._clockface: QWidget | None = None
         self._date_label: QLabel = None
+        self._hand_cache: HandSpriteCache | None = None
 
         self._createClockFace()
         self._createClockHands()
+        self._createHandCache()
         self._createDateDisplay()
 
-    def _createClockFace(self) -> None:
-        """Create the clock face background."""
-        height = self.config.height
-        width = self.config.width
+    @staticmethod
+    def clockFaceRect(size: QSize) -> QRect:
+        """
+        Get the area of the clock face.
 
-        # Create clock face frame
-        self._clockface = QFrame(self)
-        self._clockface.setObjectName("clockface")
+        Args:
+            size: Size of the clock widget
+
+        Returns:
+            Clock face rectangle in widget coordinates
+        """
+        height = size.height()
+        width = size.width()
 
         # Calculate clock face position and size
         clock_size = int(height * CLOCK_FACE_SIZE_RATIO)
@@ -59,13 +119,32 @@ class ClockWidget(QWidget):
         clock_y = int(
             height * CLOCK_CENTER_Y_RATIO - height * (CLOCK_FACE_SIZE_RATIO / 2)
         )
+        return QRect(clock_x, clock_y, clock_size, clock_size)
 
-        self._clockrect = QRect(clock_x, clock_y, clock_size, clock_size)
-        self._clockface.setGeometry(self._clockrect)
+    def _createClockFace(self) -> None:
+        """Create the clock face background."""
+        self._clockrect = self.clockFaceRect(
+            QSize(self.config.width, self.config.height)
+        )
+        # Scaled to the face size once, rather than on every repaint
+        face_pixmap = None
+        if self._draw_face:
+            face_pixmap = self._assets.pixmap(CLOCK_FACE_IMAGE, self._clockrect.size())
+
+        if self._renderer == "painter":
+            # Face and hands are painted together on a single surface
+            self._clockface = ClockSurface(self, face_pixmap, self._profiler)
+        elif face_pixmap is None:
+            # Hands are drawn straight over the static layer
+            return
+        else:
+            # Create clock face label showing the face image
+            self._clockface = QLabel(self)
+            self._clockface.setObjectName("clockface")
+            self._clockface.setStyleSheet(Styles.get_transparent_style("clockface"))
+            self._clockface.setPixmap(face_pixmap)
 
-        # Apply clock face styling with image
-        image_path = self.config.images_path / CLOCK_FACE_IMAGE
-        self._clockface.setStyleSheet(Styles.get_clockface_style(str(image_path)))
+        self._clockface.setGeometry(self._clockrect)
 
     def _createClockHands(self) -> None:
         """Create hour, minute, and second hand widgets."""
@@ -80,21 +159,46 @@ class ClockWidget(QWidget):
         for hand_type, image_name in hands:
             self._clock_hands[hand_type] = {}
 
+            # Load pixmaps (original and transformed)
+            original_pixmap = self._assets.pixmap(image_name)
+            self._clock_hands[hand_type]["pixmap"] = [original_pixmap, original_pixmap]
+
+            if isinstance(self._clockface, ClockSurface):
+                self._clockface.setHandPixmap(hand_type, original_pixmap)
+                continue
+
             # Create label for the hand
-            label = QLabel(self)
+            label = _HandLabel(self, self._profiler)
             label.setObjectName(f"{hand_type}hand")
             label.setStyleSheet(Styles.get_transparent_style(f"{hand_type}hand"))
-
-            # Load pixmaps (original and transformed)
-            image_path = self.config.images_path / image_name
-            original_pixmap = QPixmap(str(image_path))
-
             self._clock_hands[hand_type]["label"] = label
-            self._clock_hands[hand_type]["pixmap"] = [original_pixmap, original_pixmap]
 
             # Initially position at 12 o'clock
             label.raise_()
 
+    def _createHandCache(self) -> None:
+        """Create the hand sprite cache if enabled in the configuration."""
+        mode = self.config.hand_cache_mode
+        # The painter renderer never builds rotated pixmaps, so has no use for it
+        if mode == "off" or self._renderer == "painter":
+            return
+        if mode not in ("lazy", "eager"):
+            raise ValueError(f"Invalid hand cache mode '{mode}'")
+
+        self._hand_cache = HandSpriteCache(self.config.hand_cache_budget)
+
+        # Eagerly render every hand position at startup
+        if mode == "eager":
+            for hand_type, hand in self._clock_hands.items():
+                self._hand_cache.prerender(
+                    hand_type, hand["pixmap"][0], self._clockrect.size()
+                )
+
+    @property
+    def hand_cache(self) -> HandSpriteCache | None:
+        """Get the hand sprite cache, or None if caching is disabled."""
+        return self._hand_cache
+
     def _createDateDisplay(self) -> None:
         """Create the date display label."""
         self._date_label = QLabel(self)
@@ -119,34 +223,49 @@ class ClockWidget(QWidget):
         if hand_type not in self._clock_hands:
             return
 
+        if isinstance(self._clockface, ClockSurface):
+            self._clockface.setHandAngle(hand_type, angle)
+            return
+
         hand = self._clock_hands[hand_type]
         original_pixmap = hand["pixmap"][0]
         label = hand["label"]
 
-        # Scale and rotate the pixmap
-        ts = original_pixmap.size()
-        transform = QTransform()
-        transform.scale(
-            float(self._clockrect.width()) / ts.height(),
-            float(self._clockrect.height()) / ts.height(),
-        )
-        transform.rotate(angle)
-
-        transformed_pixmap = original_pixmap.transformed(
-            transform,
-            Qt.SmoothTransformation,  # ty: ignore[unresolved-attribute]
-        )
+        # Scale and rotate the pixmap, using pre-rendered sprites if enabled
+        with profile_stage(self._profiler, "pixmap_transform"):
+            if self._hand_cache is not None:
+                transformed_pixmap = self._hand_cache.get(
+                    hand_type, angle, original_pixmap, self._clockrect.size()
+                )
+            else:
+                transformed_pixmap = render_hand(
+                    original_pixmap, self._clockrect.size(), angle
+                )
         hand["pixmap"][1] = transformed_pixmap
-        label.setPixmap(transformed_pixmap)
-
-        # Center the hand on the clock face
-        ts = transformed_pixmap.size()
-        label.setGeometry(
-            int(self._clockrect.center().x() - ts.width() / 2),
-            int(self._clockrect.center().y() - ts.height() / 2),
-            ts.width(),
-            ts.height(),
-        )
+
+        with profile_stage(self._profiler, "geometry_set"):
+            label.setPixmap(transformed_pixmap)
+
+            # Center the hand on the clock face
+            ts = transformed_pixmap.size()
+            label.setGeometry(
+                int(self._clockrect.center().x() - ts.width() / 2),
+                int(self._clockrect.center().y() - ts.height() / 2),
+                ts.width(),
+                ts.height(),
+            )
+
+    def setSecondHandVisible(self, visible: bool) -> None:
+        """
+        Show or hide the second hand.
+
+        Args:
+            visible: Whether the second hand is shown
+        """
+        if isinstance(self._clockface, ClockSurface):
+            self._clockface.setHandVisible("sec", visible)
+        else:
+            self._clock_hands["sec"]["label"].setVisible(visible)
 
     def updateDate(self, date_string: str) -> None:
         """
@@ -0,0 +1,188 @@
+"""Pre-rendered sprite cache for rotated clock hands."""
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QPixmap, QTransform
+
+# Number of distinct positions each hand can take
+HAND_POSITIONS = {
+    "hour": 720,  # 0.5 degrees per minute
+    "min": 60,  # 6 degrees per minute
+    "sec": 60,  # 6 degrees per second
+}
+
+
+def render_hand(pixmap: QPixmap, size: QSize, angle: float) -> QPixmap:
+    """
+    Scale and rotate a hand pixmap to fit the clock face.
+
+    Args:
+        pixmap: Original (unscaled, unrotated) hand pixmap
+        size: Size of the clock face rectangle
+        angle: Angle in degrees
+
+    Returns:
+        Transformed hand pixmap
+    """
+    ts = pixmap.size()
+    transform = QTransform()
+    transform.scale(
+        float(size.width()) / ts.height(),
+        float(size.height()) / ts.height(),
+    )
+    transform.rotate(angle)
+
+    return pixmap.transformed(
+        transform,
+        Qt.SmoothTransformation,  # ty: ignore[unresolved-attribute]
+    )
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    """
+    Estimate the memory footprint of a pixmap.
+
+    Args:
+        pixmap: Pixmap to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class HandSpriteCache:
+    """
+    Cache of pre-rendered clock hand sprites.
+
+    Sprites are keyed by hand type, hand position and clock face size so
+    that each tick becomes a dictionary lookup instead of a smooth
+    rescale-and-rotate. The cache is bounded by a memory budget and evicts
+    the least recently used sprites once the budget is exceeded.
+    """
+
+    def __init__(self, budget_bytes: int):
+        """
+        Initialize the sprite cache.
+
+        Args:
+            budget_bytes: Maximum total size of cached sprites in bytes
+        """
+        self.budget_bytes = budget_bytes
+
+        self._sprites: OrderedDict[tuple[str, int, int, int], QPixmap] = OrderedDict()
+        self._size_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached sprites."""
+        return len(self._sprites)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the total size of cached sprites in bytes."""
+        return self._size_bytes
+
+    @staticmethod
+    def position_for(hand_type: str, angle: float) -> int:
+        """
+        Quantize an angle to a hand position index.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            angle: Angle in degrees
+
+        Returns:
+            Position index in the range [0, HAND_POSITIONS[hand_type])
+        """
+        positions = HAND_POSITIONS[hand_type]
+        return round(angle * positions / 360.0) % positions
+
+    def get(
+        self, hand_type: str, angle: float, pixmap: QPixmap, size: QSize
+    ) -> QPixmap:
+        """
+        Get the sprite for a hand, rendering it on a cache miss.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            angle: Angle in degrees
+            pixmap: Original hand pixmap used to render on a miss
+            size: Size of the clock face rectangle
+
+        Returns:
+            Scaled and rotated hand pixmap
+        """
+        position = self.position_for(hand_type, angle)
+        key = (hand_type, position, size.width(), size.height())
+
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(hand_type, position, pixmap, size)
+        self._store(key, sprite)
+        return sprite
+
+    def prerender(self, hand_type: str, pixmap: QPixmap, size: QSize) -> int:
+        """
+        Render every position of a hand up front.
+
+        Rendering stops early once the memory budget would be exceeded so
+        that pre-rendering never evicts sprites that are already cached.
+
+        Args:
+            hand_type: Type of hand ('hour', 'min', or 'sec')
+            pixmap: Original hand pixmap
+            size: Size of the clock face rectangle
+
+        Returns:
+            Number of sprites rendered
+        """
+        rendered = 0
+        for position in range(HAND_POSITIONS[hand_type]):
+            key = (hand_type, position, size.width(), size.height())
+            if key in self._sprites:
+                continue
+
+            sprite = self._render(hand_type, position, pixmap, size)
+            if self._size_bytes + pixmap_bytes(sprite) > self.budget_bytes:
+                break
+
+            self._store(key, sprite)
+            rendered += 1
+
+        return rendered
+
+    def clear(self) -> None:
+        """Remove all cached sprites."""
+        self._sprites.clear()
+        self._size_bytes = 0
+
+    def _render(
+        self, hand_type: str, position: int, pixmap: QPixmap, size: QSize
+    ) -> QPixmap:
+        """Render the sprite for a quantized hand position."""
+        angle = position * 360.0 / HAND_POSITIONS[hand_type]
+        return render_hand(pixmap, size, angle)
+
+    def _store(self, key: tuple[str, int, int, int], sprite: QPixmap) -> None:
+        """Store a sprite, evicting old sprites to stay within budget."""
+        sprite_bytes = pixmap_bytes(sprite)
+        if sprite_bytes > self.budget_bytes:
+            return
+
+        while self._sprites and self._size_bytes + sprite_bytes > self.budget_bytes:
+            _, evicted = self._sprites.popitem(last=False)
+            self._size_bytes -= pixmap_bytes(evicted)
+            self.evictions += 1
+
+        self._sprites[key] = sprite
+        self._size_bytes += sprite_bytes
@@ -1,16 +1,26 @@
 """Main window for Smart Clock Dashboard."""
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QFrame, QMainWindow, QWidget
+import datetime
+import importlib
+import logging
+from collections.abc import Callable
 
-from config.constants import BACKGROUND_IMAGE
+from PyQt5.QtCore import QEvent, QObject, QSize, Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QFrame, QLabel, QMainWindow, QWidget
+
+from config.constants import BACKGROUND_IMAGE, CLOCK_FACE_IMAGE, DEFERRED_IMPORTS
 from config.settings import Config
 from smrtclk.controllers.clock_controller import ClockController
 from smrtclk.models.clock_model import ClockModel
+from smrtclk.profiling import TickProfiler
 
+from .asset_manager import AssetManager
 from .clock_widget import ClockWidget
+from .static_layer import StaticLayer
 from .styles import Styles
 
+logger = logging.getLogger(__name__)
+
 
 class ClockMainWindow(QMainWindow):
     """
@@ -19,20 +29,55 @@ class ClockMainWindow(QMainWindow):
     This is the top-level window that contains all clock and weather widgets.
     Follows PyQt5 best practices with proper parent-child relationships and
     separation of concerns.
+
+    Signals:
+        firstFramePainted: Emitted once the clock has been painted for the
+            first time
     """
 
-    def __init__(self, config: Config):
+    firstFramePainted = pyqtSignal()
+
+    def __init__(
+        self,
+        config: Config,
+        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
         """
         Initialize the main window.
 
         Args:
             config: Application configuration object
+            clock: Source of the current local time
         """
         super().__init__(parent=None)
         self.config = config
+        self._clock = clock
+
+        # Decode images in worker threads while the window is built
+        self.assets = AssetManager(config.images_path, self)
+        window_size = QSize(config.width, config.height)
+        self.assets.preload(
+            {
+                BACKGROUND_IMAGE: window_size,
+                CLOCK_FACE_IMAGE: ClockWidget.clockFaceRect(window_size).size(),
+            }
+        )
 
         # Initialize controllers
         self.clock_controller = None
+        self._first_frame_painted = False
+
+        # Without deferral, weather and network modules load before the window
+        if not config.defer_imports:
+            self._loadDeferredModules()
+
+        # Opt-in tick profiling
+        self.profiler: TickProfiler | None = None
+        if config.profile_ticks:
+            self.profiler = TickProfiler(
+                report_every=config.profile_report_every,
+                report_path=config.profile_report_path,
+            )
 
         self._setupWindow()
         self._createCentralWidget()
@@ -40,6 +85,9 @@ class ClockMainWindow(QMainWindow):
         self._createLayout()
         self._setupControllers()
 
+        # Watch for the clock's first paint
+        self.clock_widget.installEventFilter(self)
+
     def _setupWindow(self) -> None:
         """Configure main window properties."""
         self.setWindowTitle("Smart Clock Dashboard")
@@ -52,15 +100,18 @@ class ClockMainWindow(QMainWindow):
         central_widget = QWidget(self)
         self.setCentralWidget(central_widget)
 
-        # Create background frame
-        self.background = QFrame(central_widget)
-        self.background.setObjectName("background")
+        if self.config.static_layer:
+            # Background and clock face composited into a single pixmap
+            self.background = StaticLayer(central_widget, self.assets)
+        else:
+            # Show the background image, already scaled to the window size
+            self.background = QLabel(central_widget)
+            self.background.setObjectName("background")
+            self.background.setStyleSheet(Styles.get_background_style())
+            size = QSize(self.config.width, self.config.height)
+            self.background.setPixmap(self.assets.pixmap(BACKGROUND_IMAGE, size))
         self.background.setGeometry(0, 0, self.config.width, self.config.height)
 
-        # Apply background styling with image
-        image_path = self.config.images_path / BACKGROUND_IMAGE
-        self.background.setStyleSheet(Styles.get_background_style(str(image_path)))
-
         # Create foreground frame for widgets
         self.foreground = QFrame(self.background)
         self.foreground.setObjectName("foreground")
@@ -70,7 +121,13 @@ class ClockMainWindow(QMainWindow):
     def _createWidgets(self) -> None:
         """Create all child widgets (clock, weather, etc.)."""
         # Create clock widget
-        self.clock_widget = ClockWidget(self.foreground, self.config)
+        self.clock_widget = ClockWidget(
+            self.foreground,
+            self.config,
+            self.profiler,
+            self.assets,
+            draw_face=not self.config.static_layer,
+        )
 
         # TODO: Create WeatherWidget when ready
 
@@ -84,8 +141,13 @@ class ClockMainWindow(QMainWindow):
     def _setupControllers(self) -> None:
         """Initialize and start all controllers."""
         # Create clock model and controller
-        clock_model = ClockModel()
-        self.clock_controller = ClockController(clock_model, self.clock_widget)
+        clock_model = ClockModel(self.profiler, self._clock)
+        self.clock_controller = ClockController(
+            clock_model,
+            self.clock_widget,
+            self.config.precise_clock_timer,
+            self.profiler,
+        )
 
         # Start the clock
         self.clock_controller.start()
@@ -93,6 +155,64 @@ class ClockMainWindow(QMainWindow):
         # Trigger initial update to show current time immediately
         clock_model.update_time()
 
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        Detect the first paint of the clock widget.
+
+        Args:
+            watched: Object the event is sent to
+            event: The event
+
+        Returns:
+            False, so the event is always delivered
+        """
+        if (
+            watched is self.clock_widget
+            and event.type() == QEvent.Paint  # ty: ignore[unresolved-attribute]
+            and not self._first_frame_painted
+        ):
+            self._first_frame_painted = True
+            self.clock_widget.removeEventFilter(self)
+            # Runs once the paint has finished
+            QTimer.singleShot(0, self._onFirstFrame)
+        return super().eventFilter(watched, event)
+
+    def _onFirstFrame(self) -> None:
+        """Announce the first frame and load the deferred modules."""
+        self.firstFramePainted.emit()
+        if self.config.defer_imports:
+            self._loadDeferredModules()
+
+    def _loadDeferredModules(self) -> None:
+        """Import the modules deferred until after the first frame."""
+        for name in DEFERRED_IMPORTS:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                logger.warning(f"Failed to import {name}: {e}")
+
+    def showEvent(self, event) -> None:
+        """
+        Resume second-aligned clock ticks when the window is shown.
+
+        Args:
+            event: Show event
+        """
+        if self.clock_controller:
+            self.clock_controller.setIdle(False)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """
+        Back off to minute-aligned clock ticks while the window is hidden.
+
+        Args:
+            event: Hide event
+        """
+        if self.clock_controller:
+            self.clock_controller.setIdle(True)
+        super().hideEvent(event)
+
     def closeEvent(self, event) -> None:
         """
         Handle window close event.
@@ -103,5 +223,10 @@ class ClockMainWindow(QMainWindow):
         # Stop all controllers and cleanup resources
         if self.clock_controller:
             self.clock_controller.stop()
+        self.assets.wait()
+
+        # Write out the final tick timings
+        if self.profiler and self.profiler.tick_count:
+            self.profiler.report()
 
         super().closeEvent(event)
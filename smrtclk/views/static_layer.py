@@ -0,0 +1,102 @@
+"""Static background layer composited once per window size."""
+
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QPainter, QPaintEvent, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from config.constants import BACKGROUND_COLOR, BACKGROUND_IMAGE, CLOCK_FACE_IMAGE
+
+from .asset_manager import AssetManager
+from .clock_widget import ClockWidget
+
+
+def compose_layer(
+    size: QSize, background: QPixmap, face: QPixmap, face_rect: QRect
+) -> QPixmap:
+    """
+    Draw the background and clock face into one opaque pixmap.
+
+    Args:
+        size: Size of the layer
+        background: Background image, scaled to the layer size
+        face: Clock face image, scaled to the face rectangle
+        face_rect: Area of the clock face in the layer
+
+    Returns:
+        Composited layer
+    """
+    # Opaque, so blitting it never blends with what is underneath
+    layer = QPixmap(size)
+    layer.fill(QColor(BACKGROUND_COLOR))
+
+    painter = QPainter(layer)
+    painter.drawPixmap(layer.rect(), background)
+    painter.drawPixmap(face_rect, face)
+    painter.end()
+    return layer
+
+
+class StaticLayer(QWidget):
+    """
+    Window background with the clock face drawn on it.
+
+    Everything that does not move is composited into a single pixmap when
+    the widget is resized. Repaints under the moving hands then copy the
+    dirty rectangle from that pixmap, instead of stretching and blending the
+    background and clock face images every second.
+    """
+
+    def __init__(self, parent: QWidget, assets: AssetManager):
+        """
+        Initialize the static layer.
+
+        Args:
+            parent: Parent widget
+            assets: Image assets providing the background and clock face
+        """
+        super().__init__(parent)
+        self.setObjectName("background")
+        # Covers its whole area, so nothing underneath needs painting
+        self.setAttribute(Qt.WA_OpaquePaintEvent)  # ty: ignore[unresolved-attribute]
+
+        self._assets = assets
+        self._layer: QPixmap | None = None
+
+    @property
+    def layer(self) -> QPixmap:
+        """Get the composited layer, building it if needed."""
+        if self._layer is None or self._layer.size() != self.size():
+            self._compose()
+        return self._layer
+
+    def _compose(self) -> None:
+        """Composite the layer at the current size."""
+        size = self.size()
+        face_rect = ClockWidget.clockFaceRect(size)
+        self._layer = compose_layer(
+            size,
+            self._assets.pixmap(BACKGROUND_IMAGE, size),
+            self._assets.pixmap(CLOCK_FACE_IMAGE, face_rect.size()),
+            face_rect,
+        )
+
+    def resizeEvent(self, event) -> None:
+        """
+        Composite the layer again at the new size.
+
+        Args:
+            event: Resize event
+        """
+        self._compose()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Copy the dirty rectangle from the composited layer.
+
+        Args:
+            event: Paint event
+        """
+        painter = QPainter(self)
+        painter.drawPixmap(event.rect(), self.layer, event.rect())
+        painter.end()
@@ -12,16 +12,19 @@ class Styles:
     """
 
     @staticmethod
-    def get_background_style(image_path: str) -> str:
+    def get_background_style(image_path: str | None = None) -> str:
         """
         Get stylesheet for background frame.
 
         Args:
-            image_path: Path to background image
+            image_path: Path to background image, stretched over the frame;
+                None for a plain background
 
         Returns:
             QSS stylesheet string
         """
+        if image_path is None:
+            return "#background { background-color: black; }"
         return (
             "#background { "
             f"background-color: black; "
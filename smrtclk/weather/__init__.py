@@ -1,5 +1,56 @@
-from .weather_api import WeatherAPI, WeatherData
-from .weather_api_mock import WeatherAPIMock
-from .weather_api_nws import WeatherAPINWS
+from typing import TYPE_CHECKING
 
-__all__ = ["WeatherAPI", "WeatherData", "WeatherAPIMock", "WeatherAPINWS"]
+from smrtclk.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker
+    from .grid_index import GridIndex
+    from .poll_scheduler import PollScheduler
+    from .retry import CancelToken, RetryPolicy
+    from .weather_api import (
+        WeatherAPI,
+        WeatherData,
+        WeatherHTTPError,
+        WeatherNotModified,
+    )
+    from .weather_api_async import AsyncWeatherAPI, HostRateLimiter
+    from .weather_api_mock import WeatherAPIMock
+    from .weather_api_nws import AsyncWeatherAPINWS, WeatherAPINWS
+    from .weather_api_proxy import WeatherAPIProxy
+    from .weather_cache import (
+        MemoryCacheBackend,
+        SQLiteCacheBackend,
+        WeatherCacheBackend,
+    )
+    from .weather_proxy import UnixWeatherProxyServer, WeatherProxy, WeatherProxyServer
+
+# Public names and the submodules defining them. Submodules are imported on
+# first access, so using one provider does not import requests, urllib3 and
+# the other providers.
+_EXPORTS = {
+    "WeatherAPI": ".weather_api",
+    "WeatherData": ".weather_api",
+    "WeatherNotModified": ".weather_api",
+    "WeatherHTTPError": ".weather_api",
+    "WeatherAPIMock": ".weather_api_mock",
+    "WeatherAPINWS": ".weather_api_nws",
+    "AsyncWeatherAPI": ".weather_api_async",
+    "AsyncWeatherAPINWS": ".weather_api_nws",
+    "HostRateLimiter": ".weather_api_async",
+    "WeatherAPIProxy": ".weather_api_proxy",
+    "WeatherProxy": ".weather_proxy",
+    "WeatherProxyServer": ".weather_proxy",
+    "UnixWeatherProxyServer": ".weather_proxy",
+    "WeatherCacheBackend": ".weather_cache",
+    "MemoryCacheBackend": ".weather_cache",
+    "SQLiteCacheBackend": ".weather_cache",
+    "PollScheduler": ".poll_scheduler",
+    "RetryPolicy": ".retry",
+    "CancelToken": ".retry",
+    "CircuitBreaker": ".circuit_breaker",
+    "GridIndex": ".grid_index",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
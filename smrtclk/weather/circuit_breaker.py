@@ -0,0 +1,240 @@
+"""Circuit breaker and reachability probing for weather providers.
+
+After a run of failed fetches the circuit opens, and fetches are skipped
+(callers get the last cached data) instead of each one running the whole
+retry ladder against a provider that is down or a network that is offline.
+Once the open period has passed the circuit is half-open: a cheap
+reachability probe runs first, and only if it succeeds is a single trial
+fetch let through. A successful trial closes the circuit; a failed probe or
+trial opens it again for twice as long, up to a maximum.
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Consecutive failed fetches that open the circuit
+DEFAULT_FAILURE_THRESHOLD = 3
+# Seconds the circuit stays open after first opening
+DEFAULT_RESET_TIMEOUT = 60.0
+# Maximum seconds the circuit stays open
+DEFAULT_MAX_RESET_TIMEOUT = 15 * 60.0
+# Connect timeout of reachability probes in seconds
+DEFAULT_PROBE_TIMEOUT = 2.0
+
+
+def probe_reachable(url: str, timeout: float = DEFAULT_PROBE_TIMEOUT) -> bool:
+    """Check whether a URL's host accepts TCP connections.
+
+    Much cheaper than a request: no TLS handshake, no HTTP exchange and no
+    retries, so an offline network is detected within the timeout.
+
+    Parameters
+    ----------
+    url : str
+        URL whose host and port are probed.
+    timeout : float, optional
+        Connect timeout in seconds (default: 2.0).
+
+    Returns
+    -------
+    bool
+        True if a connection could be opened.
+    """
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parts.hostname, port), timeout=timeout):
+            return True
+    except OSError as e:
+        logger.debug(f"Probe of {parts.hostname}:{port} failed: {e}")
+        return False
+
+
+class CircuitBreaker:
+    """Tracks failures of a provider and stops calling it while it is down.
+
+    Thread-safe. One breaker can be shared by every API instance of a
+    provider, so they all back off together.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        max_reset_timeout: float = DEFAULT_MAX_RESET_TIMEOUT,
+        probe: Callable[[], bool] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes the CircuitBreaker class.
+
+        Parameters
+        ----------
+        failure_threshold : int, optional
+            Consecutive failures that open the circuit (default: 3).
+        reset_timeout : float, optional
+            Seconds the circuit stays open after first opening (default: 60).
+        max_reset_timeout : float, optional
+            Maximum seconds the circuit stays open, as the open period
+            doubles after each failed probe or trial (default: 900).
+        probe : callable, optional
+            Cheap reachability check run before a trial fetch, returning
+            True if the provider looks reachable (default: none).
+        clock : callable, optional
+            Monotonic clock in seconds (default: time.monotonic).
+
+        Raises
+        ------
+        ValueError
+            If failure_threshold is less than 1 or a timeout is negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if min(reset_timeout, max_reset_timeout) < 0:
+            raise ValueError("Reset timeouts must be non-negative")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._state = CLOSED
+        self._failures = 0
+        self._open_timeout = reset_timeout
+        self._opened_at: float | None = None
+        # Whether a half-open trial fetch is in flight
+        self._trial = False
+        self._transitions: Counter[str] = Counter()
+        self._short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        """Get the circuit state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        """Get the number of consecutive failures."""
+        with self._lock:
+            return self._failures
+
+    def allow_request(self) -> bool:
+        """Check whether a fetch may be made now.
+
+        When the open period has passed, runs the probe and lets a single
+        trial fetch through if it succeeds. Callers that are allowed must
+        report the outcome with record_success() or record_failure(), or
+        with record_ignored() if it says nothing about availability.
+
+        Returns
+        -------
+        bool
+            True if the fetch may be made, False to short-circuit it.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() - self._opened_at < self._open_timeout:
+                    self._short_circuits += 1
+                    return False
+                self._transition(HALF_OPEN)
+            if self._trial:
+                self._short_circuits += 1
+                return False
+            self._trial = True
+
+        # Probe outside the lock, as it may block for its timeout
+        if self.probe is not None and not self.probe():
+            logger.debug("Provider still unreachable")
+            self.record_failure()
+            with self._lock:
+                self._short_circuits += 1
+            return False
+        return True
+
+    def record_success(self) -> None:
+        """Report a successful fetch, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._trial = False
+            self._open_timeout = self.reset_timeout
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+                logger.info("Weather provider reachable again, circuit closed")
+
+    def record_failure(self) -> None:
+        """Report a failed fetch or probe, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                self._trial = False
+                self._open_timeout = min(self._open_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def record_ignored(self) -> None:
+        """Report a fetch that failed for a reason other than an outage.
+
+        Neither opens nor closes the circuit, but frees the trial slot so
+        the next fetch may try again.
+        """
+        with self._lock:
+            self._trial = False
+
+    def stats(self) -> dict:
+        """Get the breaker state and counters for monitoring.
+
+        Returns
+        -------
+        dict
+            The state, consecutive failures, seconds until the next trial
+            while open, short-circuited fetches, and the number of each
+            state transition keyed "from->to".
+        """
+        with self._lock:
+            retry_in = None
+            if self._state == OPEN:
+                elapsed = self._clock() - self._opened_at
+                retry_in = max(0.0, self._open_timeout - elapsed)
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "retry_in": retry_in,
+                "short_circuits": self._short_circuits,
+                "transitions": dict(self._transitions),
+            }
+
+    def _open(self) -> None:
+        """Open the circuit for the current open period (lock held)."""
+        self._opened_at = self._clock()
+        self._transition(OPEN)
+        logger.warning(
+            f"Weather provider unavailable after {self._failures} failures, "
+            f"circuit open for {self._open_timeout:.0f}s"
+        )
+
+    def _transition(self, state: str) -> None:
+        """Move to a state and count the transition (lock held).
+
+        Parameters
+        ----------
+        state : str
+            New circuit state.
+        """
+        self._transitions[f"{self._state}->{state}"] += 1
+        self._state = state
@@ -0,0 +1,368 @@
+"""Spatial index of resolved NWS forecast grid cells.
+
+The NWS points lookup maps every coordinate inside a forecast grid cell
+(about 2.5 km across) to the same "gridId/gridX,gridY" location, and the
+forecast response carries the cell's polygon. GridIndex remembers both, so
+units that move within a cell, or nearby units sharing one, find their grid
+location without a points lookup.
+
+Cells are bucketed on a regular latitude/longitude grid; a lookup only
+tests the polygons registered in the coordinate's bucket. Resolved points
+whose cell polygon is not known yet are remembered individually.
+
+Usage (bulk pre-resolution):
+    python -m smrtclk.weather.grid_index COORDINATES [--output index.json]
+
+COORDINATES is a text file with one "latitude,longitude" pair per line.
+Coordinates not already covered by the index are resolved with a points
+lookup, and each new cell's polygon with one forecast request.
+"""
+
+import argparse
+import json
+import logging
+import math
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Size of the index buckets in degrees, a few cells across
+BUCKET_SIZE = 0.05
+# Decimal places resolved points are rounded to (about 11 m)
+POINT_PRECISION = 4
+
+Ring = list[tuple[float, float]]
+
+
+def polygon_ring(geometry: dict | None) -> Ring | None:
+    """Get the outer ring of a GeoJSON polygon.
+
+    Parameters
+    ----------
+    geometry : dict or None
+        GeoJSON geometry, e.g. of an NWS forecast response.
+
+    Returns
+    -------
+    list of tuple or None
+        (longitude, latitude) vertices, or None if the geometry is not a
+        polygon.
+    """
+    if not isinstance(geometry, dict) or geometry.get("type") != "Polygon":
+        return None
+    try:
+        ring = [(float(lon), float(lat)) for lon, lat, *_ in geometry["coordinates"][0]]
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    return ring if len(ring) >= 3 else None
+
+
+def contains(ring: Ring, latitude: float, longitude: float) -> bool:
+    """Check whether a point is inside a polygon ring (ray casting).
+
+    Parameters
+    ----------
+    ring : list of tuple
+        (longitude, latitude) vertices.
+    latitude : float
+        Latitude of the point.
+    longitude : float
+        Longitude of the point.
+
+    Returns
+    -------
+    bool
+        True if the point is inside the ring.
+    """
+    inside = False
+    x, y = longitude, latitude
+    for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _bucket(latitude: float, longitude: float) -> tuple[int, int]:
+    """Get the index bucket of a coordinate."""
+    return math.floor(latitude / BUCKET_SIZE), math.floor(longitude / BUCKET_SIZE)
+
+
+def _point_key(latitude: float, longitude: float) -> tuple[float, float]:
+    """Get the key of a resolved point."""
+    return round(latitude, POINT_PRECISION), round(longitude, POINT_PRECISION)
+
+
+class GridIndex:
+    """Maps coordinates to NWS grid locations without network calls.
+
+    Thread-safe, so one index can be shared by every API instance.
+    """
+
+    def __init__(self):
+        """Initializes the GridIndex class."""
+        self._lock = threading.Lock()
+        # Cell polygons by grid location
+        self._cells: dict[str, Ring] = {}
+        # Grid locations whose cells overlap each bucket
+        self._buckets: dict[tuple[int, int], set[str]] = {}
+        # Grid locations of resolved points, for cells without a polygon
+        self._points: dict[tuple[float, float], str] = {}
+
+    def __len__(self) -> int:
+        """Get the number of cells with a known polygon."""
+        with self._lock:
+            return len(self._cells)
+
+    def __contains__(self, location: str) -> bool:
+        """Check whether a cell's polygon is known."""
+        with self._lock:
+            return location in self._cells
+
+    def add_point(self, latitude: float, longitude: float, location: str) -> None:
+        """Remember the grid location a coordinate resolved to.
+
+        Parameters
+        ----------
+        latitude : float
+            Latitude of the coordinate.
+        longitude : float
+            Longitude of the coordinate.
+        location : str
+            Grid location from the points lookup (e.g., "TOP/31,80").
+        """
+        with self._lock:
+            self._points[_point_key(latitude, longitude)] = location
+
+    def add_cell(self, location: str, geometry: dict | None) -> bool:
+        """Remember the polygon of a grid cell.
+
+        Parameters
+        ----------
+        location : str
+            Grid location of the cell (e.g., "TOP/31,80").
+        geometry : dict or None
+            GeoJSON polygon of the cell, from its forecast response.
+
+        Returns
+        -------
+        bool
+            True if the geometry was a polygon and was added.
+        """
+        ring = polygon_ring(geometry)
+        if ring is None:
+            return False
+        lons = [lon for lon, _ in ring]
+        lats = [lat for _, lat in ring]
+        low = _bucket(min(lats), min(lons))
+        high = _bucket(max(lats), max(lons))
+        with self._lock:
+            if location in self._cells:
+                self._remove_cell(location)
+            self._cells[location] = ring
+            for lat_bucket in range(low[0], high[0] + 1):
+                for lon_bucket in range(low[1], high[1] + 1):
+                    self._buckets.setdefault((lat_bucket, lon_bucket), set()).add(
+                        location
+                    )
+        return True
+
+    def lookup(self, latitude: float, longitude: float) -> str | None:
+        """Find the grid location of a coordinate.
+
+        Parameters
+        ----------
+        latitude : float
+            Latitude of the coordinate.
+        longitude : float
+            Longitude of the coordinate.
+
+        Returns
+        -------
+        str or None
+            Grid location of the known cell containing the coordinate, or
+            of the same resolved point, or None if unknown.
+        """
+        with self._lock:
+            for location in self._buckets.get(_bucket(latitude, longitude), ()):
+                if contains(self._cells[location], latitude, longitude):
+                    return location
+            return self._points.get(_point_key(latitude, longitude))
+
+    def to_dict(self) -> dict:
+        """Get the index as a JSON-serializable dict.
+
+        Returns
+        -------
+        dict
+            Cell polygons by location and the resolved points.
+        """
+        with self._lock:
+            return {
+                "cells": {
+                    location: [list(vertex) for vertex in ring]
+                    for location, ring in self._cells.items()
+                },
+                "points": [
+                    [latitude, longitude, location]
+                    for (latitude, longitude), location in self._points.items()
+                ],
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GridIndex":
+        """Create an index from to_dict() output.
+
+        Parameters
+        ----------
+        data : dict
+            Cell polygons by location and the resolved points.
+
+        Returns
+        -------
+        GridIndex
+            The index.
+        """
+        index = cls()
+        for location, ring in data.get("cells", {}).items():
+            index.add_cell(location, {"type": "Polygon", "coordinates": [ring]})
+        for latitude, longitude, location in data.get("points", []):
+            index.add_point(latitude, longitude, location)
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index to a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            Output file path.
+        """
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> "GridIndex":
+        """Read an index written by save().
+
+        Parameters
+        ----------
+        path : Path
+            Index file path.
+
+        Returns
+        -------
+        GridIndex
+            The index.
+        """
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def _remove_cell(self, location: str) -> None:
+        """Remove a cell from its buckets (lock held)."""
+        del self._cells[location]
+        for locations in self._buckets.values():
+            locations.discard(location)
+
+
+def resolve_coordinates(
+    coordinates: Iterable[tuple[float, float]], index: GridIndex | None = None
+) -> tuple[GridIndex, dict]:
+    """Resolve the grid cells of many coordinates.
+
+    Coordinates already covered by the index are skipped. Each new cell's
+    polygon is fetched once, from its forecast.
+
+    Parameters
+    ----------
+    coordinates : iterable of tuple of float
+        (latitude, longitude) pairs.
+    index : GridIndex, optional
+        Index to extend (default: a new one).
+
+    Returns
+    -------
+    tuple
+        The index, and counts of coordinates already covered, points
+        lookups, forecast requests and failures.
+    """
+    # Imported here so loading an index does not import requests
+    from .weather_api_nws import (
+        create_session,
+        forecast_url,
+        get_json_requests_retry,
+        grid_location,
+        points_url,
+    )
+
+    # An index holding only points has no cells, so it is falsy
+    index = index if index is not None else GridIndex()
+    stats = {"covered": 0, "points": 0, "cells": 0, "failed": 0}
+    session = create_session()
+    try:
+        for latitude, longitude in coordinates:
+            if index.lookup(latitude, longitude) is not None:
+                stats["covered"] += 1
+                continue
+            try:
+                stats["points"] += 1
+                location = grid_location(
+                    get_json_requests_retry(points_url(latitude, longitude), session)
+                )
+                index.add_point(latitude, longitude, location)
+                if location not in index:
+                    stats["cells"] += 1
+                    forecast = get_json_requests_retry(forecast_url(location), session)
+                    index.add_cell(location, forecast.get("geometry"))
+            except Exception as e:
+                logger.warning(f"Failed to resolve ({latitude}, {longitude}): {e}")
+                stats["failed"] += 1
+    finally:
+        session.close()
+    return index, stats
+
+
+def read_coordinates(path: Path) -> list[tuple[float, float]]:
+    """Read "latitude,longitude" lines from a text file.
+
+    Blank lines and lines starting with "#" are skipped.
+
+    Parameters
+    ----------
+    path : Path
+        Coordinates file path.
+
+    Returns
+    -------
+    list of tuple of float
+        (latitude, longitude) pairs.
+    """
+    coordinates = []
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        latitude, longitude = line.split(",")[:2]
+        coordinates.append((float(latitude), float(longitude)))
+    return coordinates
+
+
+def main() -> None:
+    """Build or extend a grid index for a list of coordinates."""
+    parser = argparse.ArgumentParser(description="Pre-resolve NWS grid cells.")
+    parser.add_argument("coordinates", type=Path)
+    parser.add_argument("--output", type=Path, default=Path("grid_index.json"))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    index = GridIndex.load(args.output) if args.output.exists() else None
+    index, stats = resolve_coordinates(read_coordinates(args.coordinates), index)
+    index.save(args.output)
+    logger.info(
+        f"{len(index)} cells in {args.output}: {stats['covered']} coordinates "
+        f"already covered, {stats['points']} points lookups, {stats['cells']} "
+        f"new cells, {stats['failed']} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Pluggable JSON decoding and selective extraction for weather payloads.
+
+Full documents are decoded with the fastest available JSON library (orjson,
+then ujson), falling back to the standard library. NWS forecast documents
+are large and mostly discarded after parsing, so select_periods() decodes
+only the forecast periods, one at a time, keeping just the fields the
+parser reads instead of building the whole object graph.
+"""
+
+import contextlib
+import json
+import re
+from collections.abc import Callable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Available decoders, fastest first
+DECODERS: dict[str, Callable[[bytes | str], object]] = {}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+if ujson is not None:
+    DECODERS["ujson"] = ujson.loads
+DECODERS["json"] = json.loads
+
+DEFAULT_DECODER = next(iter(DECODERS))
+
+# Period fields read by the forecast parser
+PERIOD_FIELDS = (
+    "startTime",
+    "temperature",
+    "temperatureUnit",
+    "probabilityOfPrecipitation",
+)
+
+# Forecast properties read by the poll scheduler
+PROPERTY_FIELDS = ("updateTime", "generatedAt")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_scanner = json.JSONDecoder()
+
+
+def loads(data: bytes | str, decoder: str = DEFAULT_DECODER) -> object:
+    """Decode a JSON document.
+
+    Parameters
+    ----------
+    data : bytes or str
+        The JSON document.
+    decoder : str, optional
+        Name of the decoder to use, one of DECODERS (default: the fastest
+        available).
+
+    Returns
+    -------
+    object
+        The decoded document.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON.
+    KeyError
+        If the decoder is not available.
+    """
+    return DECODERS[decoder](data)
+
+
+def _value_index(text: str, key: str) -> int:
+    """Find where the value of the first member with a key starts.
+
+    A quote inside a JSON string is always escaped, so a quoted key followed
+    by a colon can only match an object member.
+
+    Parameters
+    ----------
+    text : str
+        The JSON document.
+    key : str
+        The member name.
+
+    Returns
+    -------
+    int
+        Index of the first character of the value.
+
+    Raises
+    ------
+    ValueError
+        If no member has the key.
+    """
+    match = re.search(rf'"{re.escape(key)}"\s*:\s*', text)
+    if match is None:
+        raise ValueError(f"JSON document has no member {key!r}")
+    return match.end()
+
+
+def extract(data: bytes | str, key: str) -> object:
+    """Decode only the value of the first member with a key.
+
+    Useful to pull a single series, such as a gridpoint's temperature, out
+    of a large document without decoding the rest of it.
+
+    Parameters
+    ----------
+    data : bytes or str
+        The JSON document.
+    key : str
+        The member name.
+
+    Returns
+    -------
+    object
+        The decoded value.
+
+    Raises
+    ------
+    ValueError
+        If no member has the key or its value is not valid JSON.
+    """
+    text = data.decode() if isinstance(data, bytes) else data
+    value, _ = _scanner.raw_decode(text, _value_index(text, key))
+    return value
+
+
+def iter_array(data: bytes | str, key: str) -> Iterator[object]:
+    """Decode the items of the first array member with a key one at a time.
+
+    Parameters
+    ----------
+    data : bytes or str
+        The JSON document.
+    key : str
+        The member name.
+
+    Yields
+    ------
+    object
+        Each decoded item of the array.
+
+    Raises
+    ------
+    ValueError
+        If no member has the key, its value is not an array or an item is
+        not valid JSON.
+    """
+    text = data.decode() if isinstance(data, bytes) else data
+    index = _value_index(text, key)
+    if text[index : index + 1] != "[":
+        raise ValueError(f"JSON member {key!r} is not an array")
+    index = _WHITESPACE.match(text, index + 1).end()
+    if text[index : index + 1] == "]":
+        return
+    while True:
+        item, index = _scanner.raw_decode(text, index)
+        yield item
+        index = _WHITESPACE.match(text, index).end()
+        separator = text[index : index + 1]
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' at index {index}")
+        index = _WHITESPACE.match(text, index + 1).end()
+
+
+def select_periods(data: bytes | str, fields: tuple[str, ...] = PERIOD_FIELDS) -> dict:
+    """Decode only the periods of an NWS forecast document.
+
+    Parameters
+    ----------
+    data : bytes or str
+        Forecast or hourly forecast document from the NWS API.
+    fields : tuple of str, optional
+        Period fields to keep (default: the fields the forecast parser
+        reads).
+
+    Returns
+    -------
+    dict
+        A forecast document holding only properties.periods, with each
+        period reduced to the selected fields, the update times in
+        PROPERTY_FIELDS and the forecast cell geometry, where present.
+
+    Raises
+    ------
+    ValueError
+        If the document has no periods array or is not valid JSON.
+    """
+    text = data.decode() if isinstance(data, bytes) else data
+    periods = [
+        {field: period[field] for field in fields if field in period}
+        for period in iter_array(text, "periods")
+    ]
+    properties: dict = {"periods": periods}
+    for field in PROPERTY_FIELDS:
+        try:
+            properties[field] = extract(text, field)
+        except ValueError:
+            continue
+    selected: dict = {"properties": properties}
+    # Polygon of the forecast grid cell
+    with contextlib.suppress(ValueError):
+        selected["geometry"] = extract(text, "geometry")
+    return selected
@@ -0,0 +1,307 @@
+"""Columnar storage and daily summaries of NWS forecast time series."""
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+# Marks a period without a precipitation probability
+MISSING_PRECIPITATION = -1
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def _to_fahrenheit(temperature: float, unit: str) -> float:
+    """Convert a temperature to degrees Fahrenheit.
+
+    Parameters
+    ----------
+    temperature : float
+        The temperature.
+    unit : str
+        Unit of the temperature, "F" or "C".
+
+    Returns
+    -------
+    float
+        The temperature in degrees Fahrenheit.
+    """
+    return temperature * 9 / 5 + 32 if unit == "C" else temperature
+
+
+class ForecastSeries:
+    """NWS forecast periods stored as compact array-backed columns.
+
+    Holds the period start times, temperatures and precipitation
+    probabilities of an hourly (or daily) forecast in typed arrays instead
+    of per-period dicts. Daily statistics are computed over contiguous
+    slices found by binary search, so min/max run as single C-level passes.
+    Local days follow the forecast's UTC offsets, so they stay aligned
+    across daylight saving time changes.
+
+    Attributes
+    ----------
+    start : array of float
+        Period start times in seconds since the epoch, ascending.
+    temperature : array of float
+        Temperatures in degrees Fahrenheit.
+    precipitation : array of int
+        Precipitation probabilities in percent, -1 where missing.
+    utc_offsets : list of (float, int)
+        UTC offsets of the forecast location in seconds, each with the
+        time it applies from, ascending; the first applies to all earlier
+        times too.
+    """
+
+    __slots__ = ("start", "temperature", "precipitation", "utc_offsets")
+
+    def __init__(
+        self,
+        start: array,
+        temperature: array,
+        precipitation: array,
+        utc_offsets: list[tuple[float, int]] | None = None,
+    ):
+        """Initializes the ForecastSeries class.
+
+        Parameters
+        ----------
+        start : array of float
+            Period start times in seconds since the epoch, ascending.
+        temperature : array of float
+            Temperatures in degrees Fahrenheit.
+        precipitation : array of int
+            Precipitation probabilities in percent, -1 where missing.
+        utc_offsets : list of (float, int), optional
+            UTC offsets in seconds with the times they apply from
+            (default: UTC throughout).
+
+        Raises
+        ------
+        ValueError
+            If the columns differ in length.
+        """
+        if not len(start) == len(temperature) == len(precipitation):
+            raise ValueError("Forecast columns must have the same length")
+        self.start = start
+        self.temperature = temperature
+        self.precipitation = precipitation
+        self.utc_offsets = utc_offsets or [(float("-inf"), 0)]
+
+    @classmethod
+    def from_payload(cls, raw_data: dict) -> "ForecastSeries":
+        """Build the columns from an NWS forecast response.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Forecast or hourly forecast response from the NWS API.
+
+        Returns
+        -------
+        ForecastSeries
+            The forecast periods in columnar form.
+
+        Raises
+        ------
+        ValueError
+            If the response has no periods or malformed times.
+        KeyError
+            If a period is missing its start time or temperature.
+        """
+        periods = raw_data.get("properties", {}).get("periods", [])
+        if not periods:
+            raise ValueError("Forecast has no periods")
+
+        start = array("d")
+        temperature = array("f")
+        precipitation = array("b")
+        utc_offsets: list[tuple[float, int]] = []
+        for period in periods:
+            period_start = datetime.fromisoformat(period["startTime"])
+            offset = period_start.utcoffset()
+            utc_offset = int(offset.total_seconds()) if offset else 0
+            # Only record changes, e.g. to daylight saving time
+            if not utc_offsets or utc_offsets[-1][1] != utc_offset:
+                utc_offsets.append((period_start.timestamp(), utc_offset))
+            start.append(period_start.timestamp())
+            temperature.append(
+                _to_fahrenheit(
+                    period["temperature"], period.get("temperatureUnit", "F")
+                )
+            )
+            probability = (period.get("probabilityOfPrecipitation") or {}).get("value")
+            precipitation.append(
+                MISSING_PRECIPITATION if probability is None else round(probability)
+            )
+
+        return cls(start, temperature, precipitation, utc_offsets)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ForecastSeries":
+        """Rebuild the columns from the output of to_dict().
+
+        Parameters
+        ----------
+        data : dict
+            Columns as lists, e.g. restored from a cache backend.
+
+        Returns
+        -------
+        ForecastSeries
+            The forecast periods in columnar form.
+        """
+        return cls(
+            array("d", data["start"]),
+            array("f", data["temperature"]),
+            array("b", data["precipitation"]),
+            [(start, offset) for start, offset in data["utc_offsets"]],
+        )
+
+    def to_dict(self) -> dict:
+        """Convert the columns to JSON-serializable lists.
+
+        Returns
+        -------
+        dict
+            Columns as lists, keyed by attribute name.
+        """
+        return {
+            "start": self.start.tolist(),
+            "temperature": self.temperature.tolist(),
+            "precipitation": self.precipitation.tolist(),
+            "utc_offsets": [list(change) for change in self.utc_offsets],
+        }
+
+    def __len__(self) -> int:
+        """Get the number of periods."""
+        return len(self.start)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the size of the column data in bytes."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.start, self.temperature, self.precipitation)
+        )
+
+    def utc_offset_at(self, when: float) -> int:
+        """Get the UTC offset of the forecast location at a time.
+
+        Parameters
+        ----------
+        when : float
+            Time in seconds since the epoch.
+
+        Returns
+        -------
+        int
+            UTC offset in seconds.
+        """
+        i = bisect_right(self.utc_offsets, when, key=lambda change: change[0])
+        return self.utc_offsets[max(i - 1, 0)][1]
+
+    def _local_midnight(self, local_day: float, near: float) -> float:
+        """Get the time a local day starts.
+
+        Parameters
+        ----------
+        local_day : float
+            Days since the epoch in local time.
+        near : float
+            A time within a day of midnight, whose UTC offset is tried
+            first.
+
+        Returns
+        -------
+        float
+            Start of the local day in seconds since the epoch.
+        """
+        midnight = local_day * SECONDS_PER_DAY
+        # Correct the guess with the offset in effect at midnight itself
+        guess = midnight - self.utc_offset_at(near)
+        return midnight - self.utc_offset_at(guess)
+
+    def day_window(self, now: float) -> tuple[int, int, int]:
+        """Find the periods of the local day.
+
+        Parameters
+        ----------
+        now : float
+            Current time in seconds since the epoch.
+
+        Returns
+        -------
+        tuple of (int, int, int)
+            Start index of the local day, index of the current period and
+            end index (exclusive) of the local day; the window always
+            holds the current period.
+        """
+        local_day = (now + self.utc_offset_at(now)) // SECONDS_PER_DAY
+        day_start = self._local_midnight(local_day, now)
+        day_end = self._local_midnight(local_day + 1, now)
+        # The period containing now, or the first one if the forecast
+        # starts in the future
+        current = max(bisect_right(self.start, now) - 1, 0)
+        first = min(bisect_left(self.start, day_start, hi=current), current)
+        end = max(bisect_left(self.start, day_end, lo=current), current + 1)
+        return first, current, min(end, len(self))
+
+    def next_change(self, now: float) -> float:
+        """Get when the summary next changes.
+
+        That is at the start of the next period or at local midnight,
+        whichever comes first.
+
+        Parameters
+        ----------
+        now : float
+            Current time in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            Time of the change in seconds since the epoch.
+        """
+        local_day = (now + self.utc_offset_at(now)) // SECONDS_PER_DAY
+        day_end = self._local_midnight(local_day + 1, now)
+        following = bisect_right(self.start, now)
+        if following < len(self):
+            return min(self.start[following], day_end)
+        return day_end
+
+    def summary(self, now: float | None = None) -> dict:
+        """Summarize temperature and precipitation for the local day.
+
+        Parameters
+        ----------
+        now : float, optional
+            Current time in seconds since the epoch (default: now).
+
+        Returns
+        -------
+        dict
+            Current temperature and precipitation probability, and their
+            minimum and maximum over the forecast periods of the local day,
+            keyed by WeatherData field name.
+        """
+        if now is None:
+            now = time.time()
+        first, current, end = self.day_window(now)
+
+        temperatures = self.temperature[first:end]
+        probabilities = self.precipitation[first:end]
+        if MISSING_PRECIPITATION in probabilities:
+            # Only filter element-wise when the slice has gaps
+            probabilities = [p for p in probabilities if p != MISSING_PRECIPITATION]
+        current_precipitation = self.precipitation[current]
+
+        # Temperatures are stored in single precision
+        return {
+            "temperature": round(self.temperature[current], 1),
+            "temperature_min": round(min(temperatures), 1),
+            "temperature_max": round(max(temperatures), 1),
+            "precipitation": max(current_precipitation, 0),
+            "precipitation_min": min(probabilities, default=0),
+            "precipitation_max": max(probabilities, default=0),
+        }
@@ -0,0 +1,233 @@
+"""Planning weather fetches from HTTP freshness and forecast update times.
+
+Instead of polling at a fixed interval, the next fetch is planned for when
+new data can be expected: not before the response stops being fresh
+(Cache-Control max-age or Expires), and just after the forecast is due to
+be updated again (its updateTime plus the typical update period). A random
+delay is added to every planned fetch, so a fleet of clocks that received
+the same response does not hit the upstream API at the same moment.
+"""
+
+import logging
+import random
+import re
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# How often the NWS regenerates a gridpoint forecast, roughly
+DEFAULT_UPDATE_PERIOD = 60 * 60  # 1 hour
+# Maximum random delay added to a planned fetch
+DEFAULT_JITTER = 5 * 60  # 5 minutes
+# Bounds of the delay between a fetch and the next one
+DEFAULT_MIN_INTERVAL = 60  # 1 minute
+DEFAULT_MAX_INTERVAL = 2 * 60 * 60  # 2 hours
+# Delay before checking again when an update is overdue
+DEFAULT_OVERDUE_INTERVAL = 10 * 60  # 10 minutes
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)\"?", re.IGNORECASE)
+_NO_CACHE = re.compile(r"(?:^|,)\s*(?:no-cache|no-store)\b", re.IGNORECASE)
+
+
+def parse_http_date(value: str) -> float | None:
+    """Parse an HTTP date header value.
+
+    Parameters
+    ----------
+    value : str
+        Header value, e.g. "Thu, 01 Jan 2026 00:00:00 GMT".
+
+    Returns
+    -------
+    float or None
+        Seconds since the epoch, or None if the value is not a valid date.
+    """
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float | None:
+    """Get how long a response stays fresh from its headers.
+
+    Follows RFC 9111: Cache-Control max-age takes precedence over Expires,
+    which is relative to the Date header. The Age header is subtracted.
+
+    Parameters
+    ----------
+    headers : Mapping
+        Response headers; names are matched case-insensitively.
+
+    Returns
+    -------
+    float or None
+        Seconds the response stays fresh from now (0 if it must not be
+        reused), or None if the headers give no freshness information.
+    """
+    headers = {name.lower(): value for name, value in headers.items()}
+
+    lifetime = None
+    cache_control = headers.get("cache-control", "")
+    if _NO_CACHE.search(cache_control):
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match is not None:
+        lifetime = float(match.group(1))
+    elif "expires" in headers:
+        expires = parse_http_date(headers["expires"])
+        if expires is None:
+            # Invalid dates, e.g. "0", mean already expired
+            return 0.0
+        date = parse_http_date(headers.get("date", ""))
+        lifetime = expires - (date if date is not None else time.time())
+
+    if lifetime is None:
+        return None
+    try:
+        age = float(headers.get("age", 0))
+    except ValueError:
+        age = 0.0
+    return max(0.0, lifetime - age)
+
+
+def expiry_time(headers: Mapping[str, str], now: float | None = None) -> float | None:
+    """Get when a response stops being fresh.
+
+    Parameters
+    ----------
+    headers : Mapping
+        Response headers.
+    now : float, optional
+        Time the response was received, in seconds since the epoch
+        (default: now).
+
+    Returns
+    -------
+    float or None
+        Expiry time in seconds since the epoch, or None if the headers give
+        no freshness information.
+    """
+    lifetime = freshness_lifetime(headers)
+    if lifetime is None:
+        return None
+    return (time.time() if now is None else now) + lifetime
+
+
+class PollScheduler:
+    """Plans when to fetch weather data next.
+
+    The plan is the later of the response's expiry time and the expected
+    time of the next forecast update, plus a random delay, kept between
+    min_interval and max_interval after the fetch. Without either hint, the
+    fallback interval is used unchanged.
+    """
+
+    def __init__(
+        self,
+        update_period: float = DEFAULT_UPDATE_PERIOD,
+        jitter: float = DEFAULT_JITTER,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        overdue_interval: float = DEFAULT_OVERDUE_INTERVAL,
+        rng: random.Random | None = None,
+    ):
+        """Initializes the PollScheduler class.
+
+        Parameters
+        ----------
+        update_period : float, optional
+            Typical seconds between forecast updates (default: 3600).
+        jitter : float, optional
+            Maximum random delay in seconds added to a planned fetch
+            (default: 300).
+        min_interval : float, optional
+            Minimum seconds between a fetch and the next (default: 60).
+        max_interval : float, optional
+            Maximum seconds between a fetch and the next (default: 7200).
+        overdue_interval : float, optional
+            Seconds to wait before checking again when a forecast update is
+            already overdue (default: 600).
+        rng : random.Random, optional
+            Random number generator for the jitter (default: a new one).
+
+        Raises
+        ------
+        ValueError
+            If an interval is negative or min_interval exceeds max_interval.
+        """
+        if min(update_period, jitter, min_interval, overdue_interval) < 0:
+            raise ValueError("Poll intervals must be non-negative")
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not exceed max_interval")
+        self.update_period = update_period
+        self.jitter = jitter
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.overdue_interval = overdue_interval
+        self._rng = rng or random.Random()
+
+    def expected_update(self, updated_at: float, now: float) -> float:
+        """Get when the next forecast update is expected.
+
+        Parameters
+        ----------
+        updated_at : float
+            When the current forecast was last updated, in seconds since the
+            epoch.
+        now : float
+            Current time in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            Expected update time in seconds since the epoch.
+        """
+        expected = updated_at + self.update_period
+        if expected <= now:
+            # Late; check again after a while rather than right away
+            return now + self.overdue_interval
+        return expected
+
+    def plan(
+        self,
+        fetched_at: float,
+        fallback: float,
+        expires: float | None = None,
+        updated_at: float | None = None,
+    ) -> float:
+        """Plan the next fetch.
+
+        Parameters
+        ----------
+        fetched_at : float
+            When the data was fetched, in seconds since the epoch.
+        fallback : float
+            Seconds until the next fetch if there are no hints.
+        expires : float, optional
+            When the response stops being fresh, in seconds since the epoch.
+        updated_at : float, optional
+            When the forecast was last updated, in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            Time of the next fetch in seconds since the epoch.
+        """
+        hints = []
+        if expires is not None:
+            hints.append(expires)
+        if updated_at is not None:
+            hints.append(self.expected_update(updated_at, fetched_at))
+        if not hints:
+            return fetched_at + fallback
+
+        planned = max(hints) + self._rng.uniform(0, self.jitter)
+        planned = min(
+            max(planned, fetched_at + self.min_interval),
+            fetched_at + self.max_interval,
+        )
+        logger.debug(f"Next weather fetch planned in {planned - fetched_at:.0f}s")
+        return planned
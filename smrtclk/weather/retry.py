@@ -0,0 +1,325 @@
+"""Deadline-bounded retries with full-jitter backoff.
+
+A RetryPolicy describes how failed requests are retried; each fetch starts
+its own RetryBudget from it, which tracks the attempts made and the time
+left before the fetch's overall deadline. The budget only decides whether
+and when to retry, so the same policy drives blocking ``requests`` fetches
+(which wait in RetryBudget.sleep) and Qt fetches (which restart a timer).
+
+Delays follow "full jitter" exponential backoff: a uniform random delay
+between zero and base_delay * 2**attempt, capped at max_delay. A
+Retry-After header on a 429 or 503 response replaces the backoff delay. A
+retry that could not start before the deadline is not attempted.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+
+from .poll_scheduler import parse_http_date
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# HTTP statuses whose Retry-After header is honored
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Maximum number of attempts per fetch, including the first
+DEFAULT_MAX_ATTEMPTS = 5
+# Backoff cap of the first retry, doubled on each later one (seconds)
+DEFAULT_BASE_DELAY = 1.0
+# Maximum delay between attempts (seconds)
+DEFAULT_MAX_DELAY = 30.0
+# Maximum time from the first attempt to the last retry (seconds)
+DEFAULT_DEADLINE = 60.0
+
+
+class RetryCancelled(Exception):
+    """Raised when a fetch is cancelled while waiting to retry."""
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Parameters
+    ----------
+    value : str or None
+        Header value: a number of seconds or an HTTP date.
+    now : float, optional
+        Current time in seconds since the epoch (default: now).
+
+    Returns
+    -------
+    float or None
+        Seconds to wait, or None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    retry_at = parse_http_date(value)
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class CancelToken:
+    """Cancels fetches waiting to retry, from any thread."""
+
+    def __init__(self):
+        """Initializes the CancelToken class."""
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the fetches using this token."""
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until cancelled or the timeout elapses.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if cancelled.
+        """
+        return self._event.wait(timeout)
+
+
+class RetryPolicy:
+    """How failed requests are retried.
+
+    Attributes
+    ----------
+    max_attempts : int
+        Maximum number of attempts per fetch, including the first.
+    base_delay : float
+        Backoff cap of the first retry in seconds.
+    max_delay : float
+        Maximum delay between attempts in seconds.
+    deadline : float
+        Maximum seconds from the first attempt to the start of the last.
+    retry_statuses : frozenset of int
+        HTTP statuses that are retried.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        deadline: float = DEFAULT_DEADLINE,
+        retry_statuses: frozenset[int] = RETRY_STATUSES,
+        rng: random.Random | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes the RetryPolicy class.
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Maximum number of attempts per fetch (default: 5).
+        base_delay : float, optional
+            Backoff cap of the first retry in seconds (default: 1.0).
+        max_delay : float, optional
+            Maximum delay between attempts in seconds (default: 30.0).
+        deadline : float, optional
+            Maximum seconds from the first attempt to the start of the last
+            (default: 60.0).
+        retry_statuses : frozenset of int, optional
+            HTTP statuses that are retried (default: 429 and 5xx gateway and
+            availability errors).
+        rng : random.Random, optional
+            Random number generator for the jitter (default: a new one).
+        clock : callable, optional
+            Monotonic clock in seconds (default: time.monotonic).
+
+        Raises
+        ------
+        ValueError
+            If max_attempts is less than 1 or a delay is negative.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if min(base_delay, max_delay, deadline) < 0:
+            raise ValueError("Retry delays must be non-negative")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self._rng = rng or random.Random()
+        self._clock = clock
+
+    def backoff(self, retry: int) -> float:
+        """Draw the delay before a retry.
+
+        Parameters
+        ----------
+        retry : int
+            Number of the retry, starting at 0.
+
+        Returns
+        -------
+        float
+            Delay in seconds.
+        """
+        cap = min(self.max_delay, self.base_delay * 2**retry)
+        return self._rng.uniform(0, cap)
+
+    def should_retry(self, status: int | None) -> bool:
+        """Check whether a failed request is worth retrying.
+
+        Parameters
+        ----------
+        status : int or None
+            HTTP status of the response, or None if no response was
+            received (connection error or timeout).
+
+        Returns
+        -------
+        bool
+            True if the request should be retried.
+        """
+        return status is None or status in self.retry_statuses
+
+    def start(self, cancel: CancelToken | None = None) -> "RetryBudget":
+        """Start the retry budget of a fetch.
+
+        Parameters
+        ----------
+        cancel : CancelToken, optional
+            Token cancelling the fetch while it waits to retry.
+
+        Returns
+        -------
+        RetryBudget
+            Budget starting now.
+        """
+        return RetryBudget(self, self._clock, cancel)
+
+
+class RetryBudget:
+    """Attempts and time left for one fetch under a RetryPolicy."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        clock: Callable[[], float],
+        cancel: CancelToken | None = None,
+    ):
+        """Initializes the RetryBudget class.
+
+        Parameters
+        ----------
+        policy : RetryPolicy
+            Policy the fetch is retried under.
+        clock : callable
+            Monotonic clock in seconds.
+        cancel : CancelToken, optional
+            Token cancelling the fetch while it waits to retry.
+        """
+        self.policy = policy
+        self.attempts = 1
+        self._clock = clock
+        self._deadline = clock() + policy.deadline
+        self._cancel = cancel
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the fetch has been cancelled."""
+        return self._cancel is not None and self._cancel.cancelled
+
+    def remaining(self) -> float:
+        """Get the seconds left before the deadline."""
+        return max(0.0, self._deadline - self._clock())
+
+    def timeout(
+        self, timeout: float | tuple[float, float]
+    ) -> float | tuple[float, float]:
+        """Limit a request timeout to the time left before the deadline.
+
+        Parameters
+        ----------
+        timeout : float or tuple of float
+            Request timeout, or connect and read timeouts, in seconds.
+
+        Returns
+        -------
+        float or tuple of float
+            The timeout, each part at most the remaining time (and at least
+            a small positive value, as requests rejects zero).
+        """
+        remaining = max(self.remaining(), 0.001)
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+    def next_delay(
+        self, status: int | None = None, retry_after: float | None = None
+    ) -> float | None:
+        """Decide whether and when to retry after a failed attempt.
+
+        Parameters
+        ----------
+        status : int or None, optional
+            HTTP status of the failed response, or None if no response was
+            received.
+        retry_after : float, optional
+            Seconds from the response's Retry-After header. Honored for 429
+            and 503 responses instead of the backoff delay.
+
+        Returns
+        -------
+        float or None
+            Seconds to wait before the next attempt, or None to give up:
+            the status is not retried, the attempts are used up, the delay
+            would pass the deadline, or the fetch was cancelled.
+        """
+        policy = self.policy
+        if self.cancelled or not policy.should_retry(status):
+            return None
+        if self.attempts >= policy.max_attempts:
+            return None
+
+        if retry_after is not None and status in RETRY_AFTER_STATUSES:
+            delay = retry_after
+        else:
+            delay = policy.backoff(self.attempts - 1)
+        if delay >= self.remaining():
+            logger.debug(f"Retry in {delay:.1f}s would pass the deadline")
+            return None
+
+        self.attempts += 1
+        return delay
+
+    def sleep(self, delay: float) -> None:
+        """Wait before retrying.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds to wait.
+
+        Raises
+        ------
+        RetryCancelled
+            If the fetch is cancelled while waiting.
+        """
+        if self._cancel is None:
+            time.sleep(delay)
+        elif self._cancel.wait(delay):
+            raise RetryCancelled("Fetch cancelled")
@@ -0,0 +1,99 @@
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """An in-flight call and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls for the same key into one call.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception. Once
+    the call finishes, the next caller for the key starts a new one.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls actually run.
+    shared : int
+        Number of callers that received another caller's result.
+    """
+
+    def __init__(self):
+        """Initializes the SingleFlight class."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call[T]] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Run the function for the key, or join the call already in flight.
+
+        Parameters
+        ----------
+        key : str
+            Key identifying the work, e.g. a cache key.
+        func : callable
+            Function doing the work.
+
+        Returns
+        -------
+        Any
+            The result of the call run for the key.
+
+        Raises
+        ------
+        Exception
+            Whatever the call for the key raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # ty: ignore[invalid-return-type]
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for the key is in flight.
+
+        Parameters
+        ----------
+        key : str
+            Key identifying the work.
+
+        Returns
+        -------
+        bool
+            True if a call for the key is running.
+        """
+        with self._lock:
+            return key in self._calls
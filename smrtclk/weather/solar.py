@@ -0,0 +1,301 @@
+"""Offline sunrise and sunset times from the NOAA solar position equations."""
+
+import datetime
+import math
+from array import array
+from functools import lru_cache
+
+# Days in the sun tables; day 366 only occurs in leap years
+DAYS_PER_TABLE = 366
+# Solar zenith at sunrise/sunset, including refraction and the solar disc
+SUNRISE_ZENITH = math.radians(90.833)
+MINUTES_PER_DAY = 24 * 60
+# Decimal places locations are rounded to before caching their tables
+LOCATION_PRECISION = 4
+# Number of location tables kept in the cache
+TABLE_CACHE_SIZE = 256
+
+
+def _julian_day(date: datetime.date) -> float:
+    """Get the Julian day of noon UTC on a date.
+
+    Parameters
+    ----------
+    date : datetime.date
+        The date.
+
+    Returns
+    -------
+    float
+        The Julian day.
+    """
+    return date.toordinal() + 1721425.0
+
+
+@lru_cache(maxsize=4)
+def _solar_terms(year: int) -> tuple[array, array, array]:
+    """Compute the location-independent solar terms for each day of a year.
+
+    Uses the NOAA solar calculator equations for the solar declination and
+    equation of time, evaluated at noon UTC.
+
+    Parameters
+    ----------
+    year : int
+        The year.
+
+    Returns
+    -------
+    tuple of array
+        Sine and cosine of the solar declination, and the equation of time
+        in minutes, indexed by day of year minus one.
+    """
+    sin_decl = array("d")
+    cos_decl = array("d")
+    eqtime = array("d")
+    first = datetime.date(year, 1, 1)
+    for day in range(DAYS_PER_TABLE):
+        # Julian centuries since J2000.0
+        t = (_julian_day(first) + day - 2451545.0) / 36525
+        mean_long = math.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360)
+        mean_anomaly = math.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+        eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+        center = (
+            math.sin(mean_anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t))
+            + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * t)
+            + math.sin(3 * mean_anomaly) * 0.000289
+        )
+        omega = math.radians(125.04 - 1934.136 * t)
+        apparent_long = math.radians(
+            math.degrees(mean_long) + center - 0.00569 - 0.00478 * math.sin(omega)
+        )
+        mean_obliquity = (
+            23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+        )
+        obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+
+        decl = math.asin(math.sin(obliquity) * math.sin(apparent_long))
+        sin_decl.append(math.sin(decl))
+        cos_decl.append(math.cos(decl))
+
+        y = math.tan(obliquity / 2) ** 2
+        eqtime.append(
+            4
+            * math.degrees(
+                y * math.sin(2 * mean_long)
+                - 2 * eccentricity * math.sin(mean_anomaly)
+                + 4
+                * eccentricity
+                * y
+                * math.sin(mean_anomaly)
+                * math.cos(2 * mean_long)
+                - 0.5 * y * y * math.sin(4 * mean_long)
+                - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+            )
+        )
+    return sin_decl, cos_decl, eqtime
+
+
+class SunTable:
+    """Sunrise and sunset for every day of a year at one location.
+
+    Times are stored as minutes after midnight UTC in float arrays indexed
+    by day of year, so a lookup is a single index. Days without a sunrise
+    or sunset (polar night or midnight sun) hold NaN.
+
+    Attributes
+    ----------
+    latitude : float
+        The latitude of the location.
+    longitude : float
+        The longitude of the location.
+    year : int
+        The year the table covers.
+    sunrise : array of float
+        Sunrise in minutes after midnight UTC per day of year.
+    sunset : array of float
+        Sunset in minutes after midnight UTC per day of year.
+    """
+
+    __slots__ = ("latitude", "longitude", "year", "sunrise", "sunset")
+
+    def __init__(self, latitude: float, longitude: float, year: int):
+        """Initializes the SunTable class, computing the whole year.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+        year : int
+            The year to compute.
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.year = year
+
+        phi = math.radians(latitude)
+        # cos(zenith) / (cos(lat) cos(decl)) - tan(lat) tan(decl), split so
+        # only the per-day declination terms vary inside the loop
+        cos_zenith = math.cos(SUNRISE_ZENITH)
+        cos_phi = math.cos(phi)
+        sin_phi = math.sin(phi)
+        noon = 720 - 4 * longitude
+
+        self.sunrise = array("f")
+        self.sunset = array("f")
+        for sin_decl, cos_decl, eqtime in zip(*_solar_terms(year), strict=True):
+            denominator = cos_phi * cos_decl
+            if denominator == 0:
+                cos_ha = math.nan
+            else:
+                cos_ha = (cos_zenith - sin_phi * sin_decl) / denominator
+            if -1 <= cos_ha <= 1:
+                ha = math.degrees(math.acos(cos_ha))
+                self.sunrise.append(noon - 4 * ha - eqtime)
+                self.sunset.append(noon + 4 * ha - eqtime)
+            else:
+                self.sunrise.append(math.nan)
+                self.sunset.append(math.nan)
+
+    def solar_noon(self, date: datetime.date) -> float:
+        """Get the solar noon of a date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date.
+
+        Returns
+        -------
+        float
+            Solar noon in minutes after midnight UTC.
+        """
+        eqtime = _solar_terms(self.year)[2]
+        return 720 - 4 * self.longitude - eqtime[date.timetuple().tm_yday - 1]
+
+    def times(self, date: datetime.date) -> tuple[float, float]:
+        """Get the sunrise and sunset of a date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date.
+
+        Returns
+        -------
+        tuple of float
+            Sunrise and sunset in minutes after midnight UTC, NaN if the sun
+            does not rise or set that day.
+        """
+        day = date.timetuple().tm_yday - 1
+        return self.sunrise[day], self.sunset[day]
+
+    def is_polar_night(self, date: datetime.date) -> bool:
+        """Check whether the sun stays below the horizon on a date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date.
+
+        Returns
+        -------
+        bool
+            True for polar night, False otherwise (including midnight sun).
+        """
+        day = date.timetuple().tm_yday - 1
+        if not math.isnan(self.sunrise[day]):
+            return False
+        # Below the horizon at noon means it never rises
+        sin_decl, cos_decl, _ = _solar_terms(self.year)
+        phi = math.radians(self.latitude)
+        sin_altitude = math.sin(phi) * sin_decl[day] + math.cos(phi) * cos_decl[day]
+        return sin_altitude < math.cos(SUNRISE_ZENITH)
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _cached_table(latitude: float, longitude: float, year: int) -> SunTable:
+    return SunTable(latitude, longitude, year)
+
+
+def sun_table(latitude: float, longitude: float, year: int) -> SunTable:
+    """Get the cached sun table of a location, computing it on first use.
+
+    Parameters
+    ----------
+    latitude : float
+        The latitude of the location.
+    longitude : float
+        The longitude of the location.
+    year : int
+        The year.
+
+    Returns
+    -------
+    SunTable
+        Sunrise and sunset for every day of the year.
+    """
+    return _cached_table(
+        round(latitude, LOCATION_PRECISION),
+        round(longitude, LOCATION_PRECISION),
+        year,
+    )
+
+
+def _format_minutes(minutes: float) -> str:
+    """Format minutes after midnight as HH:MM, wrapping around midnight.
+
+    Parameters
+    ----------
+    minutes : float
+        Minutes after midnight.
+
+    Returns
+    -------
+    str
+        The time in the format HH:MM.
+    """
+    total = round(minutes) % MINUTES_PER_DAY
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def sun_times(
+    latitude: float,
+    longitude: float,
+    date: datetime.date,
+    utc_offset: float = 0,
+) -> tuple[str, str]:
+    """Get the local sunrise and sunset of a date at a location.
+
+    During polar night both times are solar noon; during midnight sun the
+    sun rises at 00:00 and sets at 23:59.
+
+    Parameters
+    ----------
+    latitude : float
+        The latitude of the location.
+    longitude : float
+        The longitude of the location.
+    date : datetime.date
+        The local date.
+    utc_offset : float, optional
+        UTC offset of the local time in seconds (default: 0).
+
+    Returns
+    -------
+    tuple of str
+        Sunrise and sunset in the format HH:MM, local time.
+    """
+    table = sun_table(latitude, longitude, date.year)
+    sunrise, sunset = table.times(date)
+    offset = utc_offset / 60
+
+    if math.isnan(sunrise):
+        if table.is_polar_night(date):
+            noon = _format_minutes(table.solar_noon(date) + offset)
+            return noon, noon
+        return "00:00", "23:59"
+
+    return _format_minutes(sunrise + offset), _format_minutes(sunset + offset)
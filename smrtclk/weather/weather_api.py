@@ -1,18 +1,37 @@
+import http.client
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import TypedDict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, fields, replace
+
+from .circuit_breaker import CircuitBreaker
+from .retry import RETRY_STATUSES
+from .single_flight import SingleFlight
+from .weather_cache import WeatherCacheBackend, cache_key
 
 logger = logging.getLogger(__name__)
 
+# How long persisted weather data may be restored after it was fetched
+DEFAULT_PERSIST_TTL = 24 * 60 * 60  # 1 day
+
 
-class WeatherData(TypedDict, total=False):
-    """Type definition for weather data returned by WeatherAPI.
+@dataclass(frozen=True, slots=True, eq=False)
+class WeatherData(Mapping):
+    """Immutable weather record returned by WeatherAPI.
+
+    Fields that were not set are None and are left out when the record is
+    used as a mapping, so it reads like a dict of the fields that are
+    present (e.g. data["temperature"], data.get("status")). Records are
+    never modified, so cached records are shared by every caller instead
+    of being copied.
 
     Attributes
     ----------
     status : str
-        Status of the weather data fetch: "ok", "error", or "cached".
+        Status of the weather data fetch: "ok", "error", "cached", or
+        "stale" (expired cached data served while a refresh runs).
     error_message : str
         Error message if status is "error".
     temperature : float
@@ -33,16 +52,180 @@ class WeatherData(TypedDict, total=False):
         Time of sunset in the format HH:MM.
     """
 
-    status: str
-    error_message: str
-    temperature: float
-    temperature_min: float
-    temperature_max: float
-    precipitation: int
-    precipitation_min: int
-    precipitation_max: int
-    sunrise: str
-    sunset: str
+    status: str | None = None
+    error_message: str | None = None
+    temperature: float | None = None
+    temperature_min: float | None = None
+    temperature_max: float | None = None
+    precipitation: int | None = None
+    precipitation_min: int | None = None
+    precipitation_max: int | None = None
+    sunrise: str | None = None
+    sunset: str | None = None
+
+    @classmethod
+    def from_mapping(cls, data: Mapping) -> "WeatherData":
+        """Build a record from a mapping, ignoring unknown keys.
+
+        Parameters
+        ----------
+        data : Mapping
+            Weather data keyed by field name, e.g. decoded JSON.
+
+        Returns
+        -------
+        WeatherData
+            The record, or data itself if it already is one.
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(**{key: data[key] for key in _WEATHER_FIELDS if key in data})
+
+    def with_status(self, status: str | None) -> "WeatherData":
+        """Get a copy of the record with a different status.
+
+        Parameters
+        ----------
+        status : str or None
+            The status of the copy.
+
+        Returns
+        -------
+        WeatherData
+            The copy, or the record itself if the status is unchanged.
+        """
+        if status == self.status:
+            return self
+        return replace(self, status=status)
+
+    def to_dict(self) -> dict:
+        """Convert the record to a dict of the fields that are set.
+
+        Returns
+        -------
+        dict
+            The set fields, suitable for JSON serialization.
+        """
+        return {key: self[key] for key in self}
+
+    def __getitem__(self, key: str):
+        if key in _WEATHER_FIELD_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in _WEATHER_FIELDS if getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(getattr(self, key) is not None for key in _WEATHER_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"WeatherData({self.to_dict()!r})"
+
+
+_WEATHER_FIELDS = tuple(field.name for field in fields(WeatherData))
+_WEATHER_FIELD_SET = frozenset(_WEATHER_FIELDS)
+
+
+class WeatherNotModified(Exception):
+    """Raised by a fetch when upstream data is unchanged since it was cached.
+
+    Providers that support conditional requests raise this from
+    _fetch_weather_data() so the cached data can be reused without
+    downloading or parsing it again.
+    """
+
+
+class WeatherHTTPError(Exception):
+    """Raised by a fetch when the provider answers with an HTTP error.
+
+    Attributes
+    ----------
+    status : int
+        The HTTP status code.
+    """
+
+    def __init__(self, status: int, message: str):
+        """Initializes the WeatherHTTPError class.
+
+        Parameters
+        ----------
+        status : int
+            The HTTP status code.
+        message : str
+            Description of the error.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def is_outage(error: Exception) -> bool:
+    """Check whether a failed fetch means the provider is unavailable.
+
+    Connection errors, timeouts and retryable HTTP statuses (rate limiting
+    and server errors) count. Other HTTP errors, such as a 404 for a point
+    outside the provider's coverage, and malformed data do not: the
+    provider answered, so its circuit breaker ignores them.
+
+    Parameters
+    ----------
+    error : Exception
+        The error the fetch raised.
+
+    Returns
+    -------
+    bool
+        True if the error counts toward opening the circuit.
+    """
+    if isinstance(error, WeatherHTTPError):
+        return error.status in RETRY_STATUSES
+    # Socket errors, including those of requests, and broken HTTP responses
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+def validate_latitude(latitude: float) -> None:
+    """Validate a latitude.
+
+    Parameters
+    ----------
+    latitude : float
+        The latitude value (-90 to 90).
+
+    Raises
+    ------
+    TypeError
+        If latitude is not a number.
+    ValueError
+        If latitude is outside the valid range.
+    """
+    if not isinstance(latitude, (int, float)):
+        raise TypeError("Latitude must be an int or float")
+    # Written so that NaN fails the check too
+    if not -90 <= latitude <= 90:
+        raise ValueError("Latitude must be between -90 and 90")
+
+
+def validate_longitude(longitude: float) -> None:
+    """Validate a longitude.
+
+    Parameters
+    ----------
+    longitude : float
+        The longitude value (-180 to 180).
+
+    Raises
+    ------
+    TypeError
+        If longitude is not a number.
+    ValueError
+        If longitude is outside the valid range.
+    """
+    if not isinstance(longitude, (int, float)):
+        raise TypeError("Longitude must be an int or float")
+    if not -180 <= longitude <= 180:
+        raise ValueError("Longitude must be between -180 and 180")
 
 
 class WeatherAPI(ABC):
@@ -50,9 +233,33 @@ class WeatherAPI(ABC):
 
     Provides common functionality for latitude/longitude validation,
     caching, and the template method pattern for fetching weather data.
+
+    An optional cache backend persists fetched data keyed by provider and
+    location, so a restarted process can serve it without waiting on the
+    network.
+
+    Instances are thread-safe: cache access is synchronized, and concurrent
+    callers needing a fetch for the same provider and location share one
+    in-flight fetch and its result.
+
+    Fetches go through a circuit breaker. After repeated failures it opens,
+    and fetches are skipped in favor of the last cached data (status
+    "offline") until a reachability probe and a trial fetch succeed.
     """
 
-    def __init__(self, latitude: float, longitude: float, cache_duration: int = 900):
+    # Provider name used in persistent cache keys
+    provider_name: str = ""
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        cache_duration: int = 900,
+        cache_backend: WeatherCacheBackend | None = None,
+        persist_ttl: int = DEFAULT_PERSIST_TTL,
+        circuit_breaker: CircuitBreaker | None = None,
+        single_flight: SingleFlight[WeatherData] | None = None,
+    ):
         """Initializes the WeatherAPI class.
 
         Parameters
@@ -63,12 +270,43 @@ class WeatherAPI(ABC):
             The longitude of the location to get the weather for.
         cache_duration : int, optional
             Cache duration in seconds (default: 900 = 15 minutes).
+        cache_backend : WeatherCacheBackend, optional
+            Backend persisting weather data across restarts (default: None).
+        persist_ttl : int, optional
+            Seconds after fetching for which persisted data may be restored
+            (default: 86400 = 1 day).
+        circuit_breaker : CircuitBreaker, optional
+            Breaker tracking the provider's failures, possibly shared with
+            other instances (default: a new breaker probing the provider).
+        single_flight : SingleFlight, optional
+            Coalesces concurrent fetches by cache key, possibly shared with
+            other instances of the provider (default: one for this
+            instance only).
         """
         # Store cache duration
         self._cache_duration = cache_duration
         # Initialize cache
         self._weather_cache: WeatherData | None = None
         self._cache_timestamp: float | None = None
+        # Seconds after the fetch the cached data is served for
+        self._cache_lifetime: float = cache_duration
+        # Shared copies of the cached record per reported status
+        self._cache_views: dict[str, WeatherData] = {}
+        self._cache_lock = threading.RLock()
+        # Coalesces concurrent fetches per cache key
+        self._flights: SingleFlight[WeatherData] = single_flight or SingleFlight()
+        # Persistent cache backend
+        self._cache_backend = cache_backend
+        self._persist_ttl = persist_ttl
+        self._restore_pending = cache_backend is not None
+        # Whether the cached data was restored and not fetched since
+        self._restored = False
+        # Stale-while-revalidate (disabled until max_stale is set)
+        self._max_stale: int | None = None
+        self._refresh_listeners: list[Callable[[WeatherData], None]] = []
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self._breaker = circuit_breaker or CircuitBreaker(probe=self._probe_reachable)
         # Set latitude and longitude (triggers validation and cache invalidation)
         self.latitude = latitude
         self.longitude = longitude
@@ -94,13 +332,9 @@ class WeatherAPI(ABC):
         ValueError
             If latitude is outside the valid range.
         """
-        if not isinstance(latitude, (int, float)):
-            raise TypeError("Latitude must be an int or float")
-        if latitude < -90 or latitude > 90:
-            raise ValueError("Latitude must be between -90 and 90")
+        validate_latitude(latitude)
         self._latitude = latitude
-        # Invalidate cache when location changes
-        self._invalidate_cache()
+        self._location_changed()
 
     @property
     def longitude(self) -> float:
@@ -123,18 +357,105 @@ class WeatherAPI(ABC):
         ValueError
             If longitude is outside the valid range.
         """
-        if not isinstance(longitude, (int, float)):
-            raise TypeError("Longitude must be an int or float")
-        if longitude < -180 or longitude > 180:
-            raise ValueError("Longitude must be between -180 and 180")
+        validate_longitude(longitude)
         self._longitude = longitude
-        # Invalidate cache when location changes
+        self._location_changed()
+
+    def set_location(self, latitude: float, longitude: float) -> None:
+        """Move to a new location, changing both coordinates at once.
+
+        Unlike setting latitude and longitude in turn, the cache is only
+        checked against the final location, not an intermediate one.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude value (-90 to 90).
+        longitude : float
+            The longitude value (-180 to 180).
+
+        Raises
+        ------
+        TypeError
+            If a coordinate is not a number.
+        ValueError
+            If a coordinate is outside the valid range.
+        """
+        validate_latitude(latitude)
+        validate_longitude(longitude)
+        self._latitude = latitude
+        self._longitude = longitude
+        self._location_changed()
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker, e.g. to monitor its stats()."""
+        return self._breaker
+
+    @property
+    def max_stale(self) -> int | None:
+        """Get the maximum staleness served while revalidating, in seconds."""
+        return self._max_stale
+
+    @max_stale.setter
+    def max_stale(self, max_stale: int | None) -> None:
+        """Set how long past expiry cached data may be served.
+
+        While cached data is expired by no more than this many seconds,
+        get_current_weather() returns it immediately with status "stale" and
+        refreshes in a background thread instead of blocking on the fetch.
+
+        Parameters
+        ----------
+        max_stale : int or None
+            Maximum seconds past expiry, or None to disable.
+
+        Raises
+        ------
+        ValueError
+            If max_stale is negative.
+        """
+        if max_stale is not None and max_stale < 0:
+            raise ValueError("max_stale must be non-negative")
+        self._max_stale = max_stale
+
+    def add_refresh_listener(self, callback: Callable[[WeatherData], None]) -> None:
+        """Register a callback for results of background refreshes.
+
+        The callback is invoked from the refresh thread with the result of
+        each background refresh, including error results.
+
+        Parameters
+        ----------
+        callback : callable
+            Function taking the refreshed WeatherData.
+        """
+        self._refresh_listeners.append(callback)
+
+    def remove_refresh_listener(self, callback: Callable[[WeatherData], None]) -> None:
+        """Unregister a background refresh callback.
+
+        Parameters
+        ----------
+        callback : callable
+            A callback previously passed to add_refresh_listener().
+        """
+        self._refresh_listeners.remove(callback)
+
+    def _location_changed(self) -> None:
+        """Invalidate the cache for a new latitude or longitude.
+
+        Providers that can tell the cached data still applies to the new
+        location override this to keep it.
+        """
         self._invalidate_cache()
+        # Bring back data persisted for the new location
+        self._restore_pending = self._cache_backend is not None
 
     def _invalidate_cache(self) -> None:
         """Invalidate the weather data cache."""
-        self._weather_cache = None
-        self._cache_timestamp = None
+        with self._cache_lock:
+            self._store_cache(None, None)
         logger.debug("Weather cache invalidated")
 
     def _is_cache_valid(self) -> bool:
@@ -149,19 +470,37 @@ class WeatherAPI(ABC):
             return False
 
         age = time.time() - self._cache_timestamp
-        is_valid = age < self._cache_duration
+        is_valid = age < self._cache_lifetime
 
         if not is_valid:
             logger.debug(
-                f"Cache expired (age: {age:.1f}s, max: {self._cache_duration}s)"
+                f"Cache expired (age: {age:.1f}s, max: {self._cache_lifetime:.0f}s)"
             )
 
         return is_valid
 
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the API.
+
+        The base implementation does nothing; subclasses holding network
+        sessions or other resources override it.
+        """
+
+    def __enter__(self) -> "WeatherAPI":
+        """Enter a context that closes the API on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the API when leaving the context."""
+        self.close()
+
     def refresh(self) -> None:
         """Force refresh of weather data by invalidating cache."""
         logger.info("Forcing weather data refresh")
-        self._invalidate_cache()
+        with self._cache_lock:
+            self._invalidate_cache()
+            # Don't bring back the persisted data that is being replaced
+            self._restore_pending = False
         self.get_current_weather()  # Fetch new data immediately after refresh
 
     def get_current_weather(self) -> WeatherData:
@@ -171,47 +510,392 @@ class WeatherAPI(ABC):
         is available and fresh, it returns the cached data. Otherwise, it
         fetches new data from the API.
 
+        If stale-while-revalidate is enabled (see max_stale) and the cached
+        data expired recently enough, it is returned with status "stale"
+        while fresh data is fetched in the background.
+
+        Concurrent callers that need a fetch share a single one.
+
         Returns
         -------
         WeatherData
-            Dictionary with weather data and status information.
+            Weather record with status information.
         """
-        # Return cached data if valid
-        if self._is_cache_valid():
-            logger.debug("Returning cached weather data")
-            cached_data: WeatherData = (
-                self._weather_cache.copy() if self._weather_cache else {}
+        with self._cache_lock:
+            # Load data persisted by a previous run for this location
+            if self._restore_pending:
+                self._restore_pending = False
+                self._restore_cache()
+
+            # Return cached data if valid
+            if self._is_cache_valid():
+                logger.debug("Returning cached weather data")
+                return self._cached_weather()
+
+            # Serve expired data while refreshing in the background
+            if self._can_serve_stale():
+                self._start_background_refresh()
+                logger.debug("Returning stale weather data")
+                return self._cached_weather("stale")
+
+        return self._fetch_and_cache()
+
+    def parse_weather_data(self, raw_data: dict) -> WeatherData:
+        """Parse raw provider data fetched outside of this class.
+
+        Lets other transports (e.g. an asynchronous Qt network pipeline)
+        fetch the raw data themselves and reuse the provider's parsing.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Raw weather data in the provider's format.
+
+        Returns
+        -------
+        WeatherData
+            Parsed weather data with status "ok".
+        """
+        weather_data = self._parse_weather_data(raw_data)
+        if weather_data.status is None:
+            weather_data = weather_data.with_status("ok")
+        return weather_data
+
+    def _can_serve_stale(self) -> bool:
+        """Check if expired cached data is recent enough to serve as stale.
+
+        Returns
+        -------
+        bool
+            True if stale-while-revalidate is enabled and the cached data
+            expired no more than max_stale seconds ago.
+        """
+        if self._max_stale is None:
+            return False
+        if self._weather_cache is None or self._cache_timestamp is None:
+            return False
+        age = time.time() - self._cache_timestamp
+        return age < self._cache_lifetime + self._max_stale
+
+    def _start_background_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                args=((self.latitude, self.longitude),),
+                name="weather-refresh",
+                daemon=True,
             )
-            cached_data["status"] = "cached"
-            return cached_data
+            self._refresh_thread.start()
+
+    def _background_refresh(self, location: tuple[float, float]) -> None:
+        """Fetch fresh data and notify refresh listeners.
+
+        Parameters
+        ----------
+        location : tuple of float
+            Latitude and longitude when the refresh was started.
+        """
+        weather_data = self._fetch_and_cache(location)
+        for callback in list(self._refresh_listeners):
+            try:
+                callback(weather_data)
+            except Exception as e:
+                logger.error(f"Weather refresh listener failed: {e}", exc_info=True)
+
+    def _fetch_and_cache(
+        self, location: tuple[float, float] | None = None
+    ) -> WeatherData:
+        """Fetch, parse and cache fresh weather data, coalescing callers.
+
+        If a fetch for the same provider and location is already in flight,
+        waits for it and returns its result instead of fetching again. With
+        a SingleFlight shared by several instances, fresh data fetched by
+        another instance is cached by this one as well.
+
+        Parameters
+        ----------
+        location : tuple of float, optional
+            Latitude and longitude the data is wanted for (default: the
+            current location). The result is not cached if the location
+            has changed since.
+
+        Returns
+        -------
+        WeatherData
+            The fresh data, the renewed cached data if unchanged upstream,
+            restored data with status "offline" or an error result.
+        """
+        if location is None:
+            location = (self.latitude, self.longitude)
+        fetched = False
+
+        def fetch() -> WeatherData:
+            nonlocal fetched
+            fetched = True
+            return self._fetch_and_cache_once(location)
+
+        # Records are immutable, so callers can share the result
+        weather_data = self._flights.do(self._cache_key("weather", location), fetch)
+        if not fetched and weather_data.status == "ok":
+            with self._cache_lock:
+                # Another instance fetched it, so cache it here too
+                if (
+                    location == (self.latitude, self.longitude)
+                    and self._weather_cache is not weather_data
+                ):
+                    self._store_cache(weather_data, time.time())
+        return weather_data
+
+    def _fetch_and_cache_once(self, location: tuple[float, float]) -> WeatherData:
+        """Fetch, parse and cache fresh weather data.
+
+        Data parsed with a status other than "ok", such as a provider's own
+        "stale" or "offline" data, is returned without being cached.
+
+        Parameters
+        ----------
+        location : tuple of float
+            Latitude and longitude the data is wanted for.
+
+        Returns
+        -------
+        WeatherData
+            The fresh data, the renewed cached data if unchanged upstream,
+            restored data with status "offline" or an error result.
+        """
+        with self._cache_lock:
+            # Another fetch may have finished since the caller checked
+            if location == (self.latitude, self.longitude) and self._is_cache_valid():
+                return self._cached_weather()
+
+        # Don't run the retry ladder against a provider known to be down
+        if not self._breaker.allow_request():
+            logger.debug("Circuit open, weather fetch skipped")
+            return self._offline_weather()
 
-        # Fetch fresh data
         try:
             logger.info(
                 f"Fetching weather data for ({self.latitude}, {self.longitude})"
             )
-            raw_data = self._fetch_weather_data()
-            weather_data = self._parse_weather_data(raw_data)
+            try:
+                raw_data = self._fetch_weather_data()
+            except WeatherNotModified:
+                self._breaker.record_success()
+                with self._cache_lock:
+                    if self._weather_cache is None:
+                        raise
+                    # Upstream data is unchanged, so keep the cache without parsing
+                    self._cache_timestamp = time.time()
+                    self._restored = False
+                    self._cache_lifetime = (
+                        self._plan_next_fetch(self._cache_timestamp)
+                        - self._cache_timestamp
+                    )
+                    self._persist_cache()
+                    logger.info("Weather data not modified, cache renewed")
+                    return self._cached_weather()
+            except Exception as e:
+                if is_outage(e):
+                    self._breaker.record_failure()
+                else:
+                    # The provider answered, so it is neither down nor back up
+                    self._breaker.record_ignored()
+                raise
+            self._breaker.record_success()
+
+            weather_data, state = self._parse_fetched(raw_data)
 
             # Add success status if not already set
-            if "status" not in weather_data:
-                weather_data["status"] = "ok"
-
-            # Cache the result
-            self._weather_cache = weather_data
-            self._cache_timestamp = time.time()
+            if weather_data.status is None:
+                weather_data = weather_data.with_status("ok")
+            elif weather_data.status != "ok":
+                # The provider served its own expired data, which isn't fresh
+                logger.info(f"Weather data {weather_data.status}, result not cached")
+                return weather_data
+
+            with self._cache_lock:
+                # Don't cache data for a location changed mid-fetch
+                if location != (self.latitude, self.longitude):
+                    logger.info("Location changed during fetch, result not cached")
+                    return weather_data
+
+                # Cache the result
+                self._store_cache(weather_data, time.time(), state)
+                self._persist_cache()
 
             logger.info("Weather data fetched successfully")
             return weather_data
 
         except Exception as e:
-            logger.error(f"Error fetching weather data: {e}", exc_info=True)
+            if self._breaker.failures <= 1:
+                logger.error(f"Error fetching weather data: {e}", exc_info=True)
+            else:
+                # The trace was logged for the first failure of this outage
+                logger.warning(f"Error fetching weather data: {e}")
+            with self._cache_lock:
+                # Without a fetch since the restart, the persisted data beats none
+                if self._restored and location == (self.latitude, self.longitude):
+                    return self._cached_weather("offline")
             # Return error status
-            error_data: WeatherData = {
-                "status": "error",
-                "error_message": str(e),
-            }
-            return error_data
+            return WeatherData(status="error", error_message=str(e))
+
+    def _offline_weather(self) -> WeatherData:
+        """Get the result of a fetch skipped by the open circuit.
+
+        Returns
+        -------
+        WeatherData
+            The cached weather data with status "offline", or an error
+            result if nothing is cached.
+        """
+        with self._cache_lock:
+            if self._weather_cache is not None:
+                return self._cached_weather("offline")
+        return WeatherData(status="error", error_message="Weather provider unavailable")
+
+    def _probe_reachable(self) -> bool:
+        """Check cheaply whether the provider is reachable.
+
+        Run by the circuit breaker before a trial fetch. Providers with a
+        cheaper check than a full fetch override this.
+
+        Returns
+        -------
+        bool
+            True if the provider looks reachable (default: always).
+        """
+        return True
+
+    def _cache_key(self, kind: str, location: tuple[float, float] | None = None) -> str:
+        """Build the persistent cache key for this provider and location.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of entry, e.g. "weather".
+        location : tuple of float, optional
+            Latitude and longitude (default: the current location).
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        if location is None:
+            location = (self.latitude, self.longitude)
+        provider = self.provider_name or type(self).__name__
+        return cache_key(provider, *location, kind)
+
+    def _restore_cache(self) -> None:
+        """Restore cached data persisted for the current location.
+
+        The restored data keeps its original fetch time, so it is only
+        treated as fresh for the remainder of the cache duration. Until a
+        fetch succeeds, failed fetches return it with status "offline".
+        Subclasses override this to restore provider-specific state.
+        """
+        if self._cache_backend is None:
+            return
+        entry = self._cache_backend.get(self._cache_key("weather"))
+        if entry is None:
+            return
+        self._store_cache(WeatherData.from_mapping(entry.value), entry.stored_at)
+        self._restored = True
+        logger.info(
+            f"Restored persisted weather data ({time.time() - entry.stored_at:.0f}s old)"
+        )
+
+    def _persist_cache(self) -> None:
+        """Persist the cached data for the current location.
+
+        Subclasses override this to persist provider-specific state.
+        """
+        if self._cache_backend is None or self._weather_cache is None:
+            return
+        try:
+            self._cache_backend.set(
+                self._cache_key("weather"),
+                self._weather_cache.to_dict(),
+                self._persist_ttl,
+                stored_at=self._cache_timestamp,
+            )
+        except Exception as e:
+            # Persistence is best effort; the in-memory cache still works
+            logger.warning(f"Failed to persist weather data: {e}")
+
+    def _store_cache(
+        self,
+        weather_data: WeatherData | None,
+        timestamp: float | None,
+        state: object = None,  # noqa: ARG002
+    ) -> None:
+        """Replace the cached weather data.
+
+        Parameters
+        ----------
+        weather_data : WeatherData or None
+            The data to cache, or None to clear the cache.
+        timestamp : float or None
+            When the data was fetched, in seconds since the epoch.
+        state : object, optional
+            Provider state parsed along with the data by _parse_fetched(),
+            or None for data cached otherwise (default: None).
+        """
+        self._weather_cache = weather_data
+        self._cache_timestamp = timestamp
+        self._cache_lifetime = (
+            self._cache_duration
+            if timestamp is None
+            else self._plan_next_fetch(timestamp) - timestamp
+        )
+        self._cache_views = {}
+        self._restored = False
+
+    def _plan_next_fetch(self, fetched_at: float) -> float:
+        """Plan when fetched data expires from the cache.
+
+        The data is fetched again once it expires. Providers whose responses
+        tell when new data can be expected override this.
+
+        Parameters
+        ----------
+        fetched_at : float
+            When the data was fetched, in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            Expiry time in seconds since the epoch (default: the cache
+            duration after fetched_at).
+        """
+        return fetched_at + self._cache_duration
+
+    def _cached_weather(self, status: str = "cached") -> WeatherData:
+        """Get the cached weather data with the given status.
+
+        The record for each status is created once per cached fetch and
+        shared by every cache hit.
+
+        Parameters
+        ----------
+        status : str, optional
+            Status to report, "cached", "stale" or "offline" (default:
+            "cached").
+
+        Returns
+        -------
+        WeatherData
+            The cached weather data with the given status.
+        """
+        if self._weather_cache is None:
+            return WeatherData(status=status)
+        view = self._cache_views.get(status)
+        if view is None:
+            view = self._cache_views[status] = self._weather_cache.with_status(status)
+        return view
 
     @abstractmethod
     def _fetch_weather_data(self) -> dict:
@@ -227,17 +911,39 @@ class WeatherAPI(ABC):
 
         Raises
         ------
+        WeatherNotModified
+            If the data is unchanged since the cached copy was fetched.
         Exception
             If there's an error fetching the data.
         """
         pass
 
+    def _parse_fetched(self, raw_data: dict) -> tuple[WeatherData, object]:
+        """Parse fetched data along with the provider state cached with it.
+
+        The state is handed to _store_cache() with the data rather than
+        kept on the instance, so concurrent fetches never mix up their
+        state. Providers caching more than the parsed data override this.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Raw weather data from _fetch_weather_data().
+
+        Returns
+        -------
+        tuple of (WeatherData, object)
+            The parsed data and the state to cache with it (default: None).
+        """
+        return self._parse_weather_data(raw_data), None
+
     @abstractmethod
     def _parse_weather_data(self, raw_data: dict) -> WeatherData:
         """Parse raw weather data into standardized format.
 
         Subclasses must implement this method to convert their API-specific
-        data format into the WeatherData format.
+        data format into the WeatherData format. The status is left None
+        for fresh data, which is then reported as "ok".
 
         Parameters
         ----------
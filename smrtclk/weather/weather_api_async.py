@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+from .weather_api import WeatherData, validate_latitude, validate_longitude
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum number of locations fetched at once
+DEFAULT_MAX_CONCURRENCY = 8
+# Maximum request rate per host in requests per second
+DEFAULT_RATE_LIMIT = 10.0
+
+
+class HostRateLimiter:
+    """Spaces out request starts per host to a maximum rate.
+
+    Each host gets evenly spaced request slots; a request waits for the
+    next free slot of its host, so bursts are smoothed rather than rejected.
+    """
+
+    def __init__(self, rate: float | None):
+        """Initializes the HostRateLimiter class.
+
+        Parameters
+        ----------
+        rate : float or None
+            Maximum requests per second per host, or None for no limit.
+
+        Raises
+        ------
+        ValueError
+            If rate is not positive.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        self._interval = 1.0 / rate if rate is not None else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the URL's host may start.
+
+        Parameters
+        ----------
+        url : str
+            URL about to be requested.
+        """
+        if not self._interval:
+            return
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        # Claim a slot before awaiting so concurrent callers queue up behind it
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncWeatherAPI(ABC):
+    """Abstract base class for asynchronous multi-location weather APIs.
+
+    The asynchronous counterpart of WeatherAPI: the same template method
+    split into _fetch_weather_data() and _parse_weather_data(), but not
+    bound to a single location, so one instance fetches any number of
+    locations concurrently with gather_weather().
+
+    Blocking I/O runs on a private thread pool sized to the concurrency
+    limit. Requests are further throttled per host by a HostRateLimiter.
+    An instance may be used from several event loops, e.g. successive
+    asyncio.run() calls; the concurrency limit applies per loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+    ):
+        """Initializes the AsyncWeatherAPI class.
+
+        Parameters
+        ----------
+        max_concurrency : int, optional
+            Maximum number of locations fetched at once (default: 8).
+        rate_limit : float or None, optional
+            Maximum requests per second per host, or None for no limit
+            (default: 10.0).
+
+        Raises
+        ------
+        ValueError
+            If max_concurrency is less than 1 or rate_limit is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = HostRateLimiter(rate_limit)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="weather-async"
+        )
+        # One per event loop, as asyncio primitives bind to the loop using them
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @property
+    def max_concurrency(self) -> int:
+        """Get the maximum number of locations fetched at once."""
+        return self._max_concurrency
+
+    async def close(self) -> None:
+        """Release the thread pool and any resources held by the API."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncWeatherAPI":
+        """Enter a context that closes the API on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the API when leaving the context."""
+        await self.close()
+
+    async def get_weather(self, latitude: float, longitude: float) -> WeatherData:
+        """Gets the current weather for a location.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location to get the weather for.
+        longitude : float
+            The longitude of the location to get the weather for.
+
+        Returns
+        -------
+        WeatherData
+            Weather record with status information.
+
+        Raises
+        ------
+        TypeError
+            If latitude or longitude is not a number.
+        ValueError
+            If latitude or longitude is outside the valid range.
+        """
+        validate_latitude(latitude)
+        validate_longitude(longitude)
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self._max_concurrency
+            )
+
+        async with semaphore:
+            try:
+                logger.info(f"Fetching weather data for ({latitude}, {longitude})")
+                raw_data = await self._fetch_weather_data(latitude, longitude)
+                weather_data = self._parse_weather_data(raw_data, latitude, longitude)
+            except Exception as e:
+                logger.error(f"Error fetching weather data: {e}", exc_info=True)
+                return WeatherData(status="error", error_message=str(e))
+
+        # Add success status if not already set
+        if weather_data.status is None:
+            weather_data = weather_data.with_status("ok")
+        return weather_data
+
+    async def gather_weather(
+        self, locations: Iterable[tuple[float, float]]
+    ) -> list[WeatherData]:
+        """Gets the current weather for many locations concurrently.
+
+        Failures are reported per location with status "error", so one bad
+        location does not affect the others.
+
+        Parameters
+        ----------
+        locations : iterable of (float, float)
+            Latitude and longitude pairs.
+
+        Returns
+        -------
+        list of WeatherData
+            Weather data for each location, in the order given.
+
+        Raises
+        ------
+        TypeError
+            If any latitude or longitude is not a number.
+        ValueError
+            If any latitude or longitude is outside the valid range.
+        """
+        locations = list(locations)
+        # Reject invalid input before any request is sent
+        for latitude, longitude in locations:
+            validate_latitude(latitude)
+            validate_longitude(longitude)
+        return list(
+            await asyncio.gather(
+                *(self.get_weather(lat, lon) for lat, lon in locations)
+            )
+        )
+
+    async def _run_blocking(self, func: Callable[..., T], *args) -> T:
+        """Run a blocking function on the API's thread pool.
+
+        Parameters
+        ----------
+        func : callable
+            Function to run.
+        *args
+            Arguments passed to the function.
+
+        Returns
+        -------
+        Any
+            The function's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _throttle(self, url: str) -> None:
+        """Wait for the rate limit of the URL's host.
+
+        Parameters
+        ----------
+        url : str
+            URL about to be requested.
+        """
+        await self._rate_limiter.acquire(url)
+
+    @abstractmethod
+    async def _fetch_weather_data(self, latitude: float, longitude: float) -> dict:
+        """Fetch raw weather data for a location from the API.
+
+        Subclasses must implement this method, calling _throttle() before
+        each request and running blocking I/O through _run_blocking().
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        dict
+            Raw weather data from the API.
+
+        Raises
+        ------
+        Exception
+            If there's an error fetching the data.
+        """
+        pass
+
+    @abstractmethod
+    def _parse_weather_data(
+        self, raw_data: dict, latitude: float, longitude: float
+    ) -> WeatherData:
+        """Parse raw weather data into standardized format.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Raw weather data from _fetch_weather_data().
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        WeatherData
+            Parsed and standardized weather data.
+        """
+        pass
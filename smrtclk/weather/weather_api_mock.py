@@ -2,8 +2,13 @@
 
 import logging
 import random
+from datetime import datetime
 
-from .weather_api import WeatherAPI, WeatherData
+from .circuit_breaker import CircuitBreaker
+from .single_flight import SingleFlight
+from .solar import sun_times
+from .weather_api import DEFAULT_PERSIST_TTL, WeatherAPI, WeatherData
+from .weather_cache import WeatherCacheBackend
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +21,18 @@ class WeatherAPIMock(WeatherAPI):
     the application without depending on external APIs.
     """
 
+    provider_name = "mock"
+
     def __init__(
         self,
         latitude: float = 39.7392,
         longitude: float = -104.9903,
         cache_duration: int = 900,
         scenario: str = "sunny",
+        cache_backend: WeatherCacheBackend | None = None,
+        persist_ttl: int = DEFAULT_PERSIST_TTL,
+        circuit_breaker: CircuitBreaker | None = None,
+        single_flight: SingleFlight[WeatherData] | None = None,
     ):
         """Initialize the mock weather API.
 
@@ -37,9 +48,28 @@ class WeatherAPIMock(WeatherAPI):
             Weather scenario to simulate: "sunny", "rainy", "cloudy",
             "stormy", "extreme_heat", "extreme_cold", "random"
             (default: "sunny").
+        cache_backend : WeatherCacheBackend, optional
+            Backend persisting weather data across restarts (default: None).
+        persist_ttl : int, optional
+            Seconds after fetching for which persisted data may be restored
+            (default: 86400 = 1 day).
+        circuit_breaker : CircuitBreaker, optional
+            Breaker tracking failures, possibly shared with other instances
+            (default: a new breaker).
+        single_flight : SingleFlight, optional
+            Coalesces concurrent fetches, possibly shared with other
+            instances (default: one for this instance only).
         """
         self._scenario = scenario
-        super().__init__(latitude, longitude, cache_duration)
+        super().__init__(
+            latitude,
+            longitude,
+            cache_duration,
+            cache_backend,
+            persist_ttl,
+            circuit_breaker,
+            single_flight,
+        )
         logger.info(f"Mock weather API initialized with scenario: {scenario}")
 
     @property
@@ -110,19 +140,16 @@ class WeatherAPIMock(WeatherAPI):
             )
             logger.debug(f"Random scenario selected: {scenario}")
 
-        weather_data = self._generate_scenario_data(scenario)
-
-        # Add sunrise and sunset times (varies slightly by location)
-        # Using approximate times for mid-latitudes
-        sunrise_time = self._calculate_sunrise()
-        sunset_time = self._calculate_sunset()
-        weather_data["sunrise"] = sunrise_time
-        weather_data["sunset"] = sunset_time
+        # Add real sunrise and sunset times for the location
+        sunrise, sunset = self._calculate_sun_times()
+        weather_data = WeatherData(
+            **self._generate_scenario_data(scenario), sunrise=sunrise, sunset=sunset
+        )
 
         logger.debug(f"Generated weather data: {weather_data}")
         return weather_data
 
-    def _generate_scenario_data(self, scenario: str) -> WeatherData:
+    def _generate_scenario_data(self, scenario: str) -> dict:
         """Generate weather data for a specific scenario.
 
         Parameters
@@ -132,8 +159,8 @@ class WeatherAPIMock(WeatherAPI):
 
         Returns
         -------
-        WeatherData
-            Weather data for the scenario (without sunrise/sunset).
+        dict
+            Weather data fields for the scenario (without sunrise/sunset).
         """
         if scenario == "sunny":
             return {
@@ -194,69 +221,23 @@ class WeatherAPIMock(WeatherAPI):
             logger.warning(f"Unknown scenario '{scenario}', defaulting to sunny")
             return self._generate_scenario_data("sunny")
 
-    def _calculate_sunrise(self) -> str:
-        """Calculate approximate sunrise time based on latitude.
+    def _calculate_sun_times(self) -> tuple[str, str]:
+        """Calculate today's sunrise and sunset at the mock location.
 
-        Returns
-        -------
-        str
-            Sunrise time in HH:MM format.
-        """
-        # Simplified calculation - varies by latitude and time of year
-        # Positive latitude (northern hemisphere): earlier sunrise in summer
-        # This is a very rough approximation for demonstration
-        base_hour = 6
-        base_minute = 30
-
-        # Adjust slightly based on latitude (very simplified)
-        latitude_offset = int(abs(self.latitude) / 10)  # 0-9 minutes
-        if self.latitude > 0:
-            # Northern hemisphere
-            base_minute += latitude_offset
-        else:
-            # Southern hemisphere
-            base_minute -= latitude_offset
-
-        # Normalize minutes
-        if base_minute >= 60:
-            base_hour += 1
-            base_minute -= 60
-        elif base_minute < 0:
-            base_hour -= 1
-            base_minute += 60
-
-        return f"{base_hour:02d}:{base_minute:02d}"
-
-    def _calculate_sunset(self) -> str:
-        """Calculate approximate sunset time based on latitude.
+        Times are in the local time zone of the clock.
 
         Returns
         -------
-        str
-            Sunset time in HH:MM format.
+        tuple of str
+            Sunrise and sunset times in HH:MM format.
         """
-        # Simplified calculation - varies by latitude and time of year
-        base_hour = 18
-        base_minute = 45
-
-        # Adjust slightly based on latitude (very simplified)
-        latitude_offset = int(abs(self.latitude) / 10)  # 0-9 minutes
-        if self.latitude > 0:
-            # Northern hemisphere
-            base_minute += latitude_offset
-        else:
-            # Southern hemisphere
-            base_minute -= latitude_offset
-
-        # Normalize minutes
-        if base_minute >= 60:
-            base_hour += 1
-            base_minute -= 60
-        elif base_minute < 0:
-            base_hour -= 1
-            base_minute += 60
-
-        return f"{base_hour:02d}:{base_minute:02d}"
+        now = datetime.now().astimezone()
+        return sun_times(
+            self.latitude,
+            self.longitude,
+            now.date(),
+            now.utcoffset().total_seconds(),
+        )
 
     def set_temperature(self, current: float, min_temp: float, max_temp: float) -> None:
         """Set custom temperature values and invalidate cache.
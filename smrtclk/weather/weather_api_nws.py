@@ -1,26 +1,188 @@
+import asyncio
 import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from weakref import WeakKeyDictionary
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
-from .weather_api import WeatherAPI, WeatherData
+from .circuit_breaker import CircuitBreaker, probe_reachable
+from .grid_index import GridIndex
+from .json_decoder import loads
+from .nws_forecast import ForecastSeries
+from .poll_scheduler import PollScheduler, expiry_time
+from .retry import CancelToken, RetryCancelled, RetryPolicy, parse_retry_after
+from .single_flight import SingleFlight
+from .solar import sun_times
+from .weather_api import (
+    DEFAULT_PERSIST_TTL,
+    WeatherAPI,
+    WeatherData,
+    WeatherHTTPError,
+    WeatherNotModified,
+)
+from .weather_api_async import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_RATE_LIMIT,
+    AsyncWeatherAPI,
+)
+from .weather_cache import WeatherCacheBackend
 
 logger = logging.getLogger(__name__)
 
 BASE_API_URL = "https://api.weather.gov/"
 POINTS_URL = "points/"
 GRIDPOINTS_URL = "gridpoints/"
-FORECAST_URL = "forecast/"
+FORECAST_URL = "forecast/hourly"
 
+# The NWS API requires a User-Agent identifying the application
+USER_AGENT = "smrt-clk-dashboard"
+# Number of pooled keep-alive connections per host
+DEFAULT_POOL_SIZE = 4
+# Connect and read timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10.0)
+# How long a persisted points-to-grid lookup stays valid
+LOCATION_TTL = 30 * 24 * 60 * 60  # 30 days
 
-def get_json_requests_retry(url: str) -> dict:
+
+@dataclass
+class HTTPValidators:
+    """HTTP cache validators and freshness for a URL.
+
+    Attributes
+    ----------
+    etag : str or None
+        Value of the last ETag response header.
+    last_modified : str or None
+        Value of the last Last-Modified response header.
+    expires : float or None
+        When the last response stops being fresh, in seconds since the
+        epoch, from its Cache-Control or Expires header.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+    expires: float | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        """Build conditional request headers from the stored validators.
+
+        Returns
+        -------
+        dict
+            If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update(self, response_headers: Mapping[str, str]) -> None:
+        """Store the validators from a response.
+
+        Parameters
+        ----------
+        response_headers : Mapping
+            Headers of a successful response.
+        """
+        self.etag = response_headers.get("ETag")
+        self.last_modified = response_headers.get("Last-Modified")
+        self.expires = expiry_time(response_headers)
+
+    def revalidated(self, response_headers: Mapping[str, str]) -> None:
+        """Update the freshness from a 304 Not Modified response.
+
+        Parameters
+        ----------
+        response_headers : Mapping
+            Headers of the 304 response.
+        """
+        self.expires = expiry_time(response_headers)
+
+
+@dataclass(frozen=True)
+class ParsedForecast:
+    """Forecast state parsed along with the summary of a fetch.
+
+    Attributes
+    ----------
+    series : ForecastSeries
+        The forecast periods, summarized again as they pass.
+    updated_at : float or None
+        When the forecast was last updated, from forecast_update_time().
+    """
+
+    series: ForecastSeries
+    updated_at: float | None
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create an HTTP session with a keep-alive connection pool.
+
+    Requests are not retried by the session; get_json_requests_retry
+    retries them within the deadline of its retry policy.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Number of connections kept alive per host (default: 4).
+
+    Returns
+    -------
+    requests.Session
+        The configured session.
+    """
+    # Create the HTTP adapter with a connection pool
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    # Create the session
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_json_requests_retry(
+    url: str,
+    session: requests.Session | None = None,
+    timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    validators: HTTPValidators | None = None,
+    decoder: Callable[[bytes], dict] = loads,
+    retry: RetryPolicy | None = None,
+    cancel: CancelToken | None = None,
+) -> dict:
     """Get the JSON data from the given URL with retry.
 
+    Connection errors, timeouts and retryable HTTP statuses are retried with
+    full-jitter backoff, honoring Retry-After on 429 and 503 responses,
+    until the retry policy's attempts or deadline are used up. Request
+    timeouts are shortened so no attempt runs past the deadline.
+
     Parameters
     ----------
     url : str
         The URL to get the JSON data from.
+    session : requests.Session, optional
+        Session to send the request on. If not given, a temporary session
+        is created and closed after the request.
+    timeout : float or tuple of float, optional
+        Connect and read timeouts in seconds (default: (3.05, 10.0)).
+    validators : HTTPValidators, optional
+        Validators from a previous response. If given, the request is made
+        conditional on them and they are updated from a 200 response whose
+        body decodes.
+    decoder : callable, optional
+        Function decoding the response body (default: the fastest available
+        JSON decoder).
+    retry : RetryPolicy, optional
+        How failed requests are retried (default: RetryPolicy()).
+    cancel : CancelToken, optional
+        Token cancelling the fetch while it waits to retry.
 
     Returns
     -------
@@ -29,40 +191,283 @@ def get_json_requests_retry(url: str) -> dict:
 
     Raises
     ------
+    WeatherNotModified
+        If the server responds 304 Not Modified to a conditional request.
+    RetryCancelled
+        If the fetch is cancelled.
+    WeatherHTTPError
+        If the server responds with an error status that is not retried,
+        or still does once the retries are used up.
     Exception
         If there is an error getting the JSON data or non-200 status code.
     """
+    owns_session = session is None
+    if session is None:
+        session = create_session()
+    headers = validators.request_headers() if validators is not None else None
+    budget = (retry or RetryPolicy()).start(cancel)
     try:
-        # Setup the retry strategy
-        retry = Retry(
-            total=5,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        # Create the HTTP adapter
-        adapter = HTTPAdapter(max_retries=retry)
-        # Create the session
-        session = requests.Session()
-        session.mount("https://", adapter)
-        # Get the JSON data
-        r = session.get(url)
-        if r.status_code != 200:
-            logger.error(f"Error getting JSON data: HTTP {r.status_code}")
-            raise Exception(f"HTTP {r.status_code}: Failed to retrieve data from {url}")
-        # Return the JSON data
-        return r.json()
+        while True:
+            # Get the JSON data
+            try:
+                r = session.get(url, headers=headers, timeout=budget.timeout(timeout))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = budget.next_delay()
+                if delay is None:
+                    raise
+                logger.warning(f"Request error, retrying in {delay:.1f}s: {e}")
+                budget.sleep(delay)
+                continue
+            if r.status_code in (200, 304):
+                break
+            delay = budget.next_delay(
+                r.status_code, parse_retry_after(r.headers.get("Retry-After"))
+            )
+            if delay is None:
+                logger.error(f"Error getting JSON data: HTTP {r.status_code}")
+                raise WeatherHTTPError(
+                    r.status_code,
+                    f"HTTP {r.status_code}: Failed to retrieve data from {url}",
+                )
+            logger.warning(f"HTTP {r.status_code}, retrying in {delay:.1f}s: {url}")
+            budget.sleep(delay)
+
+        if r.status_code == 304:
+            if not headers:
+                raise Exception(f"HTTP 304: Failed to retrieve data from {url}")
+            logger.debug(f"Not modified: {url}")
+            validators.revalidated(r.headers)
+            raise WeatherNotModified(url)
+        # Decode the JSON data
+        data = decoder(r.content)
+        # Remember validators for the next conditional request, only once
+        # the body they describe has decoded
+        if validators is not None:
+            validators.update(r.headers)
+        return data
+    except (WeatherNotModified, RetryCancelled):
+        raise
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error getting JSON data: {e}")
         raise
     except Exception as e:
         logger.error(f"Unexpected error getting JSON data: {e}")
         raise
+    finally:
+        if owns_session:
+            session.close()
+
+
+def probe_nws() -> bool:
+    """Check whether the NWS API host accepts connections.
+
+    Returns
+    -------
+    bool
+        True if a TCP connection to the API host could be opened.
+    """
+    return probe_reachable(BASE_API_URL)
+
+
+def points_url(latitude: float, longitude: float) -> str:
+    """Get the NWS points URL for a latitude and longitude.
+
+    Parameters
+    ----------
+    latitude : float
+        The latitude of the location.
+    longitude : float
+        The longitude of the location.
+
+    Returns
+    -------
+    str
+        URL of the points lookup resolving the forecast grid.
+    """
+    return f"{BASE_API_URL}{POINTS_URL}{latitude},{longitude}"
+
+
+def forecast_url(location: str) -> str:
+    """Get the NWS hourly forecast URL for a grid location.
+
+    Parameters
+    ----------
+    location : str
+        The grid location string (e.g., "TOP/31,80").
+
+    Returns
+    -------
+    str
+        URL of the forecast for the grid location.
+    """
+    return f"{BASE_API_URL}{GRIDPOINTS_URL}{location}/{FORECAST_URL}"
+
+
+def grid_location(points_data: dict) -> str:
+    """Get the grid location from a points response.
+
+    Parameters
+    ----------
+    points_data : dict
+        JSON response of the points lookup.
+
+    Returns
+    -------
+    str
+        The grid location string (e.g., "TOP/31,80").
+
+    Raises
+    ------
+    KeyError
+        If the response is missing the grid properties.
+    """
+    properties = points_data["properties"]
+    return f"{properties['gridId']}/{properties['gridX']},{properties['gridY']}"
+
+
+def forecast_update_time(raw_data: dict) -> float | None:
+    """Get when a forecast was last updated.
+
+    Parameters
+    ----------
+    raw_data : dict
+        Raw forecast data from NWS API.
+
+    Returns
+    -------
+    float or None
+        The forecast's updateTime (or generatedAt if missing) in seconds
+        since the epoch, or None if neither is present and valid.
+    """
+    properties = raw_data.get("properties", {})
+    for key in ("updateTime", "generatedAt"):
+        value = properties.get(key)
+        if not isinstance(value, str):
+            continue
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_forecast(
+    raw_data: dict,
+    latitude: float,
+    longitude: float,
+    now: float | None = None,
+) -> WeatherData:
+    """Parse an NWS hourly forecast into standardized format.
+
+    The forecast periods are loaded into array-backed columns and the
+    temperature and precipitation statistics computed over the local day.
+    Sunrise and sunset are calculated for the location in the
+    forecast's time zone.
+
+    Parameters
+    ----------
+    raw_data : dict
+        Raw hourly forecast data from NWS API.
+    latitude : float
+        The latitude of the forecast location.
+    longitude : float
+        The longitude of the forecast location.
+    now : float, optional
+        Current time in seconds since the epoch (default: now).
+
+    Returns
+    -------
+    WeatherData
+        Parsed weather data.
+
+    Raises
+    ------
+    ValueError
+        If the forecast has no periods or malformed times.
+    KeyError
+        If a period is missing its start time or temperature.
+    """
+    return summarize_forecast(
+        ForecastSeries.from_payload(raw_data), latitude, longitude, now
+    )
+
+
+def summarize_forecast(
+    series: ForecastSeries,
+    latitude: float,
+    longitude: float,
+    now: float | None = None,
+) -> WeatherData:
+    """Summarize forecast columns for the current time.
+
+    The summary holds until series.next_change(now), after which the same
+    columns are summarized again rather than fetched.
+
+    Parameters
+    ----------
+    series : ForecastSeries
+        The forecast periods in columnar form.
+    latitude : float
+        The latitude of the forecast location.
+    longitude : float
+        The longitude of the forecast location.
+    now : float, optional
+        Current time in seconds since the epoch (default: now).
+
+    Returns
+    -------
+    WeatherData
+        Weather data for the current period and local day.
+    """
+    if now is None:
+        now = time.time()
+    utc_offset = series.utc_offset_at(now)
+    local_date = datetime.fromtimestamp(now + utc_offset, timezone.utc).date()
+    sunrise, sunset = sun_times(latitude, longitude, local_date, utc_offset)
+    return WeatherData(**series.summary(now), sunrise=sunrise, sunset=sunset)
 
 
 class WeatherAPINWS(WeatherAPI):
-    """Weather API that connects to the National Weather Service (NWS)."""
+    """Weather API that connects to the National Weather Service (NWS).
+
+    Requests share a long-lived session so that points lookups and forecast
+    fetches reuse pooled keep-alive connections. Call close() (or use the
+    API as a context manager) to release them.
+
+    With a cache backend, the grid location and HTTP validators are
+    persisted alongside the weather data.
 
-    def __init__(self, latitude: float, longitude: float, cache_duration: int = 900):
+    Resolved grid locations and cell polygons go into a grid index. When
+    the latitude or longitude changes to a point inside the same known
+    cell, the grid location and cached forecast are kept; inside another
+    known cell, only the forecast is fetched again.
+
+    Cached forecasts are kept until the poll scheduler expects new data,
+    from the response's Cache-Control or Expires header and the forecast's
+    update time, falling back to the cache duration without either. The
+    forecast periods are kept (and persisted) with the cached data, whose
+    current values and daily range are summarized again once a new period
+    or local day starts.
+    """
+
+    provider_name = "nws"
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        cache_duration: int = 900,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        cache_backend: WeatherCacheBackend | None = None,
+        persist_ttl: int = DEFAULT_PERSIST_TTL,
+        forecast_decoder: Callable[[bytes], dict] = loads,
+        poll_scheduler: PollScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        grid_index: GridIndex | None = None,
+        single_flight: SingleFlight[WeatherData] | None = None,
+    ):
         """Initializes the WeatherAPINWS class.
 
         Parameters
@@ -73,11 +478,126 @@ class WeatherAPINWS(WeatherAPI):
             The longitude of the location to get the weather for.
         cache_duration : int, optional
             Cache duration in seconds (default: 900 = 15 minutes).
+        pool_size : int, optional
+            Number of keep-alive connections per host (default: 4).
+        timeout : float or tuple of float, optional
+            Connect and read timeouts in seconds (default: (3.05, 10.0)).
+        cache_backend : WeatherCacheBackend, optional
+            Backend persisting weather data across restarts (default: None).
+        persist_ttl : int, optional
+            Seconds after fetching for which persisted data may be restored
+            (default: 86400 = 1 day).
+        forecast_decoder : callable, optional
+            Function decoding forecast responses, e.g. select_periods to
+            keep only the fields the parser reads (default: the fastest
+            available JSON decoder).
+        poll_scheduler : PollScheduler, optional
+            Plans when cached forecasts are fetched again (default: a
+            scheduler with the default update period and jitter).
+        retry_policy : RetryPolicy, optional
+            How failed requests are retried (default: RetryPolicy()).
+        circuit_breaker : CircuitBreaker, optional
+            Breaker tracking NWS failures, possibly shared with other
+            instances (default: a new breaker probing the NWS host).
+        grid_index : GridIndex, optional
+            Index of resolved grid cells, possibly shared with other
+            instances or pre-resolved (default: a new empty index).
+        single_flight : SingleFlight, optional
+            Coalesces concurrent fetches, possibly shared with other
+            instances (default: one for this instance only).
         """
-        # Call parent constructor
-        super().__init__(latitude, longitude, cache_duration)
-        # NWS-specific cache for location data
+        self._poll_scheduler = poll_scheduler or PollScheduler()
+        self._grid_index = grid_index if grid_index is not None else GridIndex()
+        # NWS-specific cache for location data, set from the grid index
+        # when the parent constructor sets the location
         self._location_cache: str | None = None
+        # HTTP validators per forecast URL for conditional requests
+        self._validators: dict[str, HTTPValidators] = {}
+        # Call parent constructor
+        super().__init__(
+            latitude,
+            longitude,
+            cache_duration,
+            cache_backend,
+            persist_ttl,
+            circuit_breaker,
+            single_flight,
+        )
+        # Persistent HTTP session, request timeout and retries
+        self._session = create_session(pool_size)
+        self._timeout = timeout
+        self._retry_policy = retry_policy or RetryPolicy()
+        # Cancelled on close() so fetches stop waiting to retry
+        self._cancel = CancelToken()
+        self._forecast_decoder = forecast_decoder
+
+    def close(self) -> None:
+        """Close the HTTP session and cancel fetches waiting to retry."""
+        self._cancel.cancel()
+        self._session.close()
+
+    @property
+    def location(self) -> str | None:
+        """Get the cached grid location, or None if not yet resolved."""
+        return self._location_cache
+
+    def points_url(self) -> str:
+        """Get the NWS points URL for the current latitude and longitude.
+
+        Returns
+        -------
+        str
+            URL of the points lookup resolving the forecast grid.
+        """
+        return points_url(self.latitude, self.longitude)
+
+    def forecast_url(self, location: str) -> str:
+        """Get the NWS hourly forecast URL for a grid location.
+
+        Parameters
+        ----------
+        location : str
+            The grid location string (e.g., "TOP/31,80").
+
+        Returns
+        -------
+        str
+            URL of the forecast for the grid location.
+        """
+        return forecast_url(location)
+
+    def resolve_location(self, points_data: dict) -> str:
+        """Resolve and cache the grid location from a points response.
+
+        Parameters
+        ----------
+        points_data : dict
+            JSON response of the points lookup.
+
+        Returns
+        -------
+        str
+            The grid location string (e.g., "TOP/31,80").
+
+        Raises
+        ------
+        KeyError
+            If the response is missing the grid properties.
+        """
+        self._location_cache = grid_location(points_data)
+        logger.info(f"NWS location resolved to: {self._location_cache}")
+        self._grid_index.add_point(self.latitude, self.longitude, self._location_cache)
+        if self._cache_backend is not None:
+            try:
+                self._cache_backend.set(
+                    self._cache_key("location"),
+                    {"location": self._location_cache},
+                    LOCATION_TTL,
+                )
+            except Exception as e:
+                # Persistence is best effort; the grid location is still cached
+                logger.warning(f"Failed to persist grid location: {e}")
+        return self._location_cache
 
     def _get_location(self) -> str:
         """Gets the location of the given latitude and longitude for use with the NWS API.
@@ -97,29 +617,142 @@ class WeatherAPINWS(WeatherAPI):
             return self._location_cache
 
         # Get the URL for the location
-        url = f"{BASE_API_URL}{POINTS_URL}{self.latitude},{self.longitude}"
+        url = self.points_url()
         logger.debug(f"Fetching NWS location data from: {url}")
 
         # Get the location data with retry
-        location_data = get_json_requests_retry(url)
+        location_data = get_json_requests_retry(
+            url,
+            self._session,
+            self._timeout,
+            retry=self._retry_policy,
+            cancel=self._cancel,
+        )
 
         # Cache and return the location data
-        self._location_cache = (
-            f"{location_data['properties']['gridId']}/"
-            f"{location_data['properties']['gridX']},"
-            f"{location_data['properties']['gridY']}"
-        )
-        logger.info(f"NWS location resolved to: {self._location_cache}")
-        return self._location_cache
+        return self.resolve_location(location_data)
+
+    @property
+    def grid_index(self) -> GridIndex:
+        """Get the index of resolved grid cells."""
+        return self._grid_index
+
+    def _location_changed(self) -> None:
+        """Keep the cache if the new location is in the same grid cell."""
+        longitude = getattr(self, "_longitude", None)
+        if longitude is None:
+            # Still initializing
+            super()._location_changed()
+            return
+
+        location = self._grid_index.lookup(self.latitude, longitude)
+        if location is not None and location == self._location_cache:
+            logger.debug(f"Location still in grid cell {location}, cache kept")
+            return
+        super()._location_changed()
+        # A known cell needs no points lookup
+        self._location_cache = location
 
     def _invalidate_cache(self) -> None:
         """Override to also invalidate NWS-specific location cache."""
         super()._invalidate_cache()
         self._location_cache = None
+        self._validators = {}
+
+    def _store_cache(
+        self,
+        weather_data: WeatherData | None,
+        timestamp: float | None,
+        state: ParsedForecast | None = None,
+    ) -> None:
+        """Replace the cached weather data along with its forecast state."""
+        # Data cached without a fresh parse has no periods to summarize
+        series = state.series if state is not None else None
+        self._forecast_series = series
+        self._forecast_updated_at = state.updated_at if state is not None else None
+        self._summary_expires = (
+            series.next_change(timestamp)
+            if series is not None and timestamp is not None
+            else float("inf")
+        )
+        super()._store_cache(weather_data, timestamp, state)
+
+    def _cached_weather(self, status: str = "cached") -> WeatherData:
+        """Get the cached weather data, summarized again if it went stale."""
+        now = time.time()
+        series = self._forecast_series
+        cached = self._weather_cache
+        if series is not None and cached is not None and now >= self._summary_expires:
+            self._weather_cache = summarize_forecast(
+                series, self.latitude, self.longitude, now
+            ).with_status(cached.status)
+            self._summary_expires = series.next_change(now)
+            self._cache_views = {}
+        return super()._cached_weather(status)
+
+    def _restore_cache(self) -> None:
+        """Restore persisted weather data, forecast, location and validators."""
+        super()._restore_cache()
+        if self._cache_backend is None:
+            return
+
+        # The periods are only useful together with the data they summarize
+        forecast = self._cache_backend.get(self._cache_key("forecast"))
+        if forecast is not None and self._weather_cache is not None:
+            self._forecast_series = ForecastSeries.from_dict(forecast.value)
+            self._summary_expires = self._forecast_series.next_change(
+                self._cache_timestamp
+            )
+
+        location = self._cache_backend.get(self._cache_key("location"))
+        if location is not None:
+            self._location_cache = location.value["location"]
+
+        # Validators are only useful together with the data they validate
+        validators = self._cache_backend.get(self._cache_key("validators"))
+        if validators is not None and self._weather_cache is not None:
+            self._validators = {
+                url: HTTPValidators(**values)
+                for url, values in validators.value.items()
+            }
+            if self._location_cache is not None:
+                # Plan the restored data's expiry from its response headers
+                self._cache_lifetime = (
+                    self._plan_next_fetch(self._cache_timestamp) - self._cache_timestamp
+                )
+
+    def _persist_cache(self) -> None:
+        """Persist weather data along with the forecast and its validators."""
+        super()._persist_cache()
+        if self._cache_backend is None or self._weather_cache is None:
+            return
+        try:
+            self._cache_backend.set(
+                self._cache_key("validators"),
+                {url: asdict(v) for url, v in self._validators.items()},
+                self._persist_ttl,
+                stored_at=self._cache_timestamp,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist HTTP validators: {e}")
+        if self._forecast_series is None:
+            return
+        try:
+            self._cache_backend.set(
+                self._cache_key("forecast"),
+                self._forecast_series.to_dict(),
+                self._persist_ttl,
+                stored_at=self._cache_timestamp,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist forecast periods: {e}")
 
     def _fetch_weather_data(self) -> dict:
         """Fetch raw weather data from NWS API.
 
+        The forecast request is conditional on the validators of the last
+        response while cached weather data exists to fall back on.
+
         Returns
         -------
         dict
@@ -127,6 +760,8 @@ class WeatherAPINWS(WeatherAPI):
 
         Raises
         ------
+        WeatherNotModified
+            If the forecast is unchanged since the cached copy.
         Exception
             If unable to retrieve forecast data.
         """
@@ -134,15 +769,61 @@ class WeatherAPINWS(WeatherAPI):
         location = self._get_location()
 
         # Get the URL for the forecast
-        url = f"{BASE_API_URL}{GRIDPOINTS_URL}{location}/{FORECAST_URL}"
+        url = self.forecast_url(location)
         logger.debug(f"Fetching NWS forecast from: {url}")
 
+        # Only send validators if there is cached data to reuse on a 304
+        validators = self._validators.get(url)
+        if validators is None or self._weather_cache is None:
+            validators = self._validators[url] = HTTPValidators()
+
         # Get and return the forecast data with retry
-        forecast_data = get_json_requests_retry(url)
+        forecast_data = get_json_requests_retry(
+            url,
+            self._session,
+            self._timeout,
+            validators,
+            self._forecast_decoder,
+            self._retry_policy,
+            self._cancel,
+        )
+        self._grid_index.add_cell(location, forecast_data.get("geometry"))
         logger.info("NWS forecast data retrieved successfully")
 
         return forecast_data
 
+    def _probe_reachable(self) -> bool:
+        """Check whether the NWS API host accepts connections.
+
+        Returns
+        -------
+        bool
+            True if a TCP connection to the API host could be opened.
+        """
+        return probe_nws()
+
+    def _plan_next_fetch(self, fetched_at: float) -> float:
+        """Plan when a forecast expires from when new data is expected.
+
+        Parameters
+        ----------
+        fetched_at : float
+            When the forecast was fetched, in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            Expiry time in seconds since the epoch.
+        """
+        validators = None
+        if self._location_cache is not None:
+            # The cached forecast is for the current location
+            validators = self._validators.get(self.forecast_url(self._location_cache))
+        expires = validators.expires if validators is not None else None
+        return self._poll_scheduler.plan(
+            fetched_at, self._cache_duration, expires, self._forecast_updated_at
+        )
+
     def _parse_weather_data(self, raw_data: dict) -> WeatherData:
         """Parse NWS forecast data into standardized format.
 
@@ -155,37 +836,210 @@ class WeatherAPINWS(WeatherAPI):
         -------
         WeatherData
             Parsed weather data.
+        """
+        return parse_forecast(raw_data, self.latitude, self.longitude)
+
+    def _parse_fetched(self, raw_data: dict) -> tuple[WeatherData, ParsedForecast]:
+        """Parse a fetched forecast along with its periods and update time.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Raw forecast data from NWS API.
+
+        Returns
+        -------
+        tuple of (WeatherData, ParsedForecast)
+            Parsed weather data and the forecast state to cache with it.
+        """
+        try:
+            series = ForecastSeries.from_payload(raw_data)
+            weather_data = summarize_forecast(series, self.latitude, self.longitude)
+        except Exception:
+            # The forecast is not cached, so a 304 must not stand for it
+            if self._location_cache is not None:
+                self._validators.pop(self.forecast_url(self._location_cache), None)
+            raise
+        return weather_data, ParsedForecast(series, forecast_update_time(raw_data))
+
+
+class AsyncWeatherAPINWS(AsyncWeatherAPI):
+    """Asynchronous NWS weather API fetching many locations concurrently.
+
+    Grid locations are resolved once per latitude/longitude pair and
+    reused; concurrent requests for the same pair share one points lookup.
+    All requests share one pooled session sized to the concurrency limit.
+    """
+
+    provider_name = "nws"
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        forecast_decoder: Callable[[bytes], dict] = loads,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """Initializes the AsyncWeatherAPINWS class.
+
+        Parameters
+        ----------
+        max_concurrency : int, optional
+            Maximum number of locations fetched at once (default: 8).
+        rate_limit : float or None, optional
+            Maximum requests per second per host, or None for no limit
+            (default: 10.0).
+        timeout : float or tuple of float, optional
+            Connect and read timeouts in seconds (default: (3.05, 10.0)).
+        forecast_decoder : callable, optional
+            Function decoding forecast responses (default: the fastest
+            available JSON decoder).
+        retry_policy : RetryPolicy, optional
+            How failed requests are retried (default: RetryPolicy()).
+        """
+        super().__init__(max_concurrency, rate_limit)
+        self._session = create_session(max_concurrency)
+        self._timeout = timeout
+        self._retry_policy = retry_policy or RetryPolicy()
+        # Cancelled on close() so fetches stop waiting to retry
+        self._cancel = CancelToken()
+        self._forecast_decoder = forecast_decoder
+        # Resolved grid locations per (latitude, longitude)
+        self._locations: dict[tuple[float, float], str] = {}
+        # Pending lookups per event loop, shared by concurrent requests
+        self._lookups: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[float, float], asyncio.Future[str]]
+        ] = WeakKeyDictionary()
+
+    async def close(self) -> None:
+        """Close the HTTP session and release the thread pool."""
+        self._cancel.cancel()
+        await super().close()
+        self._session.close()
 
-        Note
-        ----
-        This is a placeholder implementation that needs to be completed.
-        Currently returns empty/default values.
-        """
-        # TODO: Complete implementation
-        # Find the forecast periods for today and tonight
-        periods = raw_data.get("properties", {}).get("periods", [])
-
-        today, tonight = None, None
-        for period in periods:
-            if period["name"] == "Today":
-                today = period
-            elif period["name"] == "Tonight":
-                tonight = period
-
-        # Placeholder: Return minimal data structure
-        # This needs proper implementation to extract temperature, precipitation, etc.
-        weather_data: WeatherData = {
-            "temperature": today.get("temperature", 70.0) if today else 70.0,
-            "temperature_min": tonight.get("temperature", 50.0) if tonight else 50.0,
-            "temperature_max": today.get("temperature", 75.0) if today else 75.0,
-            "precipitation": 0,
-            "precipitation_min": 0,
-            "precipitation_max": 0,
-            "sunrise": "06:30",  # TODO: Implement sunrise/sunset calculation
-            "sunset": "18:30",
-        }
-
-        logger.warning(
-            "NWS weather data parsing is incomplete - using placeholder values"
+    async def _get_json(
+        self, url: str, decoder: Callable[[bytes], dict] = loads
+    ) -> dict:
+        """Get JSON from a URL on the thread pool, honoring the rate limit.
+
+        Parameters
+        ----------
+        url : str
+            The URL to get the JSON data from.
+        decoder : callable, optional
+            Function decoding the response body (default: the fastest
+            available JSON decoder).
+
+        Returns
+        -------
+        dict
+            The JSON data from the URL.
+        """
+        await self._throttle(url)
+        return await self._run_blocking(
+            get_json_requests_retry,
+            url,
+            self._session,
+            self._timeout,
+            None,
+            decoder,
+            self._retry_policy,
+            self._cancel,
         )
-        return weather_data
+
+    async def _get_location(self, latitude: float, longitude: float) -> str:
+        """Get the grid location for a latitude and longitude.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        str
+            The grid location string (e.g., "TOP/31,80").
+        """
+        key = (latitude, longitude)
+        location = self._locations.get(key)
+        if location is not None:
+            return location
+        lookups = self._lookups.setdefault(asyncio.get_running_loop(), {})
+        lookup = lookups.get(key)
+        if lookup is None:
+            lookup = lookups[key] = asyncio.ensure_future(
+                self._lookup_location(latitude, longitude)
+            )
+            # A failed lookup is retried by the next request
+            lookup.add_done_callback(lambda _: lookups.pop(key, None))
+        return await asyncio.shield(lookup)
+
+    async def _lookup_location(self, latitude: float, longitude: float) -> str:
+        """Look up and remember the grid location for a latitude and longitude.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        str
+            The grid location string (e.g., "TOP/31,80").
+        """
+        url = f"{BASE_API_URL}{POINTS_URL}{latitude},{longitude}"
+        logger.debug(f"Fetching NWS location data from: {url}")
+        location = grid_location(await self._get_json(url))
+        self._locations[(latitude, longitude)] = location
+        return location
+
+    async def _fetch_weather_data(self, latitude: float, longitude: float) -> dict:
+        """Fetch raw forecast data for a location from the NWS API.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        dict
+            Raw forecast data from NWS API.
+
+        Raises
+        ------
+        Exception
+            If unable to retrieve location or forecast data.
+        """
+        location = await self._get_location(latitude, longitude)
+        url = f"{BASE_API_URL}{GRIDPOINTS_URL}{location}/{FORECAST_URL}"
+        logger.debug(f"Fetching NWS forecast from: {url}")
+        return await self._get_json(url, self._forecast_decoder)
+
+    def _parse_weather_data(
+        self, raw_data: dict, latitude: float, longitude: float
+    ) -> WeatherData:
+        """Parse NWS forecast data into standardized format.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Raw forecast data from NWS API.
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        WeatherData
+            Parsed weather data.
+        """
+        return parse_forecast(raw_data, latitude, longitude)
@@ -0,0 +1,215 @@
+"""WeatherAPI reading from a local weather proxy shared by many clocks."""
+
+import http.client
+import logging
+import socket
+import threading
+from urllib.parse import urlencode, urlsplit
+
+from .json_decoder import loads
+from .weather_api import (
+    DEFAULT_PERSIST_TTL,
+    WeatherAPI,
+    WeatherData,
+    WeatherHTTPError,
+)
+from .weather_cache import WeatherCacheBackend
+from .weather_proxy import DEFAULT_PROXY_HOST, DEFAULT_PROXY_PORT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROXY_URL = f"http://{DEFAULT_PROXY_HOST}:{DEFAULT_PROXY_PORT}"
+# Timeout for proxy requests in seconds
+DEFAULT_PROXY_TIMEOUT = 5.0
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class WeatherAPIProxy(WeatherAPI):
+    """Weather API reading parsed weather data from a local weather proxy.
+
+    The proxy (see weather_proxy) fetches upstream once per cache duration
+    for all clocks at a site. Requests reuse one keep-alive connection,
+    over TCP for "http://host:port" URLs or a Unix domain socket for
+    "unix:///path/to/socket" URLs.
+    """
+
+    provider_name = "proxy"
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        url: str = DEFAULT_PROXY_URL,
+        cache_duration: int = 60,
+        timeout: float = DEFAULT_PROXY_TIMEOUT,
+        cache_backend: WeatherCacheBackend | None = None,
+        persist_ttl: int = DEFAULT_PERSIST_TTL,
+    ):
+        """Initializes the WeatherAPIProxy class.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location to get the weather for.
+        longitude : float
+            The longitude of the location to get the weather for.
+        url : str, optional
+            Proxy URL, "http://host:port" or "unix:///path/to/socket"
+            (default: "http://127.0.0.1:8765").
+        cache_duration : int, optional
+            Cache duration in seconds (default: 60). The proxy caches
+            upstream data itself, so this only limits local requests.
+        timeout : float, optional
+            Request timeout in seconds (default: 5.0).
+        cache_backend : WeatherCacheBackend, optional
+            Backend persisting weather data across restarts (default: None).
+        persist_ttl : int, optional
+            Seconds after fetching for which persisted data may be restored
+            (default: 86400 = 1 day).
+
+        Raises
+        ------
+        ValueError
+            If the URL scheme is not "http" or "unix".
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "unix"):
+            raise ValueError(f"Unsupported proxy URL: {url}")
+        self._url = parts
+        self._timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
+        self._connection_lock = threading.Lock()
+        super().__init__(
+            latitude, longitude, cache_duration, cache_backend, persist_ttl
+        )
+
+    @property
+    def url(self) -> str:
+        """Get the proxy URL."""
+        return self._url.geturl()
+
+    def close(self) -> None:
+        """Close the connection to the proxy."""
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Create a connection to the proxy.
+
+        Returns
+        -------
+        http.client.HTTPConnection
+            An unopened connection; it connects on the first request.
+        """
+        if self._url.scheme == "unix":
+            return _UnixHTTPConnection(self._url.path, self._timeout)
+        return http.client.HTTPConnection(
+            self._url.hostname, self._url.port, timeout=self._timeout
+        )
+
+    def _request(self, path: str) -> tuple[int, bytes]:
+        """Send a GET request to the proxy on the kept-alive connection.
+
+        A request failing on a reused connection is retried once on a new
+        connection, since the proxy may have closed an idle one.
+
+        Parameters
+        ----------
+        path : str
+            Request path including the query string.
+
+        Returns
+        -------
+        tuple of (int, bytes)
+            HTTP status code and response body.
+        """
+        with self._connection_lock:
+            reused = self._connection is not None
+            try:
+                return self._send(path)
+            except (http.client.HTTPException, OSError):
+                if not reused:
+                    raise
+            return self._send(path)
+
+    def _send(self, path: str) -> tuple[int, bytes]:
+        """Send a GET request, dropping the connection if it fails.
+
+        Parameters
+        ----------
+        path : str
+            Request path including the query string.
+
+        Returns
+        -------
+        tuple of (int, bytes)
+            HTTP status code and response body.
+        """
+        if self._connection is None:
+            self._connection = self._connect()
+        try:
+            self._connection.request("GET", path)
+            response = self._connection.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            self._connection.close()
+            self._connection = None
+            raise
+
+    def _fetch_weather_data(self) -> dict:
+        """Fetch weather data for the current location from the proxy.
+
+        Returns
+        -------
+        dict
+            Weather data in WeatherData format.
+
+        Raises
+        ------
+        WeatherHTTPError
+            If the proxy reports an error.
+        Exception
+            If the proxy is unreachable.
+        """
+        query = urlencode({"lat": self.latitude, "lon": self.longitude})
+        status, body = self._request(f"/weather?{query}")
+        data = loads(body)
+        if status != 200 or data.get("status") == "error":
+            message = data.get("error_message", f"HTTP {status}")
+            raise WeatherHTTPError(status, f"Weather proxy error: {message}")
+        return data
+
+    def _parse_weather_data(self, raw_data: dict) -> WeatherData:
+        """Strip the proxy's cache status from its fresh weather data.
+
+        Data the proxy serves past its expiry keeps its "stale" or
+        "offline" status, so it is not cached here as fresh.
+
+        Parameters
+        ----------
+        raw_data : dict
+            Weather data from the proxy.
+
+        Returns
+        -------
+        WeatherData
+            The weather data, without status information if fresh.
+        """
+        weather_data = WeatherData.from_mapping(raw_data)
+        if weather_data.status in ("stale", "offline"):
+            return weather_data
+        return weather_data.with_status(None)
@@ -0,0 +1,221 @@
+"""Persistent cache backends for weather data."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value with the time it was stored.
+
+    Attributes
+    ----------
+    value : dict
+        The cached JSON-serializable value.
+    stored_at : float
+        Unix timestamp of when the value was produced.
+    """
+
+    value: dict
+    stored_at: float
+
+
+def cache_key(provider: str, latitude: float, longitude: float, kind: str) -> str:
+    """Build the cache key for a provider, location and kind of entry.
+
+    Coordinates are rounded to 4 decimal places (about 11 m) so that
+    equivalent locations share entries.
+
+    Parameters
+    ----------
+    provider : str
+        Name of the weather provider.
+    latitude : float
+        Latitude of the location.
+    longitude : float
+        Longitude of the location.
+    kind : str
+        Kind of entry, e.g. "weather" or "location".
+
+    Returns
+    -------
+    str
+        The cache key.
+    """
+    return f"{provider}:{float(latitude):.4f},{float(longitude):.4f}:{kind}"
+
+
+class WeatherCacheBackend(ABC):
+    """Abstract base class for weather cache storage.
+
+    Backends store JSON-serializable dictionaries under string keys with a
+    time-to-live after which entries are no longer returned.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry if it exists and has not expired.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        CacheEntry or None
+            The entry, or None if missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self, key: str, value: dict, ttl: float, stored_at: float | None = None
+    ) -> None:
+        """Store an entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : dict
+            JSON-serializable value to store.
+        ttl : float
+            Seconds after stored_at for which the entry is returned.
+        stored_at : float, optional
+            Unix timestamp of when the value was produced (default: now).
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        """
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
+
+
+class MemoryCacheBackend(WeatherCacheBackend):
+    """Cache backend holding entries in process memory.
+
+    Entries do not survive a restart, but can be shared between several
+    WeatherAPI instances in the same process.
+    """
+
+    def __init__(self):
+        """Initialize an empty in-memory cache."""
+        self._entries: dict[str, tuple[CacheEntry, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry if it exists and has not expired."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, expires_at = item
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return entry
+
+    def set(
+        self, key: str, value: dict, ttl: float, stored_at: float | None = None
+    ) -> None:
+        """Store an entry."""
+        stored_at = time.time() if stored_at is None else stored_at
+        with self._lock:
+            self._entries[key] = (CacheEntry(value, stored_at), stored_at + ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCacheBackend(WeatherCacheBackend):
+    """Cache backend persisting entries in a SQLite database file.
+
+    Uses write-ahead logging with relaxed syncing to keep writes to flash
+    storage small. Safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the cache database.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the database file, or ":memory:".
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+        logger.debug(f"Opened weather cache database: {path}")
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry if it exists and has not expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, expires_at FROM cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, stored_at, expires_at = row
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+
+        try:
+            return CacheEntry(json.loads(value), stored_at)
+        except ValueError:
+            logger.warning(f"Discarding corrupt cache entry: {key}")
+            self.delete(key)
+            return None
+
+    def set(
+        self, key: str, value: dict, ttl: float, stored_at: float | None = None
+    ) -> None:
+        """Store an entry."""
+        stored_at = time.time() if stored_at is None else stored_at
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), stored_at, stored_at + ttl),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
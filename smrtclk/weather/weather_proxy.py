@@ -0,0 +1,338 @@
+"""Local caching proxy sharing one upstream weather feed with many clocks.
+
+One process fetches weather through a WeatherAPI per location and serves
+the parsed WeatherData as JSON over local HTTP or a Unix socket. Clocks
+read it with WeatherAPIProxy, so a site with N clocks at the same
+coordinates makes one upstream request per cache duration instead of N.
+
+Endpoints:
+    GET /weather?lat=<latitude>&lon=<longitude>
+        WeatherData for the location (HTTP 502 with status "error" if the
+        upstream fetch failed).
+    GET /health
+        {"status": "ok", "circuits": {...}} while the proxy is running, with
+        the circuit breaker stats of each upstream provider.
+
+Usage:
+    python -m smrtclk.weather.weather_proxy [--host H] [--port P]
+        [--socket PATH] [--provider nws|mock] [--cache-duration S]
+"""
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .weather_api import (
+    WeatherAPI,
+    WeatherData,
+    validate_latitude,
+    validate_longitude,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROXY_HOST = "127.0.0.1"
+DEFAULT_PROXY_PORT = 8765
+# Decimal places locations are rounded to, matching persistent cache keys
+LOCATION_PRECISION = 4
+# Upstream APIs kept at most; the least recently used one is closed beyond
+MAX_LOCATIONS = 1024
+# Pending connections queued by the listening socket; a whole fleet of
+# clocks may connect at once
+LISTEN_BACKLOG = 1024
+
+
+class WeatherProxy:
+    """Serves weather for any number of locations from shared upstream APIs.
+
+    Creates one WeatherAPI per location on first use and keeps it, so its
+    cache and single-flight fetching are shared by every client asking for
+    that location. Beyond max_locations, the least recently used API is
+    closed and dropped.
+    """
+
+    def __init__(
+        self,
+        api_factory: Callable[[float, float], WeatherAPI],
+        max_locations: int = MAX_LOCATIONS,
+    ):
+        """Initializes the WeatherProxy class.
+
+        Parameters
+        ----------
+        api_factory : callable
+            Function creating the upstream WeatherAPI for a latitude and
+            longitude.
+        max_locations : int, optional
+            Maximum number of upstream APIs kept (default: 1024).
+
+        Raises
+        ------
+        ValueError
+            If max_locations is less than 1.
+        """
+        if max_locations < 1:
+            raise ValueError("max_locations must be at least 1")
+        self._api_factory = api_factory
+        self._max_locations = max_locations
+        self._apis: OrderedDict[tuple[float, float], WeatherAPI] = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def get_weather(self, latitude: float, longitude: float) -> WeatherData:
+        """Get the current weather for a location.
+
+        Parameters
+        ----------
+        latitude : float
+            The latitude of the location.
+        longitude : float
+            The longitude of the location.
+
+        Returns
+        -------
+        WeatherData
+            Weather data from the location's upstream API.
+
+        Raises
+        ------
+        TypeError
+            If latitude or longitude is not a number.
+        ValueError
+            If latitude or longitude is outside the valid range.
+        """
+        validate_latitude(latitude)
+        validate_longitude(longitude)
+        location = (
+            round(latitude, LOCATION_PRECISION),
+            round(longitude, LOCATION_PRECISION),
+        )
+        evicted = []
+        with self._lock:
+            self.requests += 1
+            api = self._apis.get(location)
+            if api is None:
+                api = self._apis[location] = self._api_factory(*location)
+                while len(self._apis) > self._max_locations:
+                    evicted.append(self._apis.popitem(last=False)[1])
+            else:
+                self._apis.move_to_end(location)
+        for old_api in evicted:
+            old_api.close()
+        return api.get_current_weather()
+
+    def circuit_stats(self) -> dict[str, dict]:
+        """Get the circuit breaker stats of the upstream providers.
+
+        Returns
+        -------
+        dict
+            Breaker stats by provider name, from the first API of each
+            provider (the factories below share one breaker per provider).
+        """
+        with self._lock:
+            apis = list(self._apis.values())
+        stats = {}
+        for api in apis:
+            if api.provider_name not in stats:
+                stats[api.provider_name] = api.circuit_breaker.stats()
+        return stats
+
+    def close(self) -> None:
+        """Close every upstream API."""
+        with self._lock:
+            apis = list(self._apis.values())
+            self._apis.clear()
+        for api in apis:
+            api.close()
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Request handler for the weather proxy endpoints."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            proxy = self.server.proxy  # ty: ignore[unresolved-attribute]
+            self._send_json(200, {"status": "ok", "circuits": proxy.circuit_stats()})
+            return
+        if url.path != "/weather":
+            self._send_json(404, {"status": "error", "error_message": "Not found"})
+            return
+
+        params = parse_qs(url.query)
+        try:
+            latitude = float(params["lat"][0])
+            longitude = float(params["lon"][0])
+            proxy = self.server.proxy  # ty: ignore[unresolved-attribute]
+            weather_data = proxy.get_weather(latitude, longitude)
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"status": "error", "error_message": str(e)})
+            return
+
+        status = 502 if weather_data.get("status") == "error" else 200
+        self._send_json(status, weather_data.to_dict())
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        """Send a JSON response.
+
+        Parameters
+        ----------
+        status : int
+            HTTP status code.
+        payload : dict
+            Response body.
+        """
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        """Get the client address for logging; empty for Unix sockets."""
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        """Log requests at debug level instead of writing to stderr."""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class WeatherProxyServer(ThreadingHTTPServer):
+    """Weather proxy served over TCP."""
+
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, proxy: WeatherProxy, address: tuple[str, int]):
+        """Initializes the WeatherProxyServer class.
+
+        Parameters
+        ----------
+        proxy : WeatherProxy
+            The proxy answering requests.
+        address : tuple of (str, int)
+            Host and port to listen on; port 0 picks a free port.
+        """
+        super().__init__(address, _ProxyHandler)
+        self.proxy = proxy
+
+    @property
+    def url(self) -> str:
+        """Get the URL clients connect to."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class UnixWeatherProxyServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """Weather proxy served over a Unix domain socket."""
+
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, proxy: WeatherProxy, path: str):
+        """Initializes the UnixWeatherProxyServer class.
+
+        Parameters
+        ----------
+        proxy : WeatherProxy
+            The proxy answering requests.
+        path : str
+            Path of the socket file; a stale file is replaced.
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _ProxyHandler)
+        self.proxy = proxy
+
+    @property
+    def url(self) -> str:
+        """Get the URL clients connect to."""
+        return f"unix://{self.server_address}"
+
+    def server_close(self) -> None:
+        """Close the socket and remove the socket file."""
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def _create_api_factory(
+    provider: str, cache_duration: int
+) -> Callable[[float, float], WeatherAPI]:
+    """Create an upstream API factory for a provider name.
+
+    Parameters
+    ----------
+    provider : str
+        "nws" or "mock".
+    cache_duration : int
+        Cache duration of the upstream APIs in seconds.
+
+    Returns
+    -------
+    callable
+        Function creating the upstream WeatherAPI for a location. The APIs
+        share one circuit breaker, so an outage is detected once for all
+        locations.
+    """
+    from .circuit_breaker import CircuitBreaker
+
+    if provider == "mock":
+        from .weather_api_mock import WeatherAPIMock
+
+        breaker = CircuitBreaker()
+        return lambda lat, lon: WeatherAPIMock(
+            lat, lon, cache_duration, circuit_breaker=breaker
+        )
+
+    from .weather_api_nws import WeatherAPINWS, probe_nws
+
+    breaker = CircuitBreaker(probe=probe_nws)
+    return lambda lat, lon: WeatherAPINWS(
+        lat, lon, cache_duration, circuit_breaker=breaker
+    )
+
+
+def main() -> None:
+    """Run the weather proxy until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_PROXY_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PROXY_PORT)
+    parser.add_argument("--socket", help="serve on a Unix socket instead of TCP")
+    parser.add_argument("--provider", choices=["nws", "mock"], default="nws")
+    parser.add_argument("--cache-duration", type=int, default=900)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    proxy = WeatherProxy(_create_api_factory(args.provider, args.cache_duration))
+    if args.socket:
+        server = UnixWeatherProxyServer(proxy, args.socket)
+    else:
+        server = WeatherProxyServer(proxy, (args.host, args.port))
+
+    logger.info(f"Serving weather on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        proxy.close()
+
+
+if __name__ == "__main__":
+    main()
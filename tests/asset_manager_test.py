@@ -0,0 +1,73 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QPixmapCache
+
+from config.constants import BACKGROUND_IMAGE, CLOCK_FACE_IMAGE, HOUR_HAND_IMAGE
+from config.settings import Config
+from smrtclk.views.asset_manager import AssetManager, asset_key
+
+
+@pytest.fixture
+def assets(qapp):
+    QPixmapCache.clear()
+    assets = AssetManager(Config().images_path)
+    yield assets
+    assets.wait()
+    QPixmapCache.clear()
+
+
+def test_preload(assets, qapp):
+    ready = []
+    assets.assetsReady.connect(lambda: ready.append(True))
+    assets.preload({BACKGROUND_IMAGE: QSize(240, 136)})
+    # Every image in the directory, the background only at its display size
+    names = sorted(path.name for path in assets.images_path.glob("*.png"))
+    assert assets.pending == len(names)
+
+    assets.wait()
+    qapp.processEvents()
+    assert ready == [True]
+    assert assets.pending == 0
+
+    background = QPixmapCache.find(asset_key(BACKGROUND_IMAGE, QSize(240, 136)))
+    assert background.size() == QSize(240, 136)
+    assert QPixmapCache.find(asset_key(BACKGROUND_IMAGE)) is None
+    assert QPixmapCache.find(asset_key(HOUR_HAND_IMAGE)).size() == QSize(30, 714)
+
+
+def test_pixmap_waits_for_preload(assets):
+    assets.preload({CLOCK_FACE_IMAGE: QSize(200, 200)})
+    # Available before the decoded signal is delivered
+    face = assets.pixmap(CLOCK_FACE_IMAGE, QSize(200, 200))
+    assert face.size() == QSize(200, 200)
+    assert assets.pixmap(CLOCK_FACE_IMAGE, QSize(200, 200)).cacheKey() == (
+        face.cacheKey()
+    )
+
+
+def test_pixmap_without_preload(assets):
+    hand = assets.pixmap(HOUR_HAND_IMAGE)
+    assert hand.size() == QSize(30, 714)
+    assert QPixmapCache.find(asset_key(HOUR_HAND_IMAGE)).cacheKey() == hand.cacheKey()
+
+
+def test_missing_image(assets):
+    assert assets.pixmap("missing.png").isNull()
+
+
+def test_window_uses_scaled_assets(qapp):
+    from smrtclk.views.main_window import ClockMainWindow
+
+    config = Config(static_layer=False)
+    size = QSize(config.width, config.height)
+    window = ClockMainWindow(config)
+    assert window.background.pixmap().size() == size
+    face_size = window.clock_widget.clockFaceRect(size).size()
+    assert window.clock_widget._clockface.pixmap().size() == face_size
+
+    window.close()
@@ -0,0 +1,227 @@
+import http.client
+import json
+import logging
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import requests
+from nws_stub import NWSStubServer
+
+from smrtclk.weather.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    probe_reachable,
+)
+from smrtclk.weather.weather_api import WeatherHTTPError, is_outage
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+from smrtclk.weather.weather_proxy import WeatherProxy, WeatherProxyServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyMock(WeatherAPIMock):
+    """Mock provider whose fetches fail while down is set."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.down = False
+        self.fetches = 0
+
+    def _fetch_weather_data(self) -> dict:
+        self.fetches += 1
+        if self.down:
+            raise ConnectionError("network unreachable")
+        return super()._fetch_weather_data()
+
+
+def test_opens_after_threshold():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    clock.now = 30
+    assert breaker.stats()["retry_in"] == 30
+
+    # A success in between resets the count
+    breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 60
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    # Only one trial at a time
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    stats = breaker.stats()
+    assert stats["transitions"] == {
+        "closed->open": 1,
+        "open->half_open": 1,
+        "half_open->closed": 1,
+    }
+    assert stats["short_circuits"] == 1
+
+
+def test_failed_probe_backs_off():
+    clock = FakeClock()
+    reachable = [False]
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        reset_timeout=60,
+        max_reset_timeout=200,
+        probe=lambda: reachable[0],
+        clock=clock,
+    )
+    breaker.record_failure()
+
+    # Each failed probe doubles the open period, up to the maximum
+    for elapsed, timeout in [(60, 120), (180, 200), (380, 200)]:
+        clock.now = elapsed
+        assert not breaker.allow_request()
+        assert breaker.state == OPEN
+        assert breaker.stats()["retry_in"] == timeout
+
+    reachable[0] = True
+    clock.now = 580
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["transitions"]["half_open->open"] == 3
+
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+
+
+def test_probe_reachable():
+    with NWSStubServer() as server:
+        assert probe_reachable(server.base_url, timeout=1)
+        url = server.base_url
+    assert not probe_reachable(url, timeout=1)
+
+
+def test_open_circuit_serves_cache(caplog):
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+    weather = FlakyMock(cache_duration=60, circuit_breaker=breaker)
+    assert weather.get_current_weather()["status"] == "ok"
+
+    weather.down = True
+    weather._cache_timestamp -= 61
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            assert weather.get_current_weather()["status"] == "error"
+    assert breaker.state == OPEN
+    # One stack trace per outage
+    assert sum(record.exc_info is not None for record in caplog.records) == 1
+
+    # Short-circuited at once to the last data, without fetching
+    for _ in range(10):
+        result = weather.get_current_weather()
+        assert result["status"] == "offline"
+        assert result["temperature"] is not None
+    assert weather.fetches == 4
+    assert weather.circuit_breaker.stats()["short_circuits"] == 10
+
+    weather.down = False
+    clock.now = 60
+    assert weather.get_current_weather()["status"] == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_without_cache():
+    breaker = CircuitBreaker(failure_threshold=1)
+    weather = FlakyMock(circuit_breaker=breaker)
+    weather.down = True
+    weather.get_current_weather()
+    result = weather.get_current_weather()
+    assert result["status"] == "error"
+    assert weather.fetches == 1
+
+
+def test_client_errors_ignored(stub):
+    # A point outside coverage must not open the breaker shared by all points
+    breaker = CircuitBreaker(failure_threshold=1)
+    weather = WeatherAPINWS(40.7, -74.0, circuit_breaker=breaker)
+    stub.failures = [404] * 3
+    for _ in range(3):
+        assert weather.get_current_weather()["status"] == "error"
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+    assert weather.get_current_weather()["status"] == "ok"
+    weather.close()
+
+
+def test_ignored_trial_keeps_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+    breaker.record_failure()
+    clock.now = 60
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_ignored()
+    assert breaker.state == HALF_OPEN
+    # The next fetch gets to be the trial
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize(
+    "error, outage",
+    [
+        (ConnectionError("refused"), True),
+        (requests.Timeout("read timed out"), True),
+        (WeatherHTTPError(503, "HTTP 503"), True),
+        (WeatherHTTPError(429, "HTTP 429"), True),
+        (WeatherHTTPError(404, "HTTP 404"), False),
+        (KeyError("temperature"), False),
+    ],
+)
+def test_is_outage(error, outage):
+    assert is_outage(error) is outage
+
+
+def test_proxy_health_reports_circuits():
+    breaker = CircuitBreaker()
+    proxy = WeatherProxy(lambda lat, lon: FlakyMock(lat, lon, circuit_breaker=breaker))
+    proxy.get_weather(40.7, -74.0)
+    server = WeatherProxyServer(proxy, ("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request("GET", "/health")
+        health = json.loads(connection.getresponse().read())
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        proxy.close()
+    assert health["circuits"]["mock"]["state"] == CLOSED
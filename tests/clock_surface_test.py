@@ -0,0 +1,95 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from config.constants import CLOCK_FACE_IMAGE, SECOND_HAND_IMAGE
+from config.settings import Config
+from smrtclk.views.clock_surface import ClockSurface
+from smrtclk.views.clock_widget import ClockWidget
+
+
+@pytest.fixture
+def surface(qapp):
+    images_path = Config().images_path
+    surface = ClockSurface(None, QPixmap(str(images_path / CLOCK_FACE_IMAGE)))
+    surface.setGeometry(0, 0, 217, 217)
+    surface.setHandPixmap("sec", QPixmap(str(images_path / SECOND_HAND_IMAGE)))
+    return surface
+
+
+def test_hand_rect_within_surface(surface):
+    full = surface.rect().adjusted(-2, -2, 2, 2)
+    for angle in range(0, 360, 6):
+        rect = surface.handRect("sec", float(angle))
+        assert full.contains(rect)
+        # Hands are much smaller than the face, so the dirty region is too
+        assert rect.width() * rect.height() < surface.width() * surface.height() / 2
+
+
+def test_hand_rect_follows_angle(surface):
+    center = surface.rect().center()
+    # Pointing up, the hand sits mostly above the center
+    up = surface.handRect("sec", 0.0)
+    assert up.top() < center.y() - surface.height() / 4
+    # Pointing right, it sits mostly to the right of the center
+    right = surface.handRect("sec", 90.0)
+    assert right.right() > center.x() + surface.width() / 4
+
+
+def test_set_hand_angle(surface):
+    assert surface.handAngle("sec") is None
+    surface.setHandAngle("sec", 30.0)
+    assert surface.handAngle("sec") == 30.0
+    # Unknown hands are ignored
+    surface.setHandAngle("hour", 30.0)
+    assert surface.handAngle("hour") is None
+
+
+def test_paint(surface):
+    face = surface.grab().toImage()
+    surface.setHandAngle("sec", 90.0)
+    image = surface.grab().toImage()
+    assert not image.isNull()
+    assert image != face
+    # Pixels outside the hand's dirty rectangle are untouched
+    hand_rect = surface.handRect("sec", 90.0)
+    for x, y in [(5, 5), (surface.width() - 5, 5), (5, surface.height() - 5)]:
+        assert not hand_rect.contains(x, y)
+        assert image.pixel(x, y) == face.pixel(x, y)
+
+
+def test_clock_widget_painter_mode(qapp):
+    parent = QWidget()
+    widget = ClockWidget(parent, Config(clock_renderer="painter"))
+    surface = widget.findChild(ClockSurface)
+    assert surface is not None
+    widget.updateHand("sec", 90.0)
+    widget.updateHand("min", 180.0)
+    widget.updateHand("hour", 270.0)
+    assert surface.handAngle("sec") == 90.0
+    assert surface.handAngle("min") == 180.0
+    assert surface.handAngle("hour") == 270.0
+    widget.updateDate("Monday")
+    assert widget.hand_cache is None
+
+
+def test_clock_widget_invalid_renderer(qapp):
+    with pytest.raises(ValueError):
+        ClockWidget(QWidget(), Config(clock_renderer="opengl"))
+
+
+def test_hidden_hand_not_painted(surface):
+    face = surface.grab().toImage()
+    surface.setHandAngle("sec", 90.0)
+    surface.setHandVisible("sec", False)
+    assert surface.grab().toImage() == face
+    # Hidden hands still track their angle
+    surface.setHandAngle("sec", 120.0)
+    assert surface.handAngle("sec") == 120.0
+    surface.setHandVisible("sec", True)
+    assert surface.grab().toImage() != face
@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# Run all Qt tests without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    from nws_stub import NWSStubServer
+
+    from smrtclk.weather import weather_api_nws
+
+    with NWSStubServer() as server:
+        monkeypatch.setattr(weather_api_nws, "BASE_API_URL", server.base_url)
+        yield server
+
+
+@pytest.fixture
+def controller(qapp, stub):
+    from PyQt5.QtWidgets import QWidget
+
+    from config.settings import Config
+    from smrtclk.controllers.weather_controller import WeatherController
+    from smrtclk.models.weather_model import WeatherModel
+    from smrtclk.views.weather_widget import WeatherWidget
+
+    config = Config(latitude=40.7, longitude=-74.0)
+    parent = QWidget()
+    controller = WeatherController(
+        WeatherModel(), WeatherWidget(parent, config), config
+    )
+    yield controller
+    controller.stop()
+    parent.deleteLater()
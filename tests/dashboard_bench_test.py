@@ -0,0 +1,32 @@
+import datetime
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from benchmarks.dashboard_bench import SCENARIOS, FakeClock, run_scenario
+from smrtclk.models.clock_model import ClockModel
+
+
+def test_fake_clock_drives_model(qapp):
+    clock = FakeClock(datetime.datetime(2026, 1, 1, 23, 59, 59))
+    model = ClockModel(clock=clock)
+    days = []
+    model.dayChanged.connect(days.append)
+    model.update_time()
+    clock.advance()
+    model.update_time()
+    assert [d.day for d in days] == [1, 2]
+    assert model.calculate_hand_angle("hour") == 0.0
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_run_scenario(qapp, scenario):
+    result = run_scenario(scenario, ticks=120)
+    assert result["ticks"] == 120
+    assert result["ticks_per_sec"] > 0
+    assert result["cpu_us_per_tick"] > 0
+    assert result["peak_rss_kib"] > 0
+    assert result["simulated_end"].startswith("2026-01-01T00:12")
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import requests
+
+from benchmarks.fake_nws import CELL_POINTS, FIXTURES, FakeNWSServer, rebase_forecast
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.retry import RetryPolicy
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+
+FORECAST = "gridpoints/OKX/33,35/forecast/hourly"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FakeNWSServer(seed=0) as server:
+        monkeypatch.setattr(weather_api_nws, "BASE_API_URL", server.base_url)
+        yield server
+
+
+def test_rebase_forecast():
+    recording = json.loads((FIXTURES / "nws_hourly_okx.json").read_text())
+    now = time.time()
+    rebased = rebase_forecast(recording, now)
+    periods = rebased["properties"]["periods"]
+    start = datetime.fromisoformat(periods[0]["startTime"]).timestamp()
+    assert now - 3600 < start <= now
+    # Local offsets and period lengths are kept
+    assert periods[0]["startTime"].endswith("-05:00")
+    assert len(periods) == len(recording["properties"]["periods"])
+    updated = datetime.fromisoformat(rebased["properties"]["updateTime"])
+    assert updated.timestamp() < start
+
+
+def test_points(server):
+    for location, (latitude, longitude) in CELL_POINTS.items():
+        response = requests.get(f"{server.base_url}points/{latitude},{longitude}")
+        grid = response.json()["properties"]
+        assert f"{grid['gridId']}/{grid['gridX']},{grid['gridY']}" == location
+    assert requests.get(f"{server.base_url}points/10.0,10.0").status_code == 404
+
+
+def test_conditional_requests(server):
+    response = requests.get(server.base_url + FORECAST)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.content == server.forecast("OKX/33,35")
+    assert "max-age=3600" in response.headers["Cache-Control"]
+
+    etag = response.headers["ETag"]
+    response = requests.get(server.base_url + FORECAST, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # A new forecast issue changes the ETag
+    server.regenerate()
+    response = requests.get(server.base_url + FORECAST, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert server.stats()["not_modified"] == 1
+
+
+def test_error_injection():
+    with FakeNWSServer(error_rate=0.5, seed=0) as server:
+        statuses = [
+            requests.get(server.base_url + FORECAST).status_code for _ in range(40)
+        ]
+        stats = server.stats()
+    assert 10 < stats["errors"] < 30
+    assert statuses.count(200) == 40 - stats["errors"]
+    assert set(statuses) <= {200, 500, 502, 503}
+
+
+def test_rate_limit():
+    with FakeNWSServer(rate_limit=1, burst=3) as server:
+        responses = [requests.get(server.base_url + FORECAST) for _ in range(5)]
+    assert [r.status_code for r in responses] == [200, 200, 200, 429, 429]
+    assert int(responses[3].headers["Retry-After"]) >= 1
+    assert server.stats()["rate_limited"] == 2
+
+
+def test_weather_api_pipeline(server):
+    weather = WeatherAPINWS(*CELL_POINTS["TOP/31,80"])
+    result = weather.get_current_weather()
+    assert result["status"] == "ok"
+    assert result["temperature"] is not None
+    assert result["temperature_min"] <= result["temperature"]
+    weather.close()
+
+
+def test_weather_api_retries_errors(monkeypatch):
+    with FakeNWSServer(error_rate=0.3, seed=1) as server:
+        monkeypatch.setattr(weather_api_nws, "BASE_API_URL", server.base_url)
+        policy = RetryPolicy(base_delay=0.01, max_delay=0.05)
+        for location, point in CELL_POINTS.items():
+            weather = WeatherAPINWS(*point, retry_policy=policy)
+            assert weather.get_current_weather()["status"] == "ok"
+            assert weather._location_cache == location
+            weather.close()
+        stats = server.stats()
+    assert stats["errors"] > 0
+    assert stats["points"] == stats["forecasts"] == 2
@@ -0,0 +1,122 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from nws_stub import GRID_POLYGON
+
+from smrtclk.weather.grid_index import (
+    GridIndex,
+    contains,
+    polygon_ring,
+    read_coordinates,
+    resolve_coordinates,
+)
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+
+CELL = {"type": "Polygon", "coordinates": [GRID_POLYGON]}
+# Same-sized cell to the east
+EAST_CELL = {
+    "type": "Polygon",
+    "coordinates": [[[lon + 0.02, lat] for lon, lat in GRID_POLYGON]],
+}
+
+
+def test_polygon_ring():
+    ring = polygon_ring(CELL)
+    assert contains(ring, 40.7128, -74.006)
+    assert not contains(ring, 40.7128, -73.99)
+    assert not contains(ring, 40.73, -74.006)
+    assert polygon_ring(None) is None
+    assert polygon_ring({"type": "Point", "coordinates": [-74.0, 40.7]}) is None
+
+
+def test_lookup():
+    index = GridIndex()
+    assert index.lookup(40.7128, -74.006) is None
+    assert index.add_cell("OKX/33,35", CELL)
+    assert index.add_cell("OKX/34,35", EAST_CELL)
+    assert not index.add_cell("OKX/35,35", None)
+    assert len(index) == 2
+    assert index.lookup(40.71, -74.01) == "OKX/33,35"
+    assert index.lookup(40.71, -73.99) == "OKX/34,35"
+    assert index.lookup(40.8, -74.0) is None
+
+    # Points of cells without a polygon match exactly
+    index.add_point(41.0, -75.0, "PHI/10,20")
+    assert index.lookup(41.00001, -75.0) == "PHI/10,20"
+    assert "PHI/10,20" not in index
+
+
+def test_save_and_load(tmp_path):
+    index = GridIndex()
+    index.add_cell("OKX/33,35", CELL)
+    index.add_point(41.0, -75.0, "PHI/10,20")
+    index.save(tmp_path / "index.json")
+
+    loaded = GridIndex.load(tmp_path / "index.json")
+    assert loaded.to_dict() == index.to_dict()
+    assert loaded.lookup(40.71, -74.01) == "OKX/33,35"
+
+
+def test_move_within_cell_keeps_cache(stub):
+    weather = WeatherAPINWS(40.7128, -74.006)
+    assert weather.get_current_weather()["status"] == "ok"
+    assert "OKX/33,35" in weather.grid_index
+    requests = stub.total_requests
+
+    # A few hundred meters, still in the same cell
+    weather.set_location(40.715, -74.01)
+    weather.latitude = 40.71
+    assert weather.get_current_weather()["status"] == "cached"
+    assert stub.total_requests == requests
+    weather.close()
+
+
+def test_move_to_known_cell_skips_points_lookup(stub):
+    index = GridIndex()
+    index.add_cell("OKX/34,35", EAST_CELL)
+    weather = WeatherAPINWS(40.7128, -74.006, grid_index=index)
+    weather.get_current_weather()
+    assert stub.requests["/points/40.7128,-74.006"] == 1
+
+    weather.set_location(40.71, -73.99)
+    weather.get_current_weather()
+    assert stub.requests["/gridpoints/OKX/34,35/forecast/hourly"] == 1
+    assert not any(path.startswith("/points/40.71,") for path in stub.requests)
+    weather.close()
+
+
+def test_pre_resolved_index_skips_points_lookup(stub):
+    index = GridIndex()
+    index.add_cell("OKX/33,35", CELL)
+    weather = WeatherAPINWS(40.7128, -74.006, grid_index=index)
+    assert weather.location == "OKX/33,35"
+    assert weather.get_current_weather()["status"] == "ok"
+    assert not any(path.startswith("/points/") for path in stub.requests)
+    weather.close()
+
+
+def test_resolve_coordinates(stub, tmp_path):
+    path = tmp_path / "coordinates.txt"
+    path.write_text("# units\n40.7128,-74.006\n\n40.71,-74.01\n41.5,-73.0\n")
+    coordinates = read_coordinates(path)
+    assert coordinates[0] == (40.7128, -74.006)
+
+    index, stats = resolve_coordinates(coordinates)
+    # The second unit falls in the first unit's cell
+    assert stats == {"covered": 1, "points": 2, "cells": 1, "failed": 0}
+    assert stub.total_requests == 3
+    assert index.lookup(41.5, -73.0) == "OKX/33,35"
+
+
+def test_resolve_into_points_only_index(stub):
+    index = GridIndex()
+    index.add_point(41.0, -75.0, "PHI/10,20")
+    assert not index
+
+    resolved, stats = resolve_coordinates([(40.7128, -74.006)], index)
+    assert resolved is index
+    assert stats["points"] == 1
+    assert index.lookup(41.0, -75.0) == "PHI/10,20"
+    assert "OKX/33,35" in index
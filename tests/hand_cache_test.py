@@ -0,0 +1,112 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QPixmap
+
+from config.constants import HOUR_HAND_IMAGE, SECOND_HAND_IMAGE
+from config.settings import Config
+from smrtclk.views.hand_cache import (
+    HAND_POSITIONS,
+    HandSpriteCache,
+    pixmap_bytes,
+    render_hand,
+)
+
+CLOCK_SIZE = QSize(217, 217)
+
+
+@pytest.fixture
+def sec_pixmap(qapp):
+    return QPixmap(str(Config().images_path / SECOND_HAND_IMAGE))
+
+
+@pytest.mark.parametrize(
+    "hand_type, angle, position",
+    [
+        ("sec", 0.0, 0),
+        ("sec", 6.0, 1),
+        ("sec", 354.0, 59),
+        ("sec", 360.0, 0),
+        ("min", 180.0, 30),
+        ("hour", 0.5, 1),
+        ("hour", 359.5, 719),
+    ],
+)
+def test_position_for(hand_type, angle, position):
+    assert HandSpriteCache.position_for(hand_type, angle) == position
+
+
+def test_get_hit_and_miss(sec_pixmap):
+    cache = HandSpriteCache(budget_bytes=64 * 1024 * 1024)
+    first = cache.get("sec", 42.0, sec_pixmap, CLOCK_SIZE)
+    second = cache.get("sec", 42.0, sec_pixmap, CLOCK_SIZE)
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert first.cacheKey() == second.cacheKey()
+    # Sprites match the uncached render path
+    assert first.size() == render_hand(sec_pixmap, CLOCK_SIZE, 42.0).size()
+    # A different clock size is a different key
+    cache.get("sec", 42.0, sec_pixmap, QSize(100, 100))
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+
+def test_budget_eviction(sec_pixmap):
+    sprite_bytes = pixmap_bytes(render_hand(sec_pixmap, CLOCK_SIZE, 0.0))
+    cache = HandSpriteCache(budget_bytes=sprite_bytes)
+    cache.get("sec", 0.0, sec_pixmap, CLOCK_SIZE)
+    cache.get("sec", 180.0, sec_pixmap, CLOCK_SIZE)
+    assert cache.evictions == 1
+    assert len(cache) == 1
+    assert cache.size_bytes <= cache.budget_bytes
+    # The most recently used sprite survives eviction
+    cache.get("sec", 180.0, sec_pixmap, CLOCK_SIZE)
+    assert cache.hits == 1
+
+
+def test_prerender(sec_pixmap):
+    cache = HandSpriteCache(budget_bytes=64 * 1024 * 1024)
+    assert cache.prerender("sec", sec_pixmap, CLOCK_SIZE) == HAND_POSITIONS["sec"]
+    assert len(cache) == HAND_POSITIONS["sec"]
+    # Already rendered positions are skipped
+    assert cache.prerender("sec", sec_pixmap, CLOCK_SIZE) == 0
+    cache.get("sec", 6.0, sec_pixmap, CLOCK_SIZE)
+    assert cache.misses == 0
+
+
+def test_prerender_respects_budget(qapp):
+    pixmap = QPixmap(str(Config().images_path / HOUR_HAND_IMAGE))
+    cache = HandSpriteCache(budget_bytes=1024 * 1024)
+    rendered = cache.prerender("hour", pixmap, CLOCK_SIZE)
+    assert 0 < rendered < HAND_POSITIONS["hour"]
+    assert cache.size_bytes <= cache.budget_bytes
+    assert cache.evictions == 0
+
+
+@pytest.mark.parametrize("mode", ["off", "lazy", "eager"])
+def test_clock_widget_modes(qapp, mode):
+    from PyQt5.QtWidgets import QWidget
+
+    from smrtclk.views.clock_widget import ClockWidget
+
+    parent = QWidget()
+    widget = ClockWidget(parent, Config(hand_cache_mode=mode))
+    widget.updateHand("sec", 90.0)
+    if mode == "off":
+        assert widget.hand_cache is None
+    else:
+        assert widget.hand_cache is not None
+        assert len(widget.hand_cache) > 0
+
+
+def test_clock_widget_invalid_mode(qapp):
+    from PyQt5.QtWidgets import QWidget
+
+    from smrtclk.views.clock_widget import ClockWidget
+
+    with pytest.raises(ValueError):
+        ClockWidget(QWidget(), Config(hand_cache_mode="always"))
@@ -0,0 +1,18 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.json_decode_bench import bench_payload
+from benchmarks.nws_parse_bench import FIXTURES, RECORDED, synthetic_payload
+
+
+def test_bench_payload():
+    raw = (FIXTURES / RECORDED[0]).read_bytes()
+    results = bench_payload(synthetic_payload(raw, 300), repeat=1)
+    assert {"json", "select_periods"} <= set(results)
+    assert all(result["decode_us"] > 0 for result in results.values())
+    # Selected periods keep far less than the full document
+    assert results["select_periods"]["retained_kib"] < (
+        results["json"]["retained_kib"] / 2
+    )
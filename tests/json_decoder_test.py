@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.json_decoder import (
+    DECODERS,
+    DEFAULT_DECODER,
+    PERIOD_FIELDS,
+    PROPERTY_FIELDS,
+    extract,
+    iter_array,
+    loads,
+    select_periods,
+)
+from smrtclk.weather.nws_forecast import ForecastSeries
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture(params=["nws_hourly_okx.json", "nws_hourly_top.json"])
+def raw(request):
+    with open(os.path.join(FIXTURES, request.param), "rb") as f:
+        return f.read()
+
+
+def test_stdlib_fallback_available():
+    assert "json" in DECODERS
+    assert next(iter(DECODERS)) == DEFAULT_DECODER
+
+
+@pytest.mark.parametrize("decoder", list(DECODERS))
+def test_decoders_agree(raw, decoder):
+    assert loads(raw, decoder) == json.loads(raw)
+
+
+def test_select_periods(raw):
+    selected = select_periods(raw)
+    periods = json.loads(raw)["properties"]["periods"]
+
+    assert list(selected) == ["properties", "geometry"]
+    assert selected["geometry"] == json.loads(raw)["geometry"]
+    assert len(selected["properties"]["periods"]) == len(periods)
+    for period, full in zip(selected["properties"]["periods"], periods):
+        assert period == {field: full[field] for field in PERIOD_FIELDS}
+    # Update times are kept for planning the next fetch
+    properties = json.loads(raw)["properties"]
+    for field in PROPERTY_FIELDS:
+        assert selected["properties"][field] == properties[field]
+
+    # Parses to the same forecast as the full document
+    full_series = ForecastSeries.from_payload(json.loads(raw))
+    selected_series = ForecastSeries.from_payload(selected)
+    now = full_series.start[30] + 60
+    assert selected_series.summary(now) == full_series.summary(now)
+
+
+def test_extract():
+    data = b'{"geometry": {"type": "Polygon"}, "properties": {"temperature": {"uom": "degC", "values": [1, 2]}}}'
+    assert extract(data, "temperature") == {"uom": "degC", "values": [1, 2]}
+    assert extract(data, "type") == "Polygon"
+
+
+def test_key_inside_string_ignored():
+    # Quotes inside strings are escaped, so this is not the periods member
+    data = '{"detail": "see \\"periods\\": [1]", "periods": [ {"a": 1} , 2 ]}'
+    assert list(iter_array(data, "periods")) == [{"a": 1}, 2]
+
+
+@pytest.mark.parametrize(
+    "data",
+    ['{"name": "x"}', '{"periods": {}}', '{"periods": [1 2]}', '{"periods": [1,'],
+)
+def test_invalid_documents(data):
+    with pytest.raises(ValueError):
+        list(iter_array(data, "periods"))
+
+
+def test_empty_array():
+    assert list(iter_array('{"periods": [ ]}', "periods")) == []
+
+
+def test_forecast_decoder(stub):
+    with WeatherAPINWS(40.7, -74.0, forecast_decoder=select_periods) as weather:
+        result = weather.get_current_weather()
+    assert result["status"] == "ok"
+    assert result["temperature"] == 72
+    assert result["temperature_min"] == 55
@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from benchmarks.nws_fetch_bench import SCENARIOS, run_scenario
+from smrtclk.weather import weather_api_nws
+
+
+@pytest.mark.parametrize("scenario", [s for s in SCENARIOS if s != "rate_limited"])
+def test_run_scenario(scenario):
+    base_url = weather_api_nws.BASE_API_URL
+    result = run_scenario(scenario, clients=2, calls=3, latency=0)
+    assert result["calls"] == 6
+    assert result["statuses"].get("error", 0) == 0
+    assert result["p50_ms"] <= result["p99_ms"]
+    assert base_url == weather_api_nws.BASE_API_URL
+
+
+def test_revalidation_sends_no_forecast():
+    cold = run_scenario("cold", clients=2, calls=3, latency=0)
+    revalidate = run_scenario("revalidate", clients=2, calls=3, latency=0)
+    assert cold["requests_per_call"] == 2
+    assert revalidate["served"]["not_modified"] == 6
+    assert revalidate["served"]["bytes_sent"] == 0
@@ -0,0 +1,224 @@
+import json
+import os
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.nws_forecast import ForecastSeries
+from smrtclk.weather.solar import sun_times
+from smrtclk.weather.weather_api_nws import parse_forecast
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name)) as f:
+        return json.load(f)
+
+
+@pytest.fixture(params=["nws_hourly_okx.json", "nws_hourly_top.json"])
+def payload(request):
+    return load_fixture(request.param)
+
+
+def reference_summary(payload, now):
+    """Daily summary computed by walking the period dicts."""
+    periods = payload["properties"]["periods"]
+    current = periods[0]
+    for period in periods:
+        if datetime.fromisoformat(period["startTime"]).timestamp() <= now:
+            current = period
+    # Each period's local date in its own UTC offset
+    zone = datetime.fromisoformat(current["startTime"]).tzinfo
+    today = datetime.fromtimestamp(now, zone).date()
+    window = [
+        period
+        for period in periods
+        if period is current
+        or datetime.fromisoformat(period["startTime"]).date() == today
+    ]
+    temperatures = [period["temperature"] for period in window]
+    probabilities = [
+        period["probabilityOfPrecipitation"]["value"]
+        for period in window
+        if period["probabilityOfPrecipitation"]["value"] is not None
+    ]
+    return {
+        "temperature": current["temperature"],
+        "temperature_min": min(temperatures),
+        "temperature_max": max(temperatures),
+        "precipitation": current["probabilityOfPrecipitation"]["value"] or 0,
+        "precipitation_min": min(probabilities, default=0),
+        "precipitation_max": max(probabilities, default=0),
+    }
+
+
+def test_columns(payload):
+    series = ForecastSeries.from_payload(payload)
+    periods = payload["properties"]["periods"]
+
+    assert len(series) == len(periods) == 156
+    assert series.nbytes == 156 * (8 + 4 + 1)
+    assert list(series.start) == sorted(series.start)
+    assert series.temperature[10] == periods[10]["temperature"]
+
+
+def test_summary_matches_reference(payload):
+    series = ForecastSeries.from_payload(payload)
+    first = series.start[0]
+    # Every half hour across the forecast, plus times within a period
+    for step in range(0, 156 * 2):
+        now = first + step * 1800 + 7
+        assert series.summary(now) == reference_summary(payload, now), step
+
+
+def test_utc_offsets():
+    okx = ForecastSeries.from_payload(load_fixture("nws_hourly_okx.json"))
+    top = ForecastSeries.from_payload(load_fixture("nws_hourly_top.json"))
+    assert okx.utc_offsets == [(okx.start[0], -5 * 3600)]
+    # The TOP forecast crosses into daylight saving time
+    dst = datetime(2026, 3, 8, 3, tzinfo=timezone(timedelta(hours=-5))).timestamp()
+    assert top.utc_offsets == [(top.start[0], -6 * 3600), (dst, -5 * 3600)]
+    assert top.utc_offset_at(top.start[0] - 3600) == -6 * 3600
+    assert top.utc_offset_at(dst - 1) == -6 * 3600
+    assert top.utc_offset_at(dst) == -5 * 3600
+
+
+def test_day_window():
+    series = ForecastSeries.from_payload(load_fixture("nws_hourly_okx.json"))
+    # 2026-01-15 06:00 EST is the first period
+    now = datetime(2026, 1, 15, 6, 30, tzinfo=timezone(timedelta(hours=-5)))
+    # Periods from 06:00 through 23:00 local time
+    assert series.day_window(now.timestamp()) == (0, 0, 18)
+    # Later in the day the periods already started still count
+    assert series.day_window(now.timestamp() + 16 * 3600) == (0, 16, 18)
+
+    # Before the forecast starts, the first period is current
+    assert series.day_window(series.start[0] - 3600) == (0, 0, 18)
+    # After it ends, the last period is used with the rest of its day
+    assert series.day_window(series.start[-1] + 7200) == (138, 155, 156)
+
+
+def test_day_window_across_dst():
+    series = ForecastSeries.from_payload(load_fixture("nws_hourly_top.json"))
+    # 2026-03-08 has 23 hours in Topeka; 00:00 to 02:00 CST are periods 42 and 43
+    cdt = timezone(timedelta(hours=-5))
+    now = datetime(2026, 3, 8, 12, tzinfo=cdt).timestamp()
+    assert series.day_window(now) == (42, 53, 42 + 23)
+    # The next day starts at midnight CDT
+    now = datetime(2026, 3, 9, 0, 30, tzinfo=cdt).timestamp()
+    assert series.day_window(now) == (65, 65, 65 + 24)
+
+
+def test_next_change():
+    series = ForecastSeries.from_payload(load_fixture("nws_hourly_top.json"))
+    # The next period starts, or after the last one local midnight
+    assert series.next_change(series.start[0] + 60) == series.start[1]
+    end = series.next_change(series.start[-1] + 60)
+    assert datetime.fromtimestamp(end, timezone(timedelta(hours=-5))).hour == 0
+    assert end - series.start[-1] == 6 * 3600
+
+
+def test_dict_roundtrip():
+    series = ForecastSeries.from_payload(load_fixture("nws_hourly_top.json"))
+    restored = ForecastSeries.from_dict(json.loads(json.dumps(series.to_dict())))
+    assert restored.start == series.start
+    assert restored.temperature == series.temperature
+    assert restored.precipitation == series.precipitation
+    assert restored.utc_offsets == series.utc_offsets
+    now = series.start[50] + 60
+    assert restored.summary(now) == series.summary(now)
+
+
+def test_late_evening_summary():
+    series = ForecastSeries.from_payload(load_fixture("nws_hourly_okx.json"))
+    # At 23:30 the day's range still covers the periods since 06:00
+    summary = series.summary(series.start[17] + 1800)
+    assert summary["temperature_min"] == min(series.temperature[:18])
+    assert summary["temperature_max"] == max(series.temperature[:18])
+    assert summary["temperature_min"] < summary["temperature_max"]
+
+
+def test_missing_precipitation():
+    payload = load_fixture("nws_hourly_top.json")
+    series = ForecastSeries.from_payload(payload)
+    periods = payload["properties"]["periods"]
+    missing = [
+        i
+        for i, period in enumerate(periods)
+        if period["probabilityOfPrecipitation"]["value"] is None
+    ]
+    assert missing
+    assert all(series.precipitation[i] == -1 for i in missing)
+    # A missing current value reports 0 rather than the sentinel
+    assert series.summary(series.start[missing[0]] + 60)["precipitation"] == 0
+
+
+def test_celsius_converted():
+    payload = load_fixture("nws_hourly_okx.json")
+    for period in payload["properties"]["periods"]:
+        period["temperature"] = round((period["temperature"] - 32) * 5 / 9, 1)
+        period["temperatureUnit"] = "C"
+    celsius = ForecastSeries.from_payload(payload)
+    fahrenheit = ForecastSeries.from_payload(load_fixture("nws_hourly_okx.json"))
+
+    now = celsius.start[3]
+    for key, value in fahrenheit.summary(now).items():
+        assert celsius.summary(now)[key] == pytest.approx(value, abs=0.2)
+
+
+def test_large_payload():
+    # A month of hourly periods built from the fixture's period shape
+    template = load_fixture("nws_hourly_okx.json")
+    period = template["properties"]["periods"][0]
+    start = datetime.fromisoformat(period["startTime"])
+    periods = []
+    for i in range(24 * 31):
+        periods.append(
+            {
+                **period,
+                "number": i + 1,
+                "startTime": (start + timedelta(hours=i)).isoformat(),
+                "temperature": 20 + (i * 7) % 50,
+                "probabilityOfPrecipitation": {"value": (i * 3) % 101},
+            }
+        )
+    payload = {"properties": {"periods": periods}}
+
+    series = ForecastSeries.from_payload(payload)
+    assert len(series) == 24 * 31
+    for hours in (0, 100, 500, 24 * 31 - 1):
+        now = start.timestamp() + hours * 3600 + 60
+        assert series.summary(now) == reference_summary(payload, now)
+
+
+def test_parse_forecast(payload):
+    series = ForecastSeries.from_payload(payload)
+    now = series.start[20] + 60
+    weather_data = parse_forecast(payload, 40.7128, -74.006, now)
+    assert weather_data["temperature"] == series.temperature[20]
+    assert set(weather_data) >= {"sunrise", "sunset", "precipitation_max"}
+    # Local solar times for the forecast's date and time zone
+    utc_offset = series.utc_offset_at(now)
+    date = datetime.fromtimestamp(now, timezone(timedelta(seconds=utc_offset)))
+    assert (weather_data["sunrise"], weather_data["sunset"]) == sun_times(
+        40.7128, -74.006, date.date(), utc_offset
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"properties": {"periods": []}}, {"properties": {"periods": [{}]}}],
+)
+def test_invalid_payload(payload):
+    with pytest.raises((ValueError, KeyError)):
+        ForecastSeries.from_payload(payload)
+
+
+def test_column_lengths_checked():
+    with pytest.raises(ValueError):
+        ForecastSeries(array("d", [0.0]), array("f"), array("b"))
@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.nws_parse_bench import (
+    FIXTURES,
+    RECORDED,
+    bench_payload,
+    synthetic_payload,
+)
+
+
+def test_bench_payload():
+    raw = (FIXTURES / RECORDED[0]).read_bytes()
+    result = bench_payload(synthetic_payload(raw, 300), repeat=1)
+    assert result["periods"] == 300
+    assert result["summary_us"] > 0
+    # The columns are far smaller than the decoded dicts
+    assert result["columns_kib"] < result["decoded_kib"] / 10
@@ -0,0 +1,184 @@
+"""Local stand-in for the NWS API used by tests.
+
+Serves minimal ``points/`` and ``gridpoints/.../forecast/hourly`` responses over
+HTTP/1.1 keep-alive and counts connections and requests per path. Forecasts
+carry ETag/Last-Modified validators and honor conditional requests. Setting
+``delay`` makes every response wait that many seconds; ``max_active``
+records the most requests handled at once. Setting ``cache_control`` or
+``update_time`` adds a Cache-Control header or an updateTime to forecasts.
+Forecasts carry the polygon of the grid cell, GRID_POLYGON, as geometry.
+Statuses queued in ``failures`` are returned, one per request, before
+serving normally again, with a Retry-After header if ``retry_after`` is set.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GRID_ID = "OKX"
+GRID_X = 33
+GRID_Y = 35
+
+# (longitude, latitude) vertices of the grid cell around (40.7128, -74.006)
+GRID_POLYGON = [
+    [-74.016, 40.7028],
+    [-73.996, 40.7028],
+    [-73.996, 40.7228],
+    [-74.016, 40.7228],
+    [-74.016, 40.7028],
+]
+
+POINTS_PATH = re.compile(r"^/points/(-?[\d.]+),(-?[\d.]+)$")
+FORECAST_PATH = re.compile(r"^/gridpoints/(\w+)/(\d+),(\d+)/forecast/hourly$")
+
+
+def points_payload() -> dict:
+    return {
+        "properties": {"gridId": GRID_ID, "gridX": GRID_X, "gridY": GRID_Y},
+    }
+
+
+def forecast_payload(update_time: str | None = None) -> dict:
+    """Hourly forecast starting this hour: 72 F now, 55 F at the daily low.
+
+    The periods use the UTC offset at which this hour is 06:00, so the
+    whole forecast falls on one local day whenever the tests run.
+    """
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    zone = timezone(timedelta(hours=(6 - now.hour + 12) % 24 - 12))
+    temperatures = [72, 55, 60, 64, 68, 70, 70, 69, 66, 62]
+    periods = []
+    for i, temperature in enumerate(temperatures):
+        start = (now + timedelta(hours=i)).astimezone(zone)
+        periods.append(
+            {
+                "number": i + 1,
+                "name": "",
+                "startTime": start.isoformat(),
+                "endTime": (start + timedelta(hours=1)).isoformat(),
+                "temperature": temperature,
+                "temperatureUnit": "F",
+                "probabilityOfPrecipitation": {
+                    "unitCode": "wmoUnit:percent",
+                    "value": 10 * i,
+                },
+            }
+        )
+    properties = {"periods": periods}
+    if update_time is not None:
+        properties["updateTime"] = update_time
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Polygon", "coordinates": [GRID_POLYGON]},
+        "properties": properties,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests[self.path] += 1
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            self._respond()
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def _respond(self):
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        with self.server.lock:
+            failure = self.server.failures.pop(0) if self.server.failures else None
+        if failure is not None:
+            headers = {}
+            if self.server.retry_after is not None:
+                headers["Retry-After"] = self.server.retry_after
+            self._send_json(failure, {"detail": "Injected failure"}, headers)
+        elif POINTS_PATH.match(self.path):
+            self._send_json(200, points_payload())
+        elif FORECAST_PATH.match(self.path):
+            self._send_forecast()
+        else:
+            self._send_json(404, {"detail": "Not Found"})
+
+    def _send_forecast(self):
+        server = self.server
+        if self.headers.get("If-None-Match") == server.forecast_etag:
+            with server.lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", server.forecast_etag)
+            if server.cache_control is not None:
+                self.send_header("Cache-Control", server.cache_control)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        headers = {"ETag": server.forecast_etag, "Last-Modified": server.last_modified}
+        if server.cache_control is not None:
+            headers["Cache-Control"] = server.cache_control
+        self._send_json(200, forecast_payload(server.update_time), headers)
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/geo+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class NWSStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: Counter[str] = Counter()
+        self.not_modified = 0
+        self.forecast_etag = '"forecast-v1"'
+        self.last_modified = "Thu, 01 Jan 2026 00:00:00 GMT"
+        self.cache_control: str | None = None
+        self.update_time: str | None = None
+        self.failures: list[int] = []
+        self.retry_after: str | None = None
+        self.delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,21 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from benchmarks.poll_schedule_bench import POLICIES, simulate
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_simulate_policy(policy):
+    result = simulate(policy, clients=2, hours=3)
+    assert result["calls_per_day"] > 0
+    assert 0 <= result["mean_delay_s"] <= result["max_delay_s"]
+
+
+def test_planned_fetches_less_often():
+    fixed = simulate("fixed_900", clients=2, hours=6)
+    planned = simulate("planned", clients=2, hours=6)
+    assert planned["calls_per_day"] < fixed["calls_per_day"] / 2
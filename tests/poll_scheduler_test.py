@@ -0,0 +1,150 @@
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtCore import QEventLoop, QTimer
+
+from config.constants import WEATHER_UPDATE_INTERVAL
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.poll_scheduler import (
+    PollScheduler,
+    expiry_time,
+    freshness_lifetime,
+)
+from smrtclk.weather.retry import RetryPolicy
+from smrtclk.weather.weather_api_nws import WeatherAPINWS, forecast_update_time
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def test_freshness_lifetime():
+    assert freshness_lifetime({}) is None
+    assert freshness_lifetime({"cache-control": "public, max-age=600"}) == 600
+    assert freshness_lifetime({"Cache-Control": "max-age=600", "Age": "100"}) == 500
+    assert freshness_lifetime({"Cache-Control": "no-cache, max-age=600"}) == 0
+    assert freshness_lifetime({"Cache-Control": "max-age=60", "Age": "90"}) == 0
+
+    # Expires is relative to the Date header, and loses to max-age
+    dated = {
+        "Date": "Thu, 01 Jan 2026 00:00:00 GMT",
+        "Expires": "Thu, 01 Jan 2026 00:15:00 GMT",
+    }
+    assert freshness_lifetime(dated) == 900
+    assert freshness_lifetime({**dated, "Cache-Control": "max-age=60"}) == 60
+    assert freshness_lifetime({"Expires": "0"}) == 0
+
+    assert expiry_time({"Cache-Control": "max-age=600"}, now=1000) == 1600
+    assert expiry_time({}, now=1000) is None
+
+
+def test_plan_without_hints():
+    scheduler = PollScheduler()
+    assert scheduler.plan(1000, 300) == 1300
+
+
+def test_plan_from_hints():
+    scheduler = PollScheduler(
+        update_period=3600, jitter=300, min_interval=60, max_interval=7200
+    )
+    rng = random.Random(0)
+    scheduler._rng = rng
+
+    # The later hint wins, plus up to the jitter
+    for _ in range(100):
+        planned = scheduler.plan(0, 300, expires=600, updated_at=-1200)
+        assert 2400 <= planned <= 2700
+
+    # Overdue updates are checked again after a while
+    planned = scheduler.plan(0, 300, updated_at=-4000)
+    assert 600 <= planned <= 900
+
+
+def test_plan_spreads_fetches():
+    scheduler = PollScheduler(jitter=300, rng=random.Random(1))
+    planned = {round(scheduler.plan(0, 300, expires=600)) for _ in range(50)}
+    assert len(planned) > 10
+
+
+def test_plan_clamped():
+    scheduler = PollScheduler(jitter=0, min_interval=60, max_interval=7200)
+    assert scheduler.plan(1000, 300, expires=1010) == 1060
+    assert scheduler.plan(1000, 300, expires=100000) == 8200
+
+    with pytest.raises(ValueError):
+        PollScheduler(min_interval=600, max_interval=60)
+    with pytest.raises(ValueError):
+        PollScheduler(jitter=-1)
+
+
+def test_forecast_update_time():
+    assert forecast_update_time({"properties": {}}) is None
+    assert forecast_update_time({"properties": {"updateTime": "soon"}}) is None
+    raw = {
+        "properties": {
+            "updateTime": "2026-01-15T09:48:00+00:00",
+            "generatedAt": "2026-01-15T10:13:00+00:00",
+        }
+    }
+    expected = datetime(2026, 1, 15, 9, 48, tzinfo=timezone.utc).timestamp()
+    assert forecast_update_time(raw) == expected
+    del raw["properties"]["updateTime"]
+    assert forecast_update_time(raw) == expected + 25 * 60
+
+
+def test_nws_cache_lifetime_from_headers(stub):
+    stub.cache_control = "max-age=900"
+    stub.update_time = iso(time.time() - 600)
+    scheduler = PollScheduler(jitter=0)
+    with WeatherAPINWS(40.7, -74.0, poll_scheduler=scheduler) as weather:
+        weather.get_current_weather()
+        # Kept until the next hourly update, not the 15 minute cache duration
+        assert weather._cache_lifetime == pytest.approx(3000, abs=5)
+
+        # A 304 renewal plans from the new headers
+        stub.cache_control = "max-age=4000"
+        weather._cache_timestamp -= weather._cache_lifetime + 1
+        weather.get_current_weather()
+        assert stub.not_modified == 1
+        assert weather._cache_lifetime == pytest.approx(4000)
+
+
+def test_nws_cache_lifetime_without_headers(stub):
+    with WeatherAPINWS(40.7, -74.0, cache_duration=600) as weather:
+        weather.get_current_weather()
+        assert weather._cache_lifetime == 600
+
+
+def wait_for(predicate, timeout_ms=5000):
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: predicate() and loop.quit())
+    poll.start(5)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    poll.stop()
+    return predicate()
+
+
+def test_controller_plans_next_fetch(controller, stub):
+    stub.cache_control = "max-age=1800"
+    controller.fetchWeather()
+    assert wait_for(lambda: controller.model.weather_data is not None)
+    assert wait_for(lambda: controller._timer.interval() != WEATHER_UPDATE_INTERVAL)
+    assert 1790 * 1000 <= controller._timer.interval() <= 2100 * 1000
+    assert controller.nextFetchIn() > 0
+
+
+def test_controller_falls_back_after_error(controller, monkeypatch):
+    monkeypatch.setattr(weather_api_nws, "BASE_API_URL", "http://127.0.0.1:9/")
+    controller._retry_policy = RetryPolicy(max_attempts=1)
+    controller.fetchWeather()
+    assert wait_for(lambda: not controller.isFetching())
+    assert controller._timer.isActive()
+    assert controller._timer.interval() == WEATHER_UPDATE_INTERVAL
@@ -0,0 +1,193 @@
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import requests
+from PyQt5.QtCore import QEventLoop, QTimer
+
+from smrtclk.weather.retry import (
+    CancelToken,
+    RetryCancelled,
+    RetryPolicy,
+    parse_retry_after,
+)
+from smrtclk.weather.weather_api_nws import WeatherAPINWS, get_json_requests_retry
+
+# Short delays so the tests run quickly
+FAST = {"base_delay": 0.01, "max_delay": 0.05}
+
+
+def points_url(server):
+    return f"{server.base_url}points/40.7,-74.0"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Thu, 01 Jan 2026 00:02:00 GMT", now=1767225600) == 120
+    assert parse_retry_after("Thu, 01 Jan 2026 00:00:00 GMT", now=1767225700) == 0
+
+
+def test_full_jitter_backoff():
+    policy = RetryPolicy(base_delay=1, max_delay=10, rng=random.Random(0))
+    for retry, cap in [(0, 1), (1, 2), (2, 4), (5, 10)]:
+        delays = [policy.backoff(retry) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap / 2
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_budget_limits():
+    now = [0.0]
+    policy = RetryPolicy(
+        max_attempts=3, base_delay=1, deadline=10, clock=lambda: now[0]
+    )
+    budget = policy.start()
+    assert budget.next_delay(404) is None
+    assert budget.next_delay(503) is not None
+    assert budget.next_delay(None) is not None
+    # Out of attempts
+    assert budget.next_delay(503) is None
+
+    budget = policy.start()
+    assert budget.timeout((3.05, 10.0)) == (3.05, 10.0)
+    now[0] = 8
+    assert budget.timeout((3.05, 10.0)) == (2, 2)
+    # Retry-After replaces the backoff, unless it passes the deadline
+    assert budget.next_delay(429, retry_after=1.5) == 1.5
+    assert budget.next_delay(503, retry_after=5) is None
+
+
+def test_retries_error_statuses(stub):
+    stub.failures = [503, 500, 502]
+    data = get_json_requests_retry(points_url(stub), retry=RetryPolicy(**FAST))
+    assert data["properties"]["gridId"] == "OKX"
+    assert stub.total_requests == 4
+
+
+def test_gives_up_after_attempts(stub):
+    stub.failures = [503] * 5
+    with pytest.raises(Exception, match="HTTP 503"):
+        get_json_requests_retry(
+            points_url(stub), retry=RetryPolicy(max_attempts=3, **FAST)
+        )
+    assert stub.total_requests == 3
+
+
+def test_client_errors_not_retried(stub):
+    stub.failures = [404]
+    with pytest.raises(Exception, match="HTTP 404"):
+        get_json_requests_retry(points_url(stub), retry=RetryPolicy(**FAST))
+    assert stub.total_requests == 1
+
+
+def test_honors_retry_after(stub):
+    stub.failures = [429]
+    stub.retry_after = "1"
+    start = time.monotonic()
+    get_json_requests_retry(points_url(stub), retry=RetryPolicy(**FAST))
+    assert time.monotonic() - start >= 1
+    assert stub.total_requests == 2
+
+
+def test_retry_after_past_deadline(stub):
+    stub.failures = [503]
+    stub.retry_after = "120"
+    start = time.monotonic()
+    with pytest.raises(Exception, match="HTTP 503"):
+        get_json_requests_retry(points_url(stub), retry=RetryPolicy(deadline=5))
+    # Gave up at once instead of waiting past the deadline
+    assert time.monotonic() - start < 1
+    assert stub.total_requests == 1
+
+
+def test_deadline_bounds_slow_fetch(stub):
+    stub.delay = 0.5
+    policy = RetryPolicy(deadline=1.0, **FAST)
+    start = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        get_json_requests_retry(points_url(stub), timeout=(1.0, 0.3), retry=policy)
+    assert time.monotonic() - start < 1.5
+    assert stub.total_requests >= 2
+
+
+def test_connection_errors_retried():
+    attempts = []
+    policy = RetryPolicy(max_attempts=3, **FAST)
+    session = requests.Session()
+    original = session.get
+
+    def counting_get(*args, **kwargs):
+        attempts.append(kwargs["timeout"])
+        return original(*args, **kwargs)
+
+    session.get = counting_get
+    with pytest.raises(requests.ConnectionError):
+        get_json_requests_retry("http://127.0.0.1:9/", session, retry=policy)
+    assert len(attempts) == 3
+
+
+def test_cancel_while_waiting(stub):
+    stub.failures = [503]
+    stub.retry_after = "30"
+    cancel = CancelToken()
+    threading.Timer(0.2, cancel.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(RetryCancelled):
+        get_json_requests_retry(points_url(stub), cancel=cancel)
+    assert time.monotonic() - start < 5
+
+
+def test_close_cancels_api_fetch(stub):
+    stub.failures = [503]
+    stub.retry_after = "30"
+    weather = WeatherAPINWS(40.7, -74.0)
+    threading.Timer(0.2, weather.close).start()
+
+    start = time.monotonic()
+    with pytest.raises(RetryCancelled):
+        weather._get_location()
+    assert time.monotonic() - start < 5
+
+
+def wait_for(predicate, timeout_ms=5000):
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: predicate() and loop.quit())
+    poll.start(5)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    poll.stop()
+    return predicate()
+
+
+@pytest.fixture
+def controller(controller):
+    controller._retry_policy = RetryPolicy(**FAST)
+    return controller
+
+
+def test_controller_retries_failed_requests(controller, stub):
+    stub.failures = [503, 500]
+    controller.fetchWeather()
+    assert wait_for(lambda: controller.model.weather_data is not None)
+    assert stub.total_requests == 4
+    assert controller._retry is None
+
+
+def test_controller_honors_retry_after(controller, stub):
+    stub.failures = [429]
+    stub.retry_after = "20"
+    controller.fetchWeather()
+    assert wait_for(lambda: not controller.isFetching())
+    assert controller._timer.interval() == 20 * 1000
+    assert controller._retry.attempts == 2
@@ -0,0 +1,69 @@
+import math
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.solar import SunTable, sun_table, sun_times
+
+
+def minutes(hhmm):
+    hours, mins = hhmm.split(":")
+    return int(hours) * 60 + int(mins)
+
+
+@pytest.mark.parametrize(
+    "latitude, longitude, day, utc_offset, sunrise, sunset",
+    [
+        # Reference times from the NOAA solar calculator
+        (39.7392, -104.9903, date(2026, 6, 21), -6, "05:32", "20:31"),
+        (40.7128, -74.006, date(2026, 1, 15), -5, "07:18", "16:54"),
+        (51.5074, -0.1278, date(2026, 3, 20), 0, "06:02", "18:14"),
+        (-33.8688, 151.2093, date(2026, 12, 21), 11, "05:41", "20:05"),
+        (0.0, 0.0, date(2026, 9, 23), 0, "05:49", "17:56"),
+    ],
+)
+def test_sun_times(latitude, longitude, day, utc_offset, sunrise, sunset):
+    result = sun_times(latitude, longitude, day, utc_offset * 3600)
+    assert abs(minutes(result[0]) - minutes(sunrise)) <= 2
+    assert abs(minutes(result[1]) - minutes(sunset)) <= 2
+
+
+def test_polar_night_and_midnight_sun():
+    tromso = (69.6496, 18.956)
+    # Polar night: the sun neither rises nor sets, both times are noon
+    sunrise, sunset = sun_times(*tromso, date(2026, 12, 21), 3600)
+    assert sunrise == sunset
+    assert abs(minutes(sunrise) - minutes("11:42")) <= 2
+    assert sun_table(*tromso, 2026).is_polar_night(date(2026, 12, 21))
+
+    # Midnight sun spans the whole day
+    assert sun_times(*tromso, date(2026, 6, 21), 7200) == ("00:00", "23:59")
+    assert not sun_table(*tromso, 2026).is_polar_night(date(2026, 6, 21))
+
+
+def test_leap_day():
+    table = sun_table(40.7, -74.0, 2024)
+    sunrise, sunset = table.times(date(2024, 12, 31))
+    assert len(table.sunrise) == 366
+    assert not math.isnan(sunrise)
+    assert sunset > sunrise
+
+
+def test_tables_cached():
+    table = sun_table(40.71281, -74.0, 2026)
+    # Nearby coordinates round to the same table
+    assert sun_table(40.71279, -74.0, 2026) is table
+    assert sun_table(40.7128, -74.0, 2027) is not table
+
+
+def test_many_locations_fast():
+    start = time.perf_counter()
+    for i in range(100):
+        SunTable(-60 + i * 1.2, -180 + i * 3.6, 2026)
+    # A year of sun times per location in well under a millisecond each
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,141 @@
+import json
+import os
+import subprocess
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config.constants import DEFERRED_IMPORTS
+from config.settings import Config
+from smrtclk.profiling import StartupProfiler, profile_phase
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    pkg = tmp_path / "startup_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from . import inner\n")
+    (pkg / "inner.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "startup_pkg"
+    for name in ("startup_pkg", "startup_pkg.inner"):
+        sys.modules.pop(name, None)
+
+
+def test_records_nested_imports(package):
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import startup_pkg
+    finally:
+        profiler.uninstall()
+    assert not profiler.installed
+
+    imports = {entry["module"]: entry for entry in profiler.summary()["imports"]}
+    outer, inner = imports[package], imports[f"{package}.inner"]
+    assert inner["total"] >= 20
+    # The package's own time excludes the nested import
+    assert outer["total"] >= inner["total"]
+    assert outer["self"] < inner["total"]
+
+    # The import system sees the original loader
+    assert startup_pkg.__loader__ is startup_pkg.__spec__.loader
+    assert type(startup_pkg.__loader__).__name__ == "SourceFileLoader"
+
+
+def test_phases_marks_and_dump(tmp_path):
+    profiler = StartupProfiler(tmp_path / "startup.json")
+    with profile_phase(profiler, "build"):
+        pass
+    with profile_phase(None, "ignored"):
+        pass
+    profiler.mark("first_frame")
+    profiler.report()
+
+    report = json.loads((tmp_path / "startup.json").read_text())
+    assert list(report["phases"]) == ["build"]
+    assert report["marks"]["first_frame"] >= report["phases"]["build"]
+    assert report["modules"] == 0
+
+
+def test_main_window_import_is_light():
+    # Weather providers and network modules are not needed for the first frame
+    code = (
+        "import sys; import smrtclk.views.main_window; "
+        "print(sorted(m for m in ('requests', 'PyQt5.QtNetwork', "
+        "'smrtclk.weather.weather_api_nws') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_deferred_imports_after_first_frame(qapp, monkeypatch):
+    from PyQt5.QtTest import QSignalSpy
+    from PyQt5.QtWidgets import QApplication
+
+    from smrtclk.views.main_window import ClockMainWindow
+
+    loaded = []
+    monkeypatch.setattr(
+        "smrtclk.views.main_window.importlib.import_module", loaded.append
+    )
+    window = ClockMainWindow(Config())
+    spy = QSignalSpy(window.firstFramePainted)
+    assert loaded == []
+
+    window.show()
+    for _ in range(20):
+        if len(spy):
+            break
+        QApplication.processEvents()
+        spy.wait(50)
+    assert len(spy) == 1
+    assert loaded == list(DEFERRED_IMPORTS)
+
+    window.close()
+
+
+def test_eager_imports(qapp, monkeypatch):
+    from smrtclk.views.main_window import ClockMainWindow
+
+    loaded = []
+    monkeypatch.setattr(
+        "smrtclk.views.main_window.importlib.import_module", loaded.append
+    )
+    window = ClockMainWindow(Config(defer_imports=False))
+    assert loaded == list(DEFERRED_IMPORTS)
+    window.close()
+
+
+def test_lazy_exports():
+    # Exports are imported on first access
+    code = (
+        "import sys, smrtclk.weather as w; "
+        "before = 'smrtclk.weather.retry' in sys.modules; "
+        "policy = w.RetryPolicy; "
+        "print(before, 'smrtclk.weather.retry' in sys.modules, "
+        "'RetryPolicy' in vars(w), 'GridIndex' in dir(w))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "True", "True", "True"]
+
+    import smrtclk.controllers
+
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        smrtclk.controllers.Missing  # noqa: B018
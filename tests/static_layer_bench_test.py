@@ -0,0 +1,15 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from benchmarks.static_layer_bench import SCENARIOS, bench_scenario
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_bench_scenario(qapp, scenario):
+    result = bench_scenario(qapp, scenario, ticks=5)
+    assert result["update_us"] > 0
+    assert result["repaint_us"] > 0
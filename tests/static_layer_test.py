@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QPixmap
+
+from config.settings import Config
+from smrtclk.views.asset_manager import AssetManager
+from smrtclk.views.clock_surface import ClockSurface
+from smrtclk.views.static_layer import StaticLayer, compose_layer
+
+
+def test_compose_layer(qapp):
+    background = QPixmap(40, 20)
+    background.fill(QColor("red"))
+    face = QPixmap(10, 10)
+    face.fill(Qt.transparent)
+
+    layer = compose_layer(QSize(40, 20), background, face, QRect(5, 5, 10, 10))
+    image = layer.toImage()
+    assert layer.size() == QSize(40, 20)
+    assert not layer.hasAlpha()
+    # A transparent face leaves the background showing through
+    assert QColor(image.pixel(10, 10)) == QColor("red")
+
+
+def test_recomposed_on_resize(qapp):
+    layer = StaticLayer(None, AssetManager(Config().images_path))
+    layer.resize(480, 272)
+    assert layer.layer.size() == QSize(480, 272)
+    layer.resize(240, 136)
+    assert layer.layer.size() == QSize(240, 136)
+
+
+@pytest.mark.parametrize("renderer", ["labels", "painter"])
+def test_window_face_in_static_layer(qapp, renderer):
+    from smrtclk.views.main_window import ClockMainWindow
+
+    window = ClockMainWindow(Config(clock_renderer=renderer))
+    assert isinstance(window.background, StaticLayer)
+    clockface = window.clock_widget._clockface
+    if renderer == "painter":
+        # Only the hands are painted over the layer
+        assert isinstance(clockface, ClockSurface)
+        assert clockface._face_pixmap is None
+    else:
+        assert clockface is None
+    window.close()
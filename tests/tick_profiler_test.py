@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import Config
+from smrtclk.profiling import TickProfiler, profile_stage
+
+
+def test_summary_percentiles():
+    profiler = TickProfiler(capacity=1000)
+    for i in range(1, 101):
+        profiler.record("paint", i * 1_000_000)
+    stats = profiler.summary()["paint"]
+    assert stats["count"] == 100
+    assert stats["p50"] == pytest.approx(50.0)
+    assert stats["p95"] == pytest.approx(95.0)
+    assert stats["p99"] == pytest.approx(99.0)
+    assert stats["max"] == pytest.approx(100.0)
+    assert stats["mean"] == pytest.approx(50.5)
+
+
+def test_ring_buffer_capacity():
+    profiler = TickProfiler(capacity=10)
+    for i in range(25):
+        profiler.record("tick", i)
+    stats = profiler.summary()["tick"]
+    assert stats["count"] == 10
+    # Only the most recent samples are kept
+    assert stats["max"] == pytest.approx(24 / 1e6)
+
+
+def test_stage_timing():
+    profiler = TickProfiler()
+    with profiler.stage("angle_calc"):
+        sum(range(1000))
+    assert profiler.summary()["angle_calc"]["count"] == 1
+    # Disabled profiling is a shared no-op
+    with profile_stage(None, "angle_calc"):
+        pass
+    assert profile_stage(None, "a") is profile_stage(None, "b")
+
+
+def test_tick_and_paint_latency():
+    profiler = TickProfiler()
+    profiler.begin_tick()
+    profiler.end_tick()
+    profiler.paint_done()
+    # Only the first paint after a tick counts towards its latency
+    profiler.paint_done()
+    summary = profiler.summary()
+    assert summary["tick"]["count"] == 1
+    assert summary["tick_to_paint"]["count"] == 1
+    assert profiler.tick_count == 1
+    profiler.reset()
+    assert profiler.summary() == {}
+
+
+def test_periodic_dump(tmp_path):
+    path = tmp_path / "ticks.json"
+    profiler = TickProfiler(report_every=3, report_path=path)
+    for _ in range(2):
+        profiler.begin_tick()
+        profiler.end_tick()
+    assert not path.exists()
+    profiler.begin_tick()
+    profiler.end_tick()
+    report = json.loads(path.read_text())
+    assert report["ticks"] == 3
+    assert report["stages"]["tick"]["count"] == 3
+
+
+@pytest.mark.parametrize("renderer", ["labels", "painter"])
+def test_main_window_profiling(qapp, renderer):
+    from smrtclk.views.main_window import ClockMainWindow
+
+    window = ClockMainWindow(Config(clock_renderer=renderer, profile_ticks=True))
+    window.show()
+    window.clock_controller._onTimerTick()
+    QApplication.processEvents()
+    summary = window.profiler.summary()
+    for stage in ("model_update", "angle_calc", "tick", "paint", "tick_to_paint"):
+        assert stage in summary
+    if renderer == "labels":
+        assert "pixmap_transform" in summary
+        assert "geometry_set" in summary
+    window.clock_controller.stop()
+    window.hide()
+
+
+def test_main_window_profiling_off(qapp):
+    from smrtclk.views.main_window import ClockMainWindow
+
+    window = ClockMainWindow(Config())
+    assert window.profiler is None
+    window.clock_controller.stop()
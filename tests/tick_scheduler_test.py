@@ -0,0 +1,119 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from PyQt5.QtWidgets import QWidget
+
+from config.constants import (
+    CLOCK_IDLE_UPDATE_INTERVAL,
+    CLOCK_TICK_SLACK,
+    CLOCK_UPDATE_INTERVAL,
+)
+from config.settings import Config
+from smrtclk.controllers.clock_controller import ClockController
+from smrtclk.controllers.tick_scheduler import TickScheduler
+from smrtclk.models.clock_model import ClockModel
+from smrtclk.views.clock_widget import ClockWidget
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(1000.25)
+
+
+@pytest.fixture
+def scheduler(qapp, clock):
+    scheduler = TickScheduler(clock=clock)
+    yield scheduler
+    scheduler.stop()
+
+
+def test_arms_to_next_second(scheduler):
+    scheduler.start()
+    assert scheduler.isActive()
+    assert scheduler._timer.interval() == 750 + CLOCK_TICK_SLACK
+
+
+def test_arms_to_next_minute(scheduler, clock):
+    clock.now = 1020.5  # 17 minutes and 0.5 seconds past the epoch
+    scheduler.setInterval(CLOCK_IDLE_UPDATE_INTERVAL)
+    scheduler.start()
+    assert scheduler._timer.interval() == 59500 + CLOCK_TICK_SLACK
+
+
+def test_tick_records_jitter(scheduler, clock):
+    ticks = []
+    scheduler.tick.connect(lambda: ticks.append(clock.now))
+    scheduler.start()
+
+    clock.now = 1001.012
+    scheduler._onTimeout()
+    assert ticks == [1001.012]
+    stats = scheduler.jitterStats()
+    assert stats["count"] == 1
+    assert stats["last"] == pytest.approx(12.0)
+    # Re-armed to the following boundary, not a fixed interval later
+    assert scheduler._timer.interval() == 988 + CLOCK_TICK_SLACK
+
+
+def test_early_wakeup_does_not_tick(scheduler, clock):
+    ticks = []
+    scheduler.tick.connect(lambda: ticks.append(clock.now))
+    scheduler.start()
+
+    clock.now = 1000.998
+    scheduler._onTimeout()
+    assert ticks == []
+    assert scheduler.jitterStats()["count"] == 0
+    assert scheduler._timer.interval() == 2 + CLOCK_TICK_SLACK
+
+
+def test_backward_clock_step_realigns(scheduler, clock):
+    ticks = []
+    scheduler.tick.connect(lambda: ticks.append(clock.now))
+    scheduler.start()
+
+    # NTP stepped the clock back by a minute
+    clock.now = 940.4
+    scheduler._onTimeout()
+    assert ticks == [940.4]
+    assert scheduler.jitterStats()["count"] == 0
+    assert scheduler._timer.interval() == 600 + CLOCK_TICK_SLACK
+
+
+def test_stop(scheduler):
+    ticks = []
+    scheduler.tick.connect(lambda: ticks.append(True))
+    scheduler.start()
+    scheduler.stop()
+    assert not scheduler.isActive()
+    scheduler._onTimeout()
+    assert ticks == []
+
+
+@pytest.mark.parametrize("renderer", ["labels", "painter"])
+def test_controller_backs_off(qapp, renderer):
+    parent = QWidget()
+    view = ClockWidget(parent, Config(clock_renderer=renderer))
+    controller = ClockController(ClockModel(), view)
+    controller.start()
+    assert controller._timer.interval == CLOCK_UPDATE_INTERVAL
+
+    controller.setSecondHandVisible(False)
+    assert controller._timer.interval == CLOCK_IDLE_UPDATE_INTERVAL
+    controller.setIdle(True)
+    controller.setSecondHandVisible(True)
+    assert controller._timer.interval == CLOCK_IDLE_UPDATE_INTERVAL
+    controller.setIdle(False)
+    assert controller._timer.interval == CLOCK_UPDATE_INTERVAL
+    controller.stop()
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.weather_api_async import HostRateLimiter
+from smrtclk.weather.weather_api_nws import AsyncWeatherAPINWS
+
+LOCATIONS = [(40.0 + i / 10, -74.0) for i in range(12)]
+
+
+async def gather(locations, **kwargs):
+    async with AsyncWeatherAPINWS(**kwargs) as weather:
+        return await weather.gather_weather(locations)
+
+
+def test_gather_weather(stub):
+    results = asyncio.run(gather(LOCATIONS, rate_limit=None))
+
+    assert len(results) == len(LOCATIONS)
+    assert all(result["status"] == "ok" for result in results)
+    assert all(result["temperature"] == 72 for result in results)
+    # One points lookup per location plus one forecast each
+    assert stub.total_requests == 2 * len(LOCATIONS)
+
+
+def test_gather_runs_concurrently(stub):
+    stub.delay = 0.2
+    start = time.monotonic()
+    results = asyncio.run(gather(LOCATIONS, max_concurrency=6, rate_limit=None))
+    elapsed = time.monotonic() - start
+
+    assert all(result["status"] == "ok" for result in results)
+    # Sequential fetching would take 24 * 0.2 = 4.8 s
+    assert elapsed < 2.0
+    assert stub.max_active == 6
+
+
+def test_concurrency_limit(stub):
+    stub.delay = 0.05
+    asyncio.run(gather(LOCATIONS, max_concurrency=2, rate_limit=None))
+    assert stub.max_active == 2
+
+
+def test_location_lookup_shared(stub):
+    results = asyncio.run(gather([(40.7, -74.0)] * 5, rate_limit=None))
+    assert all(result["status"] == "ok" for result in results)
+    assert stub.requests["/points/40.7,-74.0"] == 1
+
+
+def test_reuse_across_event_loops(stub):
+    stub.delay = 0.01
+    weather = AsyncWeatherAPINWS(max_concurrency=1, rate_limit=None)
+    for _ in range(2):
+        results = asyncio.run(weather.gather_weather(LOCATIONS[:3]))
+        assert all(result["status"] == "ok" for result in results)
+    # Grid locations resolved in the first loop are reused in the second
+    assert stub.total_requests == 3 + 2 * 3
+    assert stub.max_active == 1
+    asyncio.run(weather.close())
+
+
+def test_error_per_location(stub, monkeypatch):
+    async def run():
+        async with AsyncWeatherAPINWS(rate_limit=None) as weather:
+            failed = await weather.gather_weather(LOCATIONS[:2])
+            # Failed lookups are not cached, so a later fetch retries them
+            monkeypatch.setattr(weather_api_nws, "BASE_API_URL", stub.base_url)
+            return failed, await weather.gather_weather(LOCATIONS[:2])
+
+    monkeypatch.setattr(weather_api_nws, "BASE_API_URL", stub.base_url + "missing/")
+    failed, retried = asyncio.run(run())
+    assert [result["status"] for result in failed] == ["error", "error"]
+    assert "HTTP 404" in failed[0]["error_message"]
+    assert [result["status"] for result in retried] == ["ok", "ok"]
+
+
+def test_invalid_location(stub):
+    with pytest.raises(ValueError):
+        asyncio.run(gather([(40.7, -74.0), (91, 0)]))
+    # Nothing was requested for the valid location either
+    assert stub.total_requests == 0
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        AsyncWeatherAPINWS(max_concurrency=0)
+    with pytest.raises(ValueError):
+        AsyncWeatherAPINWS(rate_limit=0)
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = HostRateLimiter(rate=20)
+
+    async def run(urls):
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(url) for url in urls))
+        return time.monotonic() - start
+
+    # Five requests to one host need four 50 ms intervals
+    assert asyncio.run(run(["http://a/x"] * 5)) >= 0.19
+    # Other hosts have their own slots
+    assert asyncio.run(run(["http://b/x", "http://c/x", "http://d/x"])) < 0.04
+
+
+def test_rate_limit_applies_to_gather(stub):
+    start = time.monotonic()
+    asyncio.run(gather(LOCATIONS[:3], rate_limit=50))
+    # Six requests to one host at 50/s take at least five 20 ms intervals
+    assert time.monotonic() - start >= 0.09
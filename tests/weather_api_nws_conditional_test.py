@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from nws_stub import forecast_payload
+
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.json_decoder import loads
+from smrtclk.weather.weather_api_nws import HTTPValidators, WeatherAPINWS
+
+
+@pytest.fixture
+def weather(stub, monkeypatch):
+    with WeatherAPINWS(latitude=40.7, longitude=-74.0) as weather:
+        weather.parse_count = 0
+        parse = weather._parse_fetched
+
+        def counting_parse(raw_data):
+            weather.parse_count += 1
+            return parse(raw_data)
+
+        monkeypatch.setattr(weather, "_parse_fetched", counting_parse)
+        yield weather
+
+
+def expire(weather):
+    weather._cache_timestamp -= weather._cache_duration + 1
+
+
+def test_validators_headers():
+    assert HTTPValidators().request_headers() == {}
+    validators = HTTPValidators()
+    validators.update({"ETag": '"a"', "Last-Modified": "yesterday"})
+    assert validators.request_headers() == {
+        "If-None-Match": '"a"',
+        "If-Modified-Since": "yesterday",
+    }
+
+
+def test_not_modified_renews_cache(stub, weather):
+    assert weather.get_current_weather()["status"] == "ok"
+    assert weather.parse_count == 1
+    expire(weather)
+    stale_timestamp = weather._cache_timestamp
+
+    result = weather.get_current_weather()
+    assert result["status"] == "cached"
+    assert result["temperature"] == 72
+    assert stub.not_modified == 1
+    # The cache was renewed without parsing again
+    assert weather.parse_count == 1
+    assert weather._cache_timestamp > stale_timestamp
+    assert weather._is_cache_valid()
+
+
+def test_changed_forecast_is_parsed(stub, weather):
+    weather.get_current_weather()
+    expire(weather)
+    stub.forecast_etag = '"forecast-v2"'
+
+    assert weather.get_current_weather()["status"] == "ok"
+    assert stub.not_modified == 0
+    assert weather.parse_count == 2
+
+    # The new validators are used for the following request
+    expire(weather)
+    assert weather.get_current_weather()["status"] == "cached"
+    assert stub.not_modified == 1
+
+
+def test_failed_decode_keeps_old_validators(stub):
+    fail = [False]
+
+    def decoder(body):
+        if fail[0]:
+            raise ValueError("Truncated forecast")
+        return loads(body)
+
+    with WeatherAPINWS(40.7, -74.0, forecast_decoder=decoder) as weather:
+        weather.get_current_weather()
+        expire(weather)
+        stub.forecast_etag = '"forecast-v2"'
+        fail[0] = True
+        assert weather.get_current_weather()["status"] == "error"
+
+        # The new forecast is downloaded again, not answered 304
+        fail[0] = False
+        assert weather.get_current_weather()["status"] == "ok"
+        assert stub.not_modified == 0
+
+
+def test_failed_parse_drops_validators(stub, weather, monkeypatch):
+    weather.get_current_weather()
+    expire(weather)
+    stub.forecast_etag = '"forecast-v2"'
+    summarize = weather_api_nws.summarize_forecast
+
+    def failing_summarize(*args):
+        raise KeyError("temperature")
+
+    monkeypatch.setattr(weather_api_nws, "summarize_forecast", failing_summarize)
+    assert weather.get_current_weather()["status"] == "error"
+
+    monkeypatch.setattr(weather_api_nws, "summarize_forecast", summarize)
+    assert weather.get_current_weather()["status"] == "ok"
+    assert stub.not_modified == 0
+
+
+def test_refresh_is_unconditional(stub, weather):
+    weather.get_current_weather()
+    weather.refresh()
+    assert stub.not_modified == 0
+    assert weather.parse_count == 2
+
+
+def later(monkeypatch, seconds):
+    """Move the clock the cached summary is checked against forward."""
+    real_time = time.time
+    clock = SimpleNamespace(time=lambda: real_time() + seconds)
+    monkeypatch.setattr(weather_api_nws, "time", clock)
+
+
+def test_cached_summary_follows_periods(stub, weather, monkeypatch):
+    first = weather.get_current_weather()
+    assert (first["temperature"], first["temperature_min"]) == (72, 55)
+    assert weather.get_current_weather() is weather.get_current_weather()
+
+    # An hour later the next period is current, without another fetch
+    later(monkeypatch, 3600 + 1)
+    result = weather.get_current_weather()
+    assert result["status"] == "cached"
+    assert result["temperature"] == 55
+    assert result["precipitation"] == 10
+    # The period that ended still counts toward the day's range
+    assert (result["temperature_min"], result["temperature_max"]) == (55, 72)
+    assert weather.get_current_weather() is result
+    assert weather.parse_count == 1
+
+    # A 304 keeps the summary current too
+    expire(weather)
+    assert weather.get_current_weather()["temperature"] == 55
+    assert stub.not_modified == 1
+
+
+def test_concurrent_parse_keeps_cached_periods(stub, weather, monkeypatch):
+    other = forecast_payload("2020-01-01T00:00:00+00:00")
+    for period in other["properties"]["periods"]:
+        period["temperature"] = 99
+    store = weather._store_cache
+
+    def store_after_other_parse(*args):
+        # Another fetch on this instance parses before this one is cached
+        weather._parse_fetched(other)
+        store(*args)
+
+    monkeypatch.setattr(weather, "_store_cache", store_after_other_parse)
+    assert weather.get_current_weather()["temperature"] == 72
+    assert weather._forecast_updated_at is None
+
+    # The cached periods are still the ones of the cached summary
+    later(monkeypatch, 3600 + 1)
+    assert weather.get_current_weather()["temperature"] == 55
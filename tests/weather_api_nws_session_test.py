@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from nws_stub import GRID_ID, GRID_X, GRID_Y
+
+from smrtclk.weather.weather_api_nws import WeatherAPINWS, get_json_requests_retry
+
+
+def test_session_reuses_connection(stub):
+    with WeatherAPINWS(latitude=40.7, longitude=-74.0) as weather:
+        result = weather.get_current_weather()
+        assert result["status"] == "ok"
+        assert result["temperature"] == 72
+        for _ in range(4):
+            weather.refresh()
+
+    assert weather._location_cache == f"{GRID_ID}/{GRID_X},{GRID_Y}"
+    # Refresh repeats the points lookup, but every request shares one connection
+    assert stub.total_requests == 10
+    assert stub.connections == 1
+
+
+def test_locations_share_pool(stub):
+    weather = WeatherAPINWS(latitude=40.7, longitude=-74.0, pool_size=1)
+    for latitude in (40.7, 40.8, 40.9):
+        weather.latitude = latitude
+        weather.get_current_weather()
+    weather.close()
+
+    assert stub.total_requests == 6
+    assert stub.connections == 1
+
+
+def test_without_session_opens_new_connections(stub):
+    url = f"{stub.base_url}points/40.7,-74.0"
+    for _ in range(3):
+        get_json_requests_retry(url)
+    assert stub.connections == 3
+
+
+def test_timeout_is_passed(stub, monkeypatch):
+    weather = WeatherAPINWS(latitude=40.7, longitude=-74.0, timeout=(1.0, 2.0))
+    timeouts = []
+    original_get = weather._session.get
+
+    def get(url, **kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return original_get(url, **kwargs)
+
+    monkeypatch.setattr(weather._session, "get", get)
+    weather.get_current_weather()
+    weather.close()
+    assert timeouts == [(1.0, 2.0), (1.0, 2.0)]
@@ -0,0 +1,182 @@
+import os
+import sys
+import threading
+import time
+from dataclasses import FrozenInstanceError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.single_flight import SingleFlight
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+
+THREADS = 64
+
+
+class CountingMock(WeatherAPIMock):
+    """Mock provider counting upstream fetches, which block until released."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+        self.fetches = 0
+        self.fail = False
+        self._count_lock = threading.Lock()
+
+    def _fetch_weather_data(self) -> dict:
+        with self._count_lock:
+            self.fetches += 1
+        assert self.release.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return super()._fetch_weather_data()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def run_concurrently(weather, call, threads=THREADS):
+    """Run call from many threads at once, releasing the fetch once all wait."""
+    results = [None] * threads
+    barrier = threading.Barrier(threads)
+    shared_before = weather._flights.shared
+
+    def worker(i):
+        barrier.wait()
+        results[i] = call()
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    weather.release.clear()
+    for worker_thread in workers:
+        worker_thread.start()
+    # Every caller but the one fetching joins the in-flight fetch
+    wait_until(lambda: weather._flights.shared - shared_before == threads - 1)
+    weather.release.set()
+    for worker_thread in workers:
+        worker_thread.join(timeout=5)
+    return results
+
+
+@pytest.fixture
+def weather():
+    return CountingMock(cache_duration=60)
+
+
+def test_one_fetch_per_expiry(weather):
+    for expiry in range(1, 6):
+        results = run_concurrently(weather, weather.get_current_weather)
+
+        assert weather.fetches == expiry
+        assert all(result["status"] == "ok" for result in results)
+        assert len({result["temperature"] for result in results}) == 1
+        # Subsequent callers are served from the cache
+        assert weather.get_current_weather()["status"] == "cached"
+        assert weather.fetches == expiry
+
+        weather._cache_timestamp -= 61
+
+
+def test_concurrent_refresh_coalesced(weather):
+    weather.release.set()
+    weather.get_current_weather()
+
+    run_concurrently(weather, weather.refresh, threads=16)
+    assert weather.fetches == 2
+    assert weather.get_current_weather()["status"] == "cached"
+
+
+def test_error_shared(weather):
+    weather.fail = True
+    results = run_concurrently(weather, weather.get_current_weather)
+
+    assert weather.fetches == 1
+    assert all(result["status"] == "error" for result in results)
+    # Errors are not cached, so the next caller fetches again
+    weather.get_current_weather()
+    assert weather.fetches == 2
+
+
+def test_results_are_shared_and_immutable(weather):
+    first, second = run_concurrently(weather, weather.get_current_weather, threads=2)
+    # Callers share one record, which nobody can change
+    assert first is second
+    with pytest.raises(FrozenInstanceError):
+        first.temperature = -100
+    # Cache hits share one record too
+    assert weather.get_current_weather() is weather.get_current_weather()
+
+
+def test_locations_not_coalesced():
+    first = CountingMock(latitude=10.0, cache_duration=60)
+    second = CountingMock(latitude=20.0, cache_duration=60)
+    first.release.set()
+    second.release.set()
+    threads = [
+        threading.Thread(target=api.get_current_weather) for api in (first, second)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert (first.fetches, second.fetches) == (1, 1)
+
+
+def test_shared_across_instances():
+    flights = SingleFlight()
+    apis = [CountingMock(cache_duration=60, single_flight=flights) for _ in range(4)]
+    for api in apis[1:]:
+        api.release = apis[0].release
+    callers = iter(apis * (THREADS // len(apis)))
+
+    results = run_concurrently(apis[0], lambda: next(callers).get_current_weather())
+    assert sum(api.fetches for api in apis) == 1
+    assert all(result["status"] == "ok" for result in results)
+    # Every instance cached the one fetched record
+    assert all(api.get_current_weather()["status"] == "cached" for api in apis)
+    assert sum(api.fetches for api in apis) == 1
+
+
+def test_single_flight():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(timeout=5)
+        return len(calls)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do("a", work)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: flights.shared == 7)
+    assert flights.in_flight("a")
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [1] * 8
+    assert (flights.calls, flights.shared) == (1, 7)
+    assert not flights.in_flight("a")
+    # A finished call is not reused
+    assert flights.do("a", work) == 2
+
+
+def test_single_flight_error():
+    flights = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        flights.do("a", fail)
+    assert not flights.in_flight("a")
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+
+
+class SlowMock(WeatherAPIMock):
+    """Mock provider whose fetch blocks until released."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+        self.release.set()
+        self.fetches = 0
+
+    def _fetch_weather_data(self) -> dict:
+        self.fetches += 1
+        assert self.release.wait(timeout=5)
+        return super()._fetch_weather_data()
+
+
+@pytest.fixture
+def weather():
+    weather = SlowMock(cache_duration=60)
+    weather.max_stale = 600
+    assert weather.get_current_weather()["status"] == "ok"
+    return weather
+
+
+def wait_for_refresh(weather):
+    weather._refresh_thread.join(timeout=5)
+    assert not weather._refresh_thread.is_alive()
+
+
+def test_disabled_by_default():
+    weather = SlowMock(cache_duration=60)
+    assert weather.max_stale is None
+    weather.get_current_weather()
+    weather._cache_timestamp -= 61
+    assert weather.get_current_weather()["status"] == "ok"
+    assert weather.fetches == 2
+
+
+def test_invalid_max_stale():
+    with pytest.raises(ValueError):
+        WeatherAPIMock().max_stale = -1
+
+
+def test_serves_stale_and_refreshes(weather):
+    refreshed = []
+    weather.add_refresh_listener(refreshed.append)
+    weather._cache_timestamp -= 61
+    weather.release.clear()
+
+    # Returns immediately even though the fetch is blocked
+    result = weather.get_current_weather()
+    assert result["status"] == "stale"
+    assert result["temperature"] == 72.0
+
+    # Further calls don't start another refresh
+    assert weather.get_current_weather()["status"] == "stale"
+    weather.release.set()
+    wait_for_refresh(weather)
+    assert weather.fetches == 2
+
+    assert [r["status"] for r in refreshed] == ["ok"]
+    assert weather.get_current_weather()["status"] == "cached"
+
+
+def test_max_staleness_is_bounded(weather):
+    weather._cache_timestamp -= 60 + 600 + 1
+    assert weather.get_current_weather()["status"] == "ok"
+    assert weather._refresh_thread is None
+    assert weather.fetches == 2
+
+
+def test_refresh_error_is_reported(weather, monkeypatch):
+    refreshed = []
+    weather.add_refresh_listener(refreshed.append)
+
+    def fail():
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(weather, "_fetch_weather_data", fail)
+    weather._cache_timestamp -= 61
+    assert weather.get_current_weather()["status"] == "stale"
+    wait_for_refresh(weather)
+
+    assert refreshed[0]["status"] == "error"
+    # The stale data is still served until it exceeds max_stale
+    assert weather.get_current_weather()["status"] == "stale"
+    wait_for_refresh(weather)
+
+    weather.remove_refresh_listener(refreshed.append)
+    assert len(refreshed) == 2
+
+
+def test_location_change_discards_refresh(weather):
+    weather._cache_timestamp -= 61
+    weather.release.clear()
+    weather.get_current_weather()
+    weather.latitude = 10.0
+    weather.release.set()
+    wait_for_refresh(weather)
+    assert weather._weather_cache is None
@@ -1,11 +1,13 @@
+import json
 import os
 import sys
+from dataclasses import FrozenInstanceError
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
 
-from smrtclk.weather.weather_api import WeatherAPI
+from smrtclk.weather.weather_api import WeatherAPI, WeatherData
 
 
 @pytest.mark.parametrize(
@@ -24,3 +26,32 @@ def test_init(latitude, longitude):
     weather = WeatherAPI(latitude=latitude, longitude=longitude)
     assert weather.latitude == latitude
     assert weather.longitude == longitude
+
+
+def test_weather_data_mapping():
+    data = WeatherData(status="ok", temperature=72.0, sunrise="06:30")
+    # Unset fields are absent, like keys missing from a dict
+    assert dict(data) == {"status": "ok", "temperature": 72.0, "sunrise": "06:30"}
+    assert data == {"status": "ok", "temperature": 72.0, "sunrise": "06:30"}
+    assert data["temperature"] == 72.0
+    assert data.get("sunset") is None
+    assert "sunset" not in data
+    assert len(data) == 3
+    with pytest.raises(KeyError):
+        data["sunset"]
+    with pytest.raises(KeyError):
+        data["unknown"]
+    with pytest.raises(FrozenInstanceError):
+        data.temperature = 0.0
+
+
+def test_weather_data_conversion():
+    data = WeatherData.from_mapping({"temperature": 72.0, "extra": 1})
+    assert data.to_dict() == {"temperature": 72.0}
+    assert WeatherData.from_mapping(data) is data
+    assert WeatherData.from_mapping(json.loads(json.dumps(data.to_dict()))) == data
+
+    cached = data.with_status("cached")
+    assert cached.status == "cached"
+    assert data.status is None
+    assert cached.with_status("cached") is cached
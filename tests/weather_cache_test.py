@@ -0,0 +1,167 @@
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+from smrtclk.weather.weather_api_nws import WeatherAPINWS
+from smrtclk.weather.weather_cache import (
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    cache_key,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryCacheBackend()
+    else:
+        backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    yield backend
+    backend.close()
+
+
+class CountingMock(WeatherAPIMock):
+    fetches = 0
+
+    def _fetch_weather_data(self) -> dict:
+        CountingMock.fetches += 1
+        return super()._fetch_weather_data()
+
+
+@pytest.fixture(autouse=True)
+def reset_counts():
+    CountingMock.fetches = 0
+
+
+def test_cache_key():
+    assert cache_key("nws", 40.71281, -74, "weather") == "nws:40.7128,-74.0000:weather"
+
+
+def test_backend_roundtrip(backend):
+    assert backend.get("a") is None
+    backend.set("a", {"x": 1}, ttl=60, stored_at=1000.0 + time.time())
+    entry = backend.get("a")
+    assert entry.value == {"x": 1}
+    assert entry.stored_at > time.time()
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_backend_ttl(backend):
+    backend.set("old", {"x": 1}, ttl=60, stored_at=time.time() - 61)
+    backend.set("new", {"x": 2}, ttl=60, stored_at=time.time() - 59)
+    assert backend.get("old") is None
+    assert backend.get("new").value == {"x": 2}
+
+
+def test_sqlite_survives_reopen(tmp_path):
+    path = tmp_path / "cache.db"
+    backend = SQLiteCacheBackend(path)
+    backend.set("a", {"x": [1, 2]}, ttl=60)
+    backend.close()
+    backend = SQLiteCacheBackend(path)
+    assert backend.get("a").value == {"x": [1, 2]}
+    backend.close()
+
+
+def test_cold_start_serves_persisted_data(backend):
+    first = CountingMock(latitude=40.0, longitude=-83.0, cache_backend=backend)
+    assert first.get_current_weather()["status"] == "ok"
+    assert CountingMock.fetches == 1
+
+    # A new instance (e.g. after a restart) needs no fetch
+    second = CountingMock(latitude=40.0, longitude=-83.0, cache_backend=backend)
+    result = second.get_current_weather()
+    assert result["status"] == "cached"
+    assert result["temperature"] == 72.0
+    assert CountingMock.fetches == 1
+
+    # Other locations and refreshes still fetch
+    CountingMock(latitude=41.0, longitude=-83.0, cache_backend=backend)
+    second.latitude = 41.0
+    second.get_current_weather()
+    assert CountingMock.fetches == 2
+    second.refresh()
+    assert CountingMock.fetches == 3
+
+
+def test_expired_persisted_data_is_refetched(backend):
+    first = CountingMock(
+        latitude=40.0, longitude=-83.0, cache_duration=60, cache_backend=backend
+    )
+    first.get_current_weather()
+    first._cache_timestamp -= 61
+    first._persist_cache()
+
+    second = CountingMock(
+        latitude=40.0, longitude=-83.0, cache_duration=60, cache_backend=backend
+    )
+    assert second.get_current_weather()["status"] == "ok"
+    assert CountingMock.fetches == 2
+
+
+def test_nws_cold_start(backend, stub):
+    with WeatherAPINWS(40.7, -74.0, cache_backend=backend) as weather:
+        weather.get_current_weather()
+    assert stub.total_requests == 2
+
+    # Within the cache duration a restart makes no requests at all
+    with WeatherAPINWS(40.7, -74.0, cache_backend=backend) as weather:
+        assert weather.get_current_weather()["status"] == "cached"
+        assert weather._location_cache is not None
+    assert stub.total_requests == 2
+
+    # Once expired, the persisted grid and validators allow a single 304
+    with WeatherAPINWS(40.7, -74.0, cache_duration=0, cache_backend=backend) as weather:
+        assert weather.get_current_weather()["status"] == "cached"
+    assert stub.total_requests == 3
+    assert stub.not_modified == 1
+
+
+def test_nws_offline_cold_start(backend, stub):
+    with WeatherAPINWS(40.7, -74.0, cache_backend=backend) as weather:
+        temperature = weather.get_current_weather()["temperature"]
+
+    # An expired entry is still better than an error when the fetch fails
+    stub.failures = [404, 404]
+    with WeatherAPINWS(40.7, -74.0, cache_duration=0, cache_backend=backend) as weather:
+        for _ in range(2):
+            result = weather.get_current_weather()
+            assert result["status"] == "offline"
+            assert result["temperature"] == temperature
+        # The persisted validators renew the restored data
+        assert weather.get_current_weather()["status"] == "cached"
+        # Once fetched, failures are reported again
+        stub.failures = [404]
+        assert weather.get_current_weather()["status"] == "error"
+
+
+def test_nws_persist_failure(stub):
+    class FailingBackend(MemoryCacheBackend):
+        def set(self, key, value, ttl, stored_at=None):
+            raise OSError("disk full")
+
+    with WeatherAPINWS(40.7, -74.0, cache_backend=FailingBackend()) as weather:
+        assert weather.get_current_weather()["status"] == "ok"
+        assert weather._location_cache is not None
+
+
+def test_nws_restored_forecast_summarized(backend, stub, monkeypatch):
+    with WeatherAPINWS(40.7, -74.0, cache_backend=backend) as weather:
+        assert weather.get_current_weather()["temperature"] == 72
+
+    # The persisted periods are summarized again an hour later
+    real_time = time.time
+    clock = SimpleNamespace(time=lambda: real_time() + 3601)
+    monkeypatch.setattr(weather_api_nws, "time", clock)
+    with WeatherAPINWS(40.7, -74.0, cache_backend=backend) as weather:
+        result = weather.get_current_weather()
+        assert (result["status"], result["temperature"]) == ("cached", 55)
+    assert stub.total_requests == 2
@@ -0,0 +1,148 @@
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from nws_stub import GRID_ID, GRID_X, GRID_Y
+from PyQt5.QtCore import QEventLoop, QTimer
+
+from smrtclk.models.weather_model import WeatherModel
+from smrtclk.weather import weather_api_nws
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+
+
+def wait_for(predicate, timeout_ms=5000):
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: predicate() and loop.quit())
+    poll.start(5)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    poll.stop()
+    return predicate()
+
+
+def test_fetch_updates_model(controller, stub):
+    updates = []
+    controller.model.weatherUpdated.connect(updates.append)
+
+    controller.fetchWeather()
+    assert controller.isFetching()
+    assert wait_for(lambda: updates)
+
+    data = controller.model.weather_data
+    assert updates == [data]
+    assert data.temperature == 72
+    assert data.temperature_min == 55
+    assert controller._api.location == f"{GRID_ID}/{GRID_X},{GRID_Y}"
+
+    # The resolved grid location skips the points lookup next time
+    controller.fetchWeather()
+    assert wait_for(lambda: len(updates) == 2)
+    assert stub.total_requests == 3
+
+
+def test_summary_follows_periods(controller, stub, monkeypatch):
+    controller.fetchWeather()
+    assert wait_for(lambda: controller.model.weather_data is not None)
+    # Summarized again when the next hourly period starts
+    assert 0 < controller._summary_timer.remainingTime() <= 3600 * 1000
+
+    real_time = time.time
+    clock = SimpleNamespace(time=lambda: real_time() + 3601)
+    monkeypatch.setattr(weather_api_nws, "time", clock)
+    controller._onSummaryDue()
+    data = controller.model.weather_data
+    assert (data.temperature, data.temperature_min, data.temperature_max) == (
+        55,
+        55,
+        72,
+    )
+    assert controller._summary_timer.isActive()
+    assert stub.total_requests == 2
+
+    controller.stop()
+    assert not controller._summary_timer.isActive()
+
+
+def test_event_loop_keeps_running(controller, stub):
+    stub.delay = 0.3
+    ticks = []
+    timer = QTimer()
+    timer.timeout.connect(lambda: ticks.append(time.monotonic()))
+    timer.start(20)
+
+    start = time.monotonic()
+    controller.fetchWeather()
+    assert time.monotonic() - start < 0.1
+    assert wait_for(lambda: controller.model.weather_data is not None)
+    timer.stop()
+
+    # The timer kept firing while both delayed requests were in flight
+    assert len(ticks) >= 10
+    gaps = [b - a for a, b in zip(ticks, ticks[1:], strict=False)]
+    assert max(gaps) < 0.2
+
+
+def test_fetch_skipped_while_in_flight(controller, stub):
+    stub.delay = 0.2
+    controller.fetchWeather()
+    controller.fetchWeather()
+    assert wait_for(lambda: controller.model.weather_data is not None)
+    assert stub.total_requests == 2
+
+
+def test_stop_cancels_fetch(controller, stub):
+    stub.delay = 0.2
+    updates = []
+    controller.model.weatherUpdated.connect(updates.append)
+
+    controller.fetchWeather()
+    controller.stop()
+    assert not controller.isFetching()
+
+    wait_for(lambda: False, timeout_ms=500)
+    assert updates == []
+    assert controller.model.weather_data is None
+
+
+def test_network_error_keeps_model(controller, monkeypatch):
+    monkeypatch.setattr(weather_api_nws, "BASE_API_URL", "http://127.0.0.1:9/")
+    controller.fetchWeather()
+    assert wait_for(lambda: not controller.isFetching())
+    assert controller.model.weather_data is None
+
+
+def test_model_rejects_invalid_response(qapp):
+    model = WeatherModel()
+    valid = {
+        "temperature": 72,
+        "temperature_min": 55,
+        "temperature_max": 72,
+        "precipitation": 10,
+        "precipitation_max": 40,
+        "sunrise": "06:30",
+        "sunset": "19:45",
+    }
+    assert model.validate_data(valid)
+    assert not model.validate_data({**valid, "status": "error"})
+    assert not model.validate_data({**valid, "sunset": None})
+    assert not model.validate_data({**valid, "sunrise": "dawn"})
+
+    model.update_from_api_response({**valid, "temperature": None})
+    assert model.weather_data is None
+
+    model.update_from_api_response(valid)
+    assert model.weather_data.precipitation == 10
+    assert model.sun_times()[1].hour == 19
+
+
+def test_model_shares_api_record(qapp):
+    model = WeatherModel()
+    assert model.sun_times() is None
+    record = WeatherAPIMock().get_current_weather()
+    model.update_from_api_response(record)
+    # The API's immutable record is stored without conversion
+    assert model.weather_data is record
@@ -0,0 +1,18 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from benchmarks.weather_proxy_bench import SCENARIOS, run_scenario
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_bench_scenario(scenario):
+    result = run_scenario(scenario, clients=10, requests=3, latency=0.01)
+    expected_upstream = 10 if scenario == "direct" else 1
+    assert result["burst"]["upstream_calls"] == expected_upstream
+    assert result["warm"]["upstream_calls"] == 0
+    assert result["warm"]["polls"] == 30
+    assert result["warm"]["polls_per_sec"] > 0
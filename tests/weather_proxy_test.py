@@ -0,0 +1,212 @@
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from smrtclk.weather.circuit_breaker import CircuitBreaker
+from smrtclk.weather.weather_api_mock import WeatherAPIMock
+from smrtclk.weather.weather_api_proxy import WeatherAPIProxy
+from smrtclk.weather.weather_cache import MemoryCacheBackend
+from smrtclk.weather.weather_proxy import (
+    UnixWeatherProxyServer,
+    WeatherProxy,
+    WeatherProxyServer,
+)
+
+
+class FailingMock(WeatherAPIMock):
+    def _fetch_weather_data(self) -> dict:
+        raise RuntimeError("upstream down")
+
+
+@pytest.fixture
+def upstreams():
+    return []
+
+
+@pytest.fixture
+def proxy(upstreams):
+    def factory(latitude, longitude):
+        api = WeatherAPIMock(latitude, longitude, cache_duration=60)
+        upstreams.append(api)
+        return api
+
+    proxy = WeatherProxy(factory)
+    yield proxy
+    proxy.close()
+
+
+def serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server(request, proxy, tmp_path):
+    if request.param == "unix":
+        server = UnixWeatherProxyServer(proxy, str(tmp_path / "weather.sock"))
+    else:
+        server = WeatherProxyServer(proxy, ("127.0.0.1", 0))
+    yield serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+def test_clients_share_upstream(server, proxy, upstreams):
+    clients = [
+        WeatherAPIProxy(40.7, -74.0, server.url, cache_duration=0) for _ in range(20)
+    ]
+    results = [client.get_current_weather() for client in clients]
+    for client in clients:
+        client.close()
+
+    assert all(result["status"] == "ok" for result in results)
+    assert all(result["temperature"] == 72.0 for result in results)
+    # One upstream API, fetched once, answered every client
+    assert len(upstreams) == 1
+    assert proxy.requests == 20
+
+
+def test_client_reuses_connection(server):
+    with WeatherAPIProxy(40.7, -74.0, server.url, cache_duration=0) as client:
+        client.get_current_weather()
+        connection = client._connection
+        assert client.get_current_weather()["status"] == "ok"
+        assert client._connection is connection
+
+
+def test_client_reconnects(server):
+    with WeatherAPIProxy(40.7, -74.0, server.url, cache_duration=0) as client:
+        client.get_current_weather()
+        # Simulate the proxy dropping the idle keep-alive connection
+        client._connection.sock.close()
+        assert client.get_current_weather()["status"] == "ok"
+
+
+def test_client_caches_locally(server, proxy):
+    with WeatherAPIProxy(40.7, -74.0, server.url, cache_duration=60) as client:
+        assert client.get_current_weather()["status"] == "ok"
+        assert client.get_current_weather()["status"] == "cached"
+    assert proxy.requests == 1
+
+
+def test_locations_rounded(proxy, upstreams):
+    proxy.get_weather(40.71281, -74.0)
+    proxy.get_weather(40.71279, -74.0)
+    proxy.get_weather(41.0, -74.0)
+    assert len(upstreams) == 2
+
+
+@pytest.mark.parametrize("latitude", [float("nan"), float("inf"), 91.0])
+def test_invalid_location_rejected(proxy, upstreams, latitude):
+    with pytest.raises(ValueError):
+        proxy.get_weather(latitude, -74.0)
+    assert upstreams == []
+
+
+def test_locations_bounded(upstreams):
+    def factory(latitude, longitude):
+        api = WeatherAPIMock(latitude, longitude, cache_duration=60)
+        upstreams.append(api)
+        return api
+
+    proxy = WeatherProxy(factory, max_locations=2)
+    proxy.get_weather(40.0, -74.0)
+    proxy.get_weather(41.0, -74.0)
+    # Using the first location keeps it over the second
+    proxy.get_weather(40.0, -74.0)
+    proxy.get_weather(42.0, -74.0)
+    assert len(proxy._apis) == 2
+    assert list(proxy._apis) == [(40.0, -74.0), (42.0, -74.0)]
+    proxy.get_weather(41.0, -74.0)
+    assert len(upstreams) == 4
+    proxy.close()
+
+
+def test_upstream_error():
+    proxy = WeatherProxy(lambda lat, lon: FailingMock(lat, lon))
+    server = serve(WeatherProxyServer(proxy, ("127.0.0.1", 0)))
+    try:
+        with WeatherAPIProxy(40.7, -74.0, server.url) as client:
+            result = client.get_current_weather()
+        assert result["status"] == "error"
+        assert "upstream down" in result["error_message"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_upstream_offline_not_cached():
+    breaker = CircuitBreaker(failure_threshold=1)
+    upstream = FailingMock(40.7, -74.0, cache_duration=60, circuit_breaker=breaker)
+    # The upstream holds expired data and its circuit is open
+    sunny = upstream.parse_weather_data({"scenario": "sunny"})
+    upstream._store_cache(sunny, time.time() - 120)
+    breaker.record_failure()
+    proxy = WeatherProxy(lambda lat, lon: upstream)
+    server = serve(WeatherProxyServer(proxy, ("127.0.0.1", 0)))
+    backend = MemoryCacheBackend()
+    try:
+        with WeatherAPIProxy(40.7, -74.0, server.url, cache_backend=backend) as client:
+            result = client.get_current_weather()
+            assert result["status"] == "offline"
+            assert result["temperature"] == 72.0
+            # Neither cached nor persisted as fresh, so the proxy is asked again
+            assert client.get_current_weather()["status"] == "offline"
+            assert backend.get(client._cache_key("weather")) is None
+        assert proxy.requests == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+        proxy.close()
+
+
+def test_proxy_unreachable(tmp_path):
+    url = f"unix://{tmp_path / 'missing.sock'}"
+    with WeatherAPIProxy(40.7, -74.0, url) as client:
+        assert client.get_current_weather()["status"] == "error"
+
+
+@pytest.mark.parametrize(
+    "path, status",
+    [
+        ("/health", 200),
+        ("/weather?lat=40.7&lon=-74.0", 200),
+        ("/weather?lat=40.7", 400),
+        ("/weather?lat=north&lon=-74.0", 400),
+        ("/weather?lat=91&lon=-74.0", 400),
+        ("/forecast", 404),
+    ],
+)
+def test_endpoints(proxy, path, status):
+    server = serve(WeatherProxyServer(proxy, ("127.0.0.1", 0)))
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request("GET", path)
+        response = connection.getresponse()
+        assert response.status == status
+        assert "status" in json.loads(response.read())
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_invalid_url():
+    with pytest.raises(ValueError):
+        WeatherAPIProxy(40.7, -74.0, "ftp://example.com")
+
+
+def test_unix_socket_removed(proxy, tmp_path):
+    path = tmp_path / "weather.sock"
+    path.write_text("stale")
+    server = UnixWeatherProxyServer(proxy, str(path))
+    assert server.url == f"unix://{path}"
+    server.server_close()
+    assert not path.exists()